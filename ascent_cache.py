@@ -0,0 +1,314 @@
+########################################################################
+# Purdue Orbital, Flight Dynamics
+#
+# Project Name: Ascent / Descent Modeling
+#
+# Script Name: Ascent Cache
+# File Name: ascent_cache.py
+#
+# Contributors: Purdue Orbital Flight Dynamics Team
+# Date Created: 10/18/2026
+# Last Updated: 10/18/2026
+#
+# Script Description:
+#   Memoizing cache in front of ascent_solver_f. Results are kept in a
+#   bounded in-memory LRU and, optionally, in an SQLite file that survives
+#   restarts.
+#
+#   The script:
+#     - Quantizes the inputs (altitudes to ALTITUDE_QUANTUM_M, rate to
+#       RATE_QUANTUM_MPS, payload mass to MASS_QUANTUM_KG) and solves at the
+#       quantized values, so a cached answer does not depend on which caller
+#       filled it
+#     - Keys every entry with a hash of the model constants (CONSTANT_MASS,
+#       TIME_STEP, solver limits and tolerances, rk45 tolerances, quasi-steady
+#       grid, drag coefficient, correction masses, gravity and gas constants,
+#       atmosphere source), taken when the cache is constructed, so changing
+#       the model never returns stale results
+#     - Counts memory hits, disk hits and misses
+#
+# Notes:
+#   - Validation errors and unattainable targets are cached like any other
+#     result; exceptions are not. Non-finite inputs cannot be quantized, so
+#     their status summary is returned without being cached.
+#   - Every call returns a fresh copy of the summary, so callers may modify
+#     it without touching the cache.
+#   - A lock serializes access, so one cache may be shared between threads.
+#
+# References:
+#   None
+#
+# Input Parameters:
+#   - max_entries: in-memory LRU capacity, entries
+#   - path: SQLite database file, or None for memory only
+#   - atmosphere_table: optional AtmosphereTable passed to every solve
+#
+# Output:
+#   - ascent_solver_f summary dictionaries
+#
+########################################################################
+
+from __future__ import annotations
+
+import hashlib
+import json
+import math
+import sqlite3
+import threading
+from collections import OrderedDict
+
+import ascent_simulation
+from ascent_simulation import CONSTANT_MASS, SOLVER_METHOD, ascent_solver_f
+from modules import integrate_vertical_motion_f
+from modules.atmosphere_f import AtmosphereTable
+from modules.model_constants_f import model_constants_f
+
+
+# --------------------------- CONSTANTS --------------------------------
+ALTITUDE_QUANTUM_M = 0.01       # altitude key resolution, m
+RATE_QUANTUM_MPS = 1e-6         # target rate key resolution, m/s
+MASS_QUANTUM_KG = 1e-6          # payload mass key resolution, kg
+DEFAULT_MAX_ENTRIES = 4096      # in-memory LRU capacity
+# ---------------------------------------------------------------------
+
+
+def model_hash_f(atmosphere_table: AtmosphereTable | None = None) -> str:
+    """
+    Return a short hash of every model constant that affects a solve.
+
+    The physical constants come from modules.model_constants_f (also
+    stored in trajectory archives and solution surfaces); solver, rk45
+    tolerance and quasi-steady constants are read from ascent_simulation
+    and integrate_vertical_motion_f when the hash is computed.
+    AscentSolverCache computes it once, when the cache is constructed:
+    constants changed afterwards need a new cache.
+    """
+    constants = {
+        **model_constants_f(atmosphere_table),
+        "constant_mass": ascent_simulation.CONSTANT_MASS,
+        "time_step": ascent_simulation.TIME_STEP,
+        "max_helium_mass": ascent_simulation.MAX_HELIUM_MASS,
+        "max_iterations": ascent_simulation.MAX_BINARY_ITERATIONS,
+        "rate_tolerance": ascent_simulation.RATE_TOLERANCE,
+        "mass_tolerance": ascent_simulation.MASS_TOLERANCE,
+        "rk45_rtol": integrate_vertical_motion_f.DEFAULT_RTOL,
+        "rk45_atol_position": integrate_vertical_motion_f.DEFAULT_ATOL_POSITION_M,
+        "rk45_atol_velocity": integrate_vertical_motion_f.DEFAULT_ATOL_VELOCITY_MPS,
+        "quasi_steady_points": ascent_simulation.QUASI_STEADY_POINTS,
+        "quasi_steady_masses": ascent_simulation.QUASI_STEADY_MASSES,
+        "quasi_steady_bracket": ascent_simulation.QUASI_STEADY_BRACKET,
+    }
+    encoded = json.dumps(constants, sort_keys=True).encode()
+    return hashlib.sha256(encoded).hexdigest()[:16]
+
+
+def _copy_summary(summary: dict) -> dict:
+    """Copy a summary two levels deep (sections and the flight dict)."""
+    copied = {}
+    for section, contents in summary.items():
+        if isinstance(contents, dict):
+            contents = {
+                key: dict(value) if isinstance(value, dict) else value
+                for key, value in contents.items()
+            }
+        copied[section] = contents
+    return copied
+
+
+class AscentSolverCache:
+    """
+    Memoizing ascent_solver_f front end with an LRU and optional SQLite store.
+
+    Use as a context manager, or call close(), to release the database.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        path: str | None = None,
+        atmosphere_table: AtmosphereTable | None = None,
+    ) -> None:
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+
+        self.max_entries = int(max_entries)
+        self.path = path
+        self.atmosphere_table = atmosphere_table
+        self.model_hash = model_hash_f(atmosphere_table)
+
+        self._entries: OrderedDict[str, dict] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._disk_hits = 0
+        self._misses = 0
+
+        self._connection = None
+        if path is not None:
+            self._connection = sqlite3.connect(path, check_same_thread=False)
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS ascent_solutions ("
+                "key TEXT PRIMARY KEY, model TEXT NOT NULL, summary TEXT NOT NULL)"
+            )
+            self._connection.commit()
+
+    def __enter__(self) -> AscentSolverCache:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close the SQLite store (the in-memory entries stay usable)."""
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+    def _key(
+        self,
+        start_altitude: float,
+        burst_altitude: float,
+        target_rate: float,
+        constant_mass: float,
+        options: tuple,
+    ) -> tuple[str, tuple[float, float, float, float]]:
+        """Return the cache key and the quantized inputs it stands for."""
+        steps = (
+            round(start_altitude / ALTITUDE_QUANTUM_M),
+            round(burst_altitude / ALTITUDE_QUANTUM_M),
+            round(target_rate / RATE_QUANTUM_MPS),
+            round(constant_mass / MASS_QUANTUM_KG),
+        )
+        # round() drops the representation noise of step * quantum
+        quantized = (
+            round(steps[0] * ALTITUDE_QUANTUM_M, 9),
+            round(steps[1] * ALTITUDE_QUANTUM_M, 9),
+            round(steps[2] * RATE_QUANTUM_MPS, 9),
+            round(steps[3] * MASS_QUANTUM_KG, 9),
+        )
+        key = "|".join([self.model_hash, *map(str, steps), *map(str, options)])
+        return key, quantized
+
+    def _remember(self, key: str, summary: dict) -> None:
+        """Insert into the LRU, evicting the least recently used entry."""
+        self._entries[key] = summary
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def solve(
+        self,
+        start_altitude: float,
+        burst_altitude: float,
+        target_rate: float,
+        constant_mass: float = CONSTANT_MASS,
+        method: str = SOLVER_METHOD,
+        integrator: str = "euler",
+        quasi_steady_bracket: bool = False,
+        flight_summary: bool = False,
+    ) -> dict:
+        """
+        Return the ascent_solver_f summary for the (quantized) inputs.
+
+        Input:
+        - start_altitude, burst_altitude, target_rate, constant_mass:
+          as ascent_solver_f
+        - method, integrator, quasi_steady_bracket, flight_summary:
+          ascent_solver_f options (part of the key)
+
+        Output:
+        - ascent_solver_f summary dictionary (a fresh copy); non-finite
+          inputs return its status summary uncached
+        """
+        if not all(math.isfinite(value) for value in (start_altitude, burst_altitude, target_rate, constant_mass)):
+            # ascent_solver_f rejects these before simulating; nothing to key or store
+            with self._lock:
+                self._misses += 1
+            return ascent_solver_f(
+                start_altitude,
+                burst_altitude,
+                target_rate,
+                atmosphere_table=self.atmosphere_table,
+                method=method,
+                integrator=integrator,
+                quasi_steady_bracket=quasi_steady_bracket,
+                flight_summary=flight_summary,
+                constant_mass=constant_mass,
+            )
+
+        options = (method, integrator, bool(quasi_steady_bracket), bool(flight_summary))
+        key, quantized = self._key(start_altitude, burst_altitude, target_rate, constant_mass, options)
+
+        with self._lock:
+            summary = self._entries.get(key)
+            if summary is not None:
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return _copy_summary(summary)
+
+            if self._connection is not None:
+                row = self._connection.execute(
+                    "SELECT summary FROM ascent_solutions WHERE key = ?", (key,),
+                ).fetchone()
+                if row is not None:
+                    summary = json.loads(row[0])
+                    self._remember(key, summary)
+                    self._disk_hits += 1
+                    return _copy_summary(summary)
+
+            self._misses += 1
+
+        # Solve outside the lock so other threads' hits are not blocked
+        summary = ascent_solver_f(
+            quantized[0],
+            quantized[1],
+            quantized[2],
+            atmosphere_table=self.atmosphere_table,
+            method=method,
+            integrator=integrator,
+            quasi_steady_bracket=quasi_steady_bracket,
+            flight_summary=flight_summary,
+            constant_mass=quantized[3],
+        )
+
+        with self._lock:
+            self._remember(key, summary)
+            if self._connection is not None:
+                self._connection.execute(
+                    "INSERT OR REPLACE INTO ascent_solutions (key, model, summary) VALUES (?, ?, ?)",
+                    (key, self.model_hash, json.dumps(summary)),
+                )
+                self._connection.commit()
+
+        return _copy_summary(summary)
+
+    def stats(self) -> dict:
+        """
+        Return hit/miss statistics.
+
+        Output (dict):
+        - hits: in-memory hits
+        - disk_hits: SQLite hits (then promoted to memory)
+        - misses: full solves
+        - hit_rate: (hits + disk_hits) / lookups (nan before any lookup)
+        - entries: entries held in memory
+        - max_entries: in-memory capacity
+        """
+        with self._lock:
+            lookups = self._hits + self._disk_hits + self._misses
+            return {
+                "hits": self._hits,
+                "disk_hits": self._disk_hits,
+                "misses": self._misses,
+                "hit_rate": (self._hits + self._disk_hits) / lookups if lookups else float("nan"),
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+            }
+
+    def clear(self, persistent: bool = False) -> None:
+        """Drop the in-memory entries (and the SQLite rows if persistent)."""
+        with self._lock:
+            self._entries.clear()
+            if persistent and self._connection is not None:
+                self._connection.execute("DELETE FROM ascent_solutions")
+                self._connection.commit()
@@ -8,7 +8,7 @@
 #
 # Contributors: Purdue Orbital Flight Dynamics Team
 # Date Created: Unknown
-# Last Updated: 03/02/2026
+# Last Updated: 10/18/2026
 #
 # Script Description:
 #   Solves for the helium mass required to achieve a target mean ascent
@@ -17,8 +17,19 @@
 #
 #   The script:
 #     - Uses the 1976 Standard Atmosphere (modules.atmosphere_f)
-#     - Performs a binary search on helium mass
+#     - Searches helium mass with Brent, Illinois or bisection root finding
 #     - Optionally runs a full ascent simulation for verification
+#     - Integrates with fixed-step Euler or adaptive Dormand-Prince (rk45)
+#     - Offers a quasi-steady (terminal velocity) quadrature model for fast
+#       estimates and for bracketing the helium mass search
+#     - Can integrate a whole array of helium masses in lockstep
+#     - Offers a summary-only simulation with running (Welford) statistics
+#     - Optionally interpolates the atmosphere from a precomputed
+#       AtmosphereTable instead of evaluating the layer model every step
+#     - Runs the fixed-step march as a compiled kernel when Numba is
+#       installed (modules.march_kernels_f), else in Python
+#     - Optionally reports simulation, step and atmosphere counts and phase
+#       timings under "perf" (modules.perf_counters_f)
 #
 # References:
 #   None
@@ -37,23 +48,38 @@
 
 from __future__ import annotations
 
+import math
+
 import numpy as np
 
-from modules.atmosphere_f import atmosphere_m
+from modules import march_kernels_f, perf_counters_f
+from modules.ascent_forces_f import ascent_forces_f
+from modules.atmosphere_f import AtmosphereTable, atmosphere_m, offset_temperature
+from modules.balloon_density_f import GAS_CONSTANT, HELIUM_MOLAR_MASS
 from modules.buoyant_force_f import buoyant_force_f
-from modules.drag_force_f import drag_force_f
+from modules.drag_force_f import DRAG_COEFF_SPHERE
 from modules.gravity_force_f import gravity_force_f
 from modules.force_correction_f import force_correction_f
-from modules.simulate_ascent_motion_f import simulate_ascent_motion_f
+from modules.perf_counters_f import collect_perf_f, perf_phase_f
+from modules.simulate_ascent_adaptive_f import simulate_ascent_adaptive_f
+from modules.simulate_ascent_motion_f import INTEGRATORS, simulate_ascent_motion_f
 
 
 # --------------------------- CONSTANTS --------------------------------
 TIME_STEP = 0.1                 # simulation time step, s
 CONSTANT_MASS = 8.8             # fixed non-helium mass, kg
 MAX_HELIUM_MASS = 50.0          # helium search upper bound, kg
-MAX_BINARY_ITERATIONS = 80      # binary search iteration limit
+MAX_BINARY_ITERATIONS = 80      # helium mass search iteration limit
 RATE_DECIMALS = 5               # rate comparison precision
+RATE_TOLERANCE = 0.5 * 10.0 ** -RATE_DECIMALS  # root-finder rate tolerance, m/s
+MASS_TOLERANCE = 1e-6           # root-finder helium mass tolerance, kg
+SOLVER_METHODS = ("brent", "illinois", "bisection")
+SOLVER_METHOD = "brent"         # default helium mass search method
 MAX_ATMOSPHERE_ALTITUDE = 84_852.0  # USSA 1976 ceiling, m
+BATCH_SCALAR_LANES = 4          # lanes left when a batch finishes per lane
+QUASI_STEADY_POINTS = 257       # altitude quadrature nodes (odd, Simpson)
+QUASI_STEADY_MASSES = 256       # helium mass grid for the quasi-steady solve
+QUASI_STEADY_BRACKET = 0.005    # relative half-width of the refinement bracket
 # ---------------------------------------------------------------------
 
 
@@ -61,6 +87,7 @@ def validate_inputs_f(
     start_altitude: float,
     burst_altitude: float,
     target_rate: float,
+    constant_mass: float = CONSTANT_MASS,
 ) -> str | None:
     """
     Validate solver input parameters.
@@ -69,10 +96,14 @@ def validate_inputs_f(
     - start_altitude: starting altitude, m, >= 0
     - burst_altitude: burst altitude, m, > start_altitude
     - target_rate: desired ascent rate, m/s, > 0
+    - constant_mass: non-helium mass, kg, >= 0
 
     Output:
     - error message string if invalid, otherwise None
     """
+    if not all(math.isfinite(value) for value in (start_altitude, burst_altitude, target_rate, constant_mass)):
+        return "start_altitude, burst_altitude, target_rate and constant_mass must be finite"
+
     if start_altitude < 0.0:
         return "start_altitude must be non-negative"
 
@@ -82,22 +113,51 @@ def validate_inputs_f(
     if target_rate <= 0.0:
         return "target_rate must be positive"
 
+    if constant_mass < 0.0:
+        return "constant_mass must be non-negative"
+
     if burst_altitude > MAX_ATMOSPHERE_ALTITUDE:
         return "burst_altitude exceeds standard atmosphere ceiling"
 
     return None
 
 
-def atmosphere_at_altitude_f(altitude: float) -> dict:
+def validate_solver_options_f(method: str, integrator: str) -> str | None:
+    """
+    Validate the helium mass search options.
+
+    Input:
+    - method: one of SOLVER_METHODS
+    - integrator: one of INTEGRATORS
+
+    Output:
+    - error message string if invalid, otherwise None
+    """
+    if method not in SOLVER_METHODS:
+        return f"method must be one of {SOLVER_METHODS}"
+
+    if integrator not in INTEGRATORS:
+        return f"integrator must be one of {INTEGRATORS}"
+
+    return None
+
+
+def atmosphere_at_altitude_f(
+    altitude: float,
+    atmosphere_table: AtmosphereTable | None = None,
+) -> dict:
     """
     Return atmospheric properties at a given geometric altitude.
 
     Input:
     - altitude: geometric altitude, m, >= 0
+    - atmosphere_table: optional precomputed AtmosphereTable to interpolate from
 
     Output:
     - atmosphere dictionary (SI units)
     """
+    if atmosphere_table is not None:
+        return atmosphere_table.atmosphere_m(altitude, geometric=True)
     return atmosphere_m(altitude, geometric=True)
 
 
@@ -105,6 +165,9 @@ def simulate_ascent_rate_f(
     start_altitude: float,
     burst_altitude: float,
     helium_mass: float,
+    atmosphere_table: AtmosphereTable | None = None,
+    integrator: str = "euler",
+    constant_mass: float = CONSTANT_MASS,
 ) -> tuple[float, float, bool]:
     """
     Simulate ascent and compute mean ascent rate for a given helium mass.
@@ -113,102 +176,998 @@ def simulate_ascent_rate_f(
     - start_altitude: starting altitude, m
     - burst_altitude: burst altitude, m
     - helium_mass: helium mass, kg
+    - atmosphere_table: optional AtmosphereTable used instead of the exact
+      atmosphere model at every step
+    - integrator: "euler" (fixed TIME_STEP) or "rk45" (adaptive, stops
+      exactly at burst_altitude; mean rate is the time-averaged velocity);
+      anything else raises ValueError
+    - constant_mass: non-helium (payload) mass, kg
 
     Output:
     - mean_rate: mean ascent rate, m/s
     - gage_force: initial gage force estimate, N
     - failed: True if ascent fails due to non-positive net force
     """
-    total_mass = CONSTANT_MASS + helium_mass  # kg
+    if integrator not in INTEGRATORS:
+        raise ValueError(f"integrator must be one of {INTEGRATORS}")
+
+    if integrator == "rk45":
+        flight = simulate_ascent_adaptive_f(
+            helium_mass,
+            start_altitude,
+            burst_altitude,
+            constant_mass,
+            first_step_s=TIME_STEP,
+            record_history=False,
+            atmosphere_table=atmosphere_table,
+        )
+        if perf_counters_f.ACTIVE is not None:
+            perf_counters_f.ACTIVE.count_simulation(flight["steps"])
+        if flight["had_error"]:
+            return 0.0, flight["gage_force_N"], True
+        return flight["mean_ascent_rate_mps"], flight["gage_force_N"], False
+
+    total_mass = constant_mass + helium_mass  # kg
+
+    atmosphere_lookup = atmosphere_m if atmosphere_table is None else atmosphere_table.atmosphere_m
+
+    velocity_sum, step_count, gage_force, failed, _, _ = _march_ascent_f(
+        start_altitude,
+        0.0,
+        burst_altitude,
+        helium_mass,
+        total_mass,
+        atmosphere_lookup,
+    )
+    if perf_counters_f.ACTIVE is not None:
+        perf_counters_f.ACTIVE.count_simulation(step_count)
+
+    if failed or step_count == 0:
+        return 0.0, gage_force, True
+
+    mean_rate = float(velocity_sum / step_count)
+    return mean_rate, gage_force, False
+
+
+def _march_ascent_f(
+    altitude: float,
+    velocity: float,
+    burst_altitude: float,
+    helium_mass: float,
+    total_mass: float,
+    atmosphere_lookup,
+    accumulate: bool = False,
+) -> tuple:
+    """
+    Explicit-Euler ascent march for one lane from a given state to burst.
 
-    altitude = start_altitude                 # m
-    velocity = 0.0                            # m/s
+    Shared by simulate_ascent_rate_f, simulate_ascent_summary_f and the tail
+    of simulate_ascent_rate_batch_f so all three follow the same update.
 
-    velocity_history: list[float] = []
+    Output:
+    - velocity_sum: sum of post-step velocities, m/s
+    - step_count: number of completed steps
+    - gage_force: gage force at the first evaluated step, N (nan if none)
+    - failed: True if net force became non-positive
+    - velocity: velocity after the last completed step, m/s
+    - altitude: altitude after the last completed step, m
+    - statistics (only with accumulate=True): tuple of running mean rate
+      (m/s), Welford sum of squared deviations (m^2/s^2), max velocity
+      (m/s), altitude at max velocity (m), max acceleration (m/s^2) and
+      min net force (N), over post-step velocities
+    """
+    if march_kernels_f.USE_JIT and atmosphere_lookup is atmosphere_m:
+        march = march_kernels_f.ascent_march_kernel_f(
+            altitude, velocity, burst_altitude, helium_mass, total_mass, DRAG_COEFF_SPHERE, TIME_STEP,
+        )
+        if perf_counters_f.ACTIVE is not None:
+            # one inline atmosphere evaluation per step, plus the failing one
+            evaluations = march[1] + int(march[3])
+            perf_counters_f.ACTIVE.count("atmosphere_calls", evaluations)
+            perf_counters_f.ACTIVE.count("atmosphere_points", evaluations)
+        if accumulate:
+            return march[:6] + (march[6:],)
+        return march[:6]
+
+    velocity_sum = 0.0
     gage_force = float("nan")
 
+    mean_rate = 0.0
+    sum_squares = 0.0
+    max_velocity = 0.0
+    altitude_at_max_velocity = altitude
+    max_acceleration = float("-inf")
+    min_net_force = float("inf")
+
     step_index = 0
+    failed = False
 
     while altitude < burst_altitude:
-        atmosphere = atmosphere_at_altitude_f(altitude)
-
-        buoyant_force = buoyant_force_f(altitude, helium_mass, atm=atmosphere)  # N
-        drag_force = drag_force_f(velocity, helium_mass, altitude, atm=atmosphere)  # N
-        gravity_force = gravity_force_f(altitude, total_mass)  # N
-        correction_force = force_correction_f(helium_mass, altitude)  # N
+        atmosphere = atmosphere_lookup(altitude, geometric=True, output="state")
 
-        net_force = buoyant_force - drag_force - gravity_force  # N
+        buoyant_force, _, _, correction_force, net_force = ascent_forces_f(
+            altitude, velocity, helium_mass, total_mass, atm=atmosphere,
+        )  # N
 
         if step_index == 0:
             gage_force = buoyant_force - correction_force  # N
 
+        if accumulate and net_force < min_net_force:
+            min_net_force = net_force
+
         if net_force <= 0.0:
-            return 0.0, gage_force, True
+            failed = True
+            break
 
         acceleration = net_force / total_mass               # m/s^2
         velocity += acceleration * TIME_STEP                # m/s
         altitude += velocity * TIME_STEP                    # m
 
-        velocity_history.append(velocity)
+        velocity_sum += velocity
         step_index += 1
 
-    if len(velocity_history) == 0:
-        return 0.0, gage_force, True
+        if accumulate:
+            delta = velocity - mean_rate
+            mean_rate += delta / step_index
+            sum_squares += delta * (velocity - mean_rate)
 
-    mean_rate = float(np.mean(velocity_history))
-    return mean_rate, gage_force, False
+            if velocity > max_velocity:
+                max_velocity = velocity
+                altitude_at_max_velocity = altitude
+            if acceleration > max_acceleration:
+                max_acceleration = acceleration
 
+    march = (velocity_sum, step_index, gage_force, failed, velocity, altitude)
+    if accumulate:
+        return march + ((mean_rate, sum_squares, max_velocity, altitude_at_max_velocity, max_acceleration, min_net_force),)
+    return march
 
-def solve_helium_mass_f(
+
+def simulate_ascent_summary_f(
     start_altitude: float,
     burst_altitude: float,
-    target_rate: float,
-) -> tuple[float | None, float, float]:
+    helium_mass: float,
+    atmosphere_table: AtmosphereTable | None = None,
+    integrator: str = "euler",
+    constant_mass: float = CONSTANT_MASS,
+) -> dict:
     """
-    Solve for helium mass required to meet target ascent rate.
+    Simulate ascent keeping only running statistics (no histories).
+
+    The Euler path runs _march_ascent_f with its Welford accumulators (or the
+    compiled kernel), so memory use is independent of flight length; the
+    step statistics are over post-step velocities, as the mean rate of
+    simulate_ascent_rate_f. The rk45 path integrates without a history and
+    accumulates time-weighted statistics over the accepted states instead.
+
+    Input:
+    - start_altitude: starting altitude, m
+    - burst_altitude: burst altitude, m
+    - helium_mass: helium mass, kg
+    - atmosphere_table: optional AtmosphereTable to interpolate from
+    - integrator: "euler" (fixed TIME_STEP) or "rk45"; anything else
+      raises ValueError
+    - constant_mass: non-helium (payload) mass, kg
+
+    Output (dict):
+    - mean_rate: mean ascent rate, m/s
+    - rate_variance: (population) variance of the ascent rate, m^2/s^2
+    - max_velocity: largest velocity, m/s
+    - altitude_at_max_velocity: altitude where max_velocity occurs, m
+    - max_acceleration: largest acceleration, m/s^2
+    - time_to_burst: time to reach burst_altitude, s (nan if failed)
+    - min_net_force: smallest net force seen (lift margin), N
+    - gage_force: initial gage force, N
+    - steps: integration steps taken
+    - failed: True if ascent fails due to non-positive net force
+    """
+    if integrator not in INTEGRATORS:
+        raise ValueError(f"integrator must be one of {INTEGRATORS}")
+
+    total_mass = constant_mass + helium_mass  # kg
+    atmosphere_lookup = atmosphere_m if atmosphere_table is None else atmosphere_table.atmosphere_m
+
+    if integrator == "rk45":
+        # time-weighted (trapezoid) integrals of v and v^2 over the accepted
+        # states, plus running extrema; no history is kept
+        previous = None
+        velocity_integral = 0.0
+        square_integral = 0.0
+        max_velocity = float("-inf")
+        altitude_at_max_velocity = start_altitude
+        max_acceleration = float("-inf")
+        min_acceleration = float("inf")
+
+        def on_step_f(time, position, velocity, acceleration):
+            nonlocal previous, velocity_integral, square_integral
+            nonlocal max_velocity, altitude_at_max_velocity, max_acceleration, min_acceleration
+            if previous is not None:
+                previous_time, previous_velocity = previous
+                interval = time - previous_time
+                velocity_integral += 0.5 * (velocity + previous_velocity) * interval
+                square_integral += 0.5 * (velocity * velocity + previous_velocity * previous_velocity) * interval
+            previous = (time, velocity)
+
+            if velocity > max_velocity:
+                max_velocity = velocity
+                altitude_at_max_velocity = position
+            max_acceleration = max(max_acceleration, acceleration)
+            min_acceleration = min(min_acceleration, acceleration)
+
+        flight = simulate_ascent_adaptive_f(
+            helium_mass,
+            start_altitude,
+            burst_altitude,
+            constant_mass,
+            first_step_s=TIME_STEP,
+            record_history=False,
+            on_step_f=on_step_f,
+            atmosphere_table=atmosphere_table,
+        )
+        failed = flight["had_error"]
+        duration = previous[0] if previous is not None else 0.0  # integration starts at t = 0
+
+        if duration > 0.0:
+            mean_rate = flight["mean_ascent_rate_mps"]
+            # integral of (v - mean)^2 dt, expanded so it accumulates in one pass
+            deviation_integral = square_integral - 2.0 * mean_rate * velocity_integral + mean_rate * mean_rate * duration
+            rate_variance = max(deviation_integral / duration, 0.0)
+        else:
+            mean_rate, rate_variance = 0.0, 0.0
+        if perf_counters_f.ACTIVE is not None:
+            perf_counters_f.ACTIVE.count_simulation(flight["steps"])
+
+        return {
+            "mean_rate": 0.0 if failed else mean_rate,
+            "rate_variance": rate_variance,
+            "max_velocity": max_velocity,
+            "altitude_at_max_velocity": altitude_at_max_velocity,
+            "max_acceleration": max_acceleration,
+            "time_to_burst": flight["time_to_burst_s"],
+            "min_net_force": min_acceleration * total_mass,
+            "gage_force": flight["gage_force_N"],
+            "steps": flight["steps"],
+            "failed": failed,
+        }
+
+    _, step_count, gage_force, failed, _, _, statistics = _march_ascent_f(
+        start_altitude, 0.0, burst_altitude, helium_mass, total_mass, atmosphere_lookup, accumulate=True,
+    )
+    mean_rate, sum_squares, max_velocity, altitude_at_max_velocity, max_acceleration, min_net_force = statistics
+
+    failed = failed or step_count == 0
+    if perf_counters_f.ACTIVE is not None:
+        perf_counters_f.ACTIVE.count_simulation(step_count)
+
+    return {
+        "mean_rate": 0.0 if failed else mean_rate,
+        "rate_variance": sum_squares / step_count if step_count else 0.0,
+        "max_velocity": max_velocity,
+        "altitude_at_max_velocity": altitude_at_max_velocity,
+        "max_acceleration": max_acceleration if step_count else float("nan"),
+        "time_to_burst": float("nan") if failed else step_count * TIME_STEP,
+        "min_net_force": min_net_force,
+        "gage_force": gage_force,
+        "steps": step_count,
+        "failed": failed,
+    }
+
+
+def simulate_ascent_rate_batch_f(
+    start_altitude: float | np.ndarray,
+    burst_altitude: float | np.ndarray,
+    helium_mass: float | np.ndarray,
+    constant_mass: float | np.ndarray = CONSTANT_MASS,
+    atmosphere_table: AtmosphereTable | None = None,
+    burst_state: bool = False,
+) -> tuple:
+    """
+    Simulate many ascents in lockstep and compute each lane's mean ascent rate.
+
+    Every argument broadcasts to a common 1-D shape, one lane per element, so
+    a whole bracket of helium masses (optionally with per-lane payload masses
+    and start altitudes) is advanced together as NumPy arrays through the
+    vectorized atmosphere and ascent_forces_f. Each lane follows the same
+    explicit-Euler update as simulate_ascent_rate_f; lanes
+    that reach burst altitude or lose net lift drop out of the active set.
+    Once BATCH_SCALAR_LANES or fewer lanes remain, array overhead outweighs
+    the lockstep gain and the stragglers finish with the scalar march.
+
+    Input:
+    - start_altitude: starting altitude(s), m
+    - burst_altitude: burst altitude(s), m
+    - helium_mass: helium mass(es), kg
+    - constant_mass: non-helium (payload) mass(es), kg
+    - atmosphere_table: optional AtmosphereTable used instead of the exact
+      atmosphere model at every step
+    - burst_state: also return each lane's burst velocity, time and
+      altitude
 
     Output:
-    - helium_mass (or None if unattainable)
-    - achieved mean ascent rate, m/s
-    - initial gage force, N
+    - mean_rate: mean ascent rate per lane, m/s (0 for failed lanes)
+    - gage_force: initial gage force estimate per lane, N
+    - failed: True where the ascent fails due to non-positive net force
+    - burst_velocity: velocity after the last step, m/s (nan for failed
+      lanes), only when burst_state is True
+    - time_to_burst: steps * TIME_STEP, s (nan for failed lanes), only when
+      burst_state is True
+    - burst_altitude: altitude after the last step (at or just above the
+      burst altitude), m (nan for failed lanes), only when burst_state is
+      True
     """
-    max_rate, max_gage_force, failed = simulate_ascent_rate_f(
-        start_altitude,
-        burst_altitude,
-        MAX_HELIUM_MASS,
+    start, burst, helium, payload = np.broadcast_arrays(
+        *(np.atleast_1d(np.asarray(value, dtype=float)) for value in (
+            start_altitude, burst_altitude, helium_mass, constant_mass,
+        ))
     )
+    start = start.ravel()
+    burst = burst.ravel()
+    helium = helium.ravel()
+    total_mass = (payload + helium).ravel()  # kg
+
+    lane_count = start.size
+    altitude = start.copy()                   # m
+    velocity = np.zeros(lane_count)           # m/s
+    velocity_sum = np.zeros(lane_count)       # m/s
+    step_count = np.zeros(lane_count, dtype=np.int64)
+    gage_force = np.full(lane_count, np.nan)  # N
+    failed = np.zeros(lane_count, dtype=bool)
+
+    if atmosphere_table is None:
+        atmosphere_lookup = atmosphere_m
+    else:
+        atmosphere_lookup = atmosphere_table.atmosphere_m
+
+    active = np.flatnonzero(altitude < burst)
+    first_step = True
+
+    while active.size > BATCH_SCALAR_LANES:
+        lane_altitude = altitude[active]
+        lane_velocity = velocity[active]
+        lane_mass = total_mass[active]
+
+        atmosphere = atmosphere_lookup(lane_altitude, geometric=True, output="state")
+        buoyant_force, _, _, correction_force, net_force = ascent_forces_f(
+            lane_altitude,
+            lane_velocity,
+            helium[active],
+            lane_mass,
+            atm=atmosphere,
+        )  # N
+
+        if first_step:
+            gage_force[active] = buoyant_force - correction_force  # N
+            first_step = False
+
+        lifting = net_force > 0.0
+        failed[active[~lifting]] = True
+
+        acceleration = net_force / lane_mass                # m/s^2
+        lane_velocity = lane_velocity + acceleration * TIME_STEP  # m/s
+        lane_altitude = lane_altitude + lane_velocity * TIME_STEP  # m
+
+        active = active[lifting]
+        lane_velocity = lane_velocity[lifting]
+        lane_altitude = lane_altitude[lifting]
+
+        velocity[active] = lane_velocity
+        altitude[active] = lane_altitude
+        velocity_sum[active] += lane_velocity
+        step_count[active] += 1
+
+        active = active[lane_altitude < burst[active]]
+
+    for lane in active:
+        lane_sum, lane_steps, lane_gage_force, lane_failed, lane_velocity, lane_altitude = _march_ascent_f(
+            float(altitude[lane]),
+            float(velocity[lane]),
+            float(burst[lane]),
+            float(helium[lane]),
+            float(total_mass[lane]),
+            atmosphere_lookup,
+        )
+        if first_step:
+            gage_force[lane] = lane_gage_force
+        velocity_sum[lane] += lane_sum
+        step_count[lane] += lane_steps
+        failed[lane] = lane_failed
+        velocity[lane] = lane_velocity
+        altitude[lane] = lane_altitude
+
+    failed |= step_count == 0
+    if perf_counters_f.ACTIVE is not None:
+        perf_counters_f.ACTIVE.count("simulations", lane_count)
+        perf_counters_f.ACTIVE.count("integration_steps", int(step_count.sum()))
+    mean_rate = np.zeros(lane_count)
+    succeeded = ~failed
+    mean_rate[succeeded] = velocity_sum[succeeded] / step_count[succeeded]
+
+    if burst_state:
+        burst_velocity = np.where(succeeded, velocity, np.nan)          # m/s
+        time_to_burst = np.where(succeeded, step_count * TIME_STEP, np.nan)  # s
+        burst_altitude = np.where(succeeded, altitude, np.nan)          # m
+        return mean_rate, gage_force, failed, burst_velocity, time_to_burst, burst_altitude
+    return mean_rate, gage_force, failed
+
+
+def simulate_ascent_rate_quasi_steady_f(
+    start_altitude: float,
+    burst_altitude: float,
+    helium_mass: float | np.ndarray,
+    atmosphere_table: AtmosphereTable | None = None,
+    altitude_points: int = QUASI_STEADY_POINTS,
+    constant_mass: float | np.ndarray = CONSTANT_MASS,
+    drag_coefficient: float | np.ndarray = DRAG_COEFF_SPHERE,
+    temperature_offset: float | np.ndarray = 0.0,
+) -> tuple:
+    """
+    Estimate mean ascent rate assuming the balloon is always at terminal velocity.
 
-    if failed or max_rate < target_rate:
-        return None, max_rate, max_gage_force
+    At terminal velocity buoyancy minus gravity equals drag, so
+        v(h) = sqrt((F_b - F_g) / (0.5 * C_D * rho * A))
+    follows algebraically from the same force model (ascent_forces_f). The
+    time to burst is the Simpson quadrature of 1 / v(h) over altitude_points
+    altitudes, and the mean rate is (burst - start) / time. The short
+    acceleration phase after release and the Euler one-step overshoot are
+    ignored; quasi_steady_deviation_f reports the resulting difference.
+
+    helium_mass may be an array, in which case every mass is evaluated on the
+    same altitude grid in one vectorized pass. constant_mass,
+    drag_coefficient and temperature_offset may be arrays too; all four
+    broadcast to one lane per element (used for dispersion studies).
+
+    Input:
+    - start_altitude: starting altitude, m
+    - burst_altitude: burst altitude, m
+    - helium_mass: helium mass(es), kg
+    - atmosphere_table: optional AtmosphereTable to interpolate from
+    - altitude_points: quadrature nodes (rounded up to odd)
+    - constant_mass: non-helium (payload) mass(es), kg
+    - drag_coefficient: balloon drag coefficient(s), -
+    - temperature_offset: atmosphere temperature offset(s) at constant
+      pressure, K (see modules.atmosphere_f.offset_temperature)
+
+    Output:
+    - mean_rate: quasi-steady mean ascent rate, m/s (0 where failed)
+    - gage_force: initial gage force estimate, N
+    - failed: True where net lift is non-positive somewhere on the ascent
+    """
+    masses, payload, drag, offset = np.broadcast_arrays(*(
+        np.asarray(value, dtype=float)
+        for value in (helium_mass, constant_mass, drag_coefficient, temperature_offset)
+    ))
+    node_count = max(int(altitude_points), 3) | 1
+
+    altitude = np.linspace(start_altitude, burst_altitude, node_count)  # m
+    if atmosphere_table is None:
+        atmosphere = atmosphere_m(altitude, geometric=True, output="state")
+    else:
+        atmosphere = atmosphere_table.atmosphere_m(altitude, geometric=True, output="state")
+    if np.any(offset != 0.0):
+        atmosphere = offset_temperature(atmosphere, offset[..., None])
+
+    lane_mass = masses[..., None]
+    # At unit velocity the drag term equals 0.5 * C_D * rho * A
+    buoyant_force, drag_per_v2, gravity_force, correction_force, _ = ascent_forces_f(
+        altitude, 1.0, lane_mass, payload[..., None] + lane_mass, atm=atmosphere,
+        drag_coefficient=drag[..., None],
+    )  # N
+
+    lift = buoyant_force - gravity_force  # N
+    failed = np.any(lift <= 0.0, axis=-1) | (masses <= 0.0)
+    terminal_velocity = np.sqrt(np.where(lift > 0.0, lift, np.nan) / drag_per_v2)  # m/s
+
+    weights = np.ones(node_count)
+    weights[1:-1:2] = 4.0
+    weights[2:-1:2] = 2.0
+    spacing = (burst_altitude - start_altitude) / (node_count - 1)
+    time_to_burst = (spacing / 3.0) * np.sum(weights / terminal_velocity, axis=-1)  # s
+
+    with np.errstate(invalid="ignore"):
+        mean_rate = np.where(failed, 0.0, (burst_altitude - start_altitude) / time_to_burst)
+    gage_force = buoyant_force[..., 0] - correction_force[..., 0]
+
+    if masses.ndim == 0:
+        return float(mean_rate), float(gage_force), bool(failed)
+    return mean_rate, gage_force, failed
+
+
+def quasi_steady_deviation_f(
+    start_altitude: float,
+    burst_altitude: float,
+    helium_mass: float,
+    atmosphere_table: AtmosphereTable | None = None,
+    constant_mass: float = CONSTANT_MASS,
+) -> dict:
+    """
+    Compare the quasi-steady mean rate with the full Euler simulation.
+
+    Output (dict):
+    - quasi_steady_rate: simulate_ascent_rate_quasi_steady_f mean rate, m/s
+    - full_rate: simulate_ascent_rate_f mean rate, m/s
+    - deviation: quasi_steady_rate - full_rate, m/s
+    - relative_deviation: deviation / full_rate (nan if full_rate is 0)
+    - failed: True if either model fails
+    """
+    quasi_rate, _, quasi_failed = simulate_ascent_rate_quasi_steady_f(
+        start_altitude, burst_altitude, helium_mass, atmosphere_table, constant_mass=constant_mass,
+    )
+    full_rate, _, full_failed = simulate_ascent_rate_f(
+        start_altitude, burst_altitude, helium_mass, atmosphere_table, constant_mass=constant_mass,
+    )
+    deviation = quasi_rate - full_rate
+    return {
+        "quasi_steady_rate": quasi_rate,
+        "full_rate": full_rate,
+        "deviation": deviation,
+        "relative_deviation": deviation / full_rate if full_rate != 0.0 else float("nan"),
+        "failed": quasi_failed or full_failed,
+    }
 
+
+def quasi_steady_mass_f(
+    start_altitude: float,
+    burst_altitude: float,
+    target_rate: float,
+    atmosphere_table: AtmosphereTable | None = None,
+    constant_mass: float = CONSTANT_MASS,
+) -> float | None:
+    """
+    Estimate the helium mass for target_rate from the quasi-steady model alone.
+
+    Evaluates QUASI_STEADY_MASSES masses between the lift-off mass and
+    MAX_HELIUM_MASS in one vectorized call and interpolates rate^2 (close to
+    linear in mass) at target_rate^2. Returns None if the quasi-steady rate
+    at MAX_HELIUM_MASS is below target_rate.
+    """
+    lower_mass = min(lift_off_mass_f(start_altitude, atmosphere_table, constant_mass), MAX_HELIUM_MASS)
+    fractions = np.linspace(0.0, 1.0, QUASI_STEADY_MASSES) ** 2  # denser near lift-off
+    masses = lower_mass + (MAX_HELIUM_MASS - lower_mass) * fractions
+
+    rates, _, _ = simulate_ascent_rate_quasi_steady_f(
+        start_altitude, burst_altitude, masses, atmosphere_table, constant_mass=constant_mass,
+    )
+    if rates[-1] < target_rate:
+        return None
+
+    squared = np.maximum.accumulate(rates * rates)
+    return float(np.interp(target_rate * target_rate, squared, masses))
+
+
+def lift_off_mass_f(
+    start_altitude: float,
+    atmosphere_table: AtmosphereTable | None = None,
+    constant_mass: float = CONSTANT_MASS,
+) -> float:
+    """
+    Return the helium mass at which net lift at launch is exactly zero.
+
+    Buoyancy per kilogram of helium is (rho_air / rho_he) * g, so the balloon
+    leaves the ground only when m_he * (rho_air / rho_he - 1) > constant_mass.
+    Any helium mass at or below this value fails on the first step, which
+    gives the root-finding solvers a lower bracket without a simulation.
+
+    Input:
+    - start_altitude: starting altitude, m
+    - atmosphere_table: optional AtmosphereTable to interpolate from
+    - constant_mass: non-helium (payload) mass, kg
+
+    Output:
+    - lift-off helium mass, kg
+    """
+    atmosphere = atmosphere_at_altitude_f(start_altitude, atmosphere_table)
+    helium_density = (atmosphere["p_Pa"] * HELIUM_MOLAR_MASS) / (GAS_CONSTANT * atmosphere["T_K"])  # kg/m^3
+    density_ratio = atmosphere["rho_kgm3"] / helium_density
+    return constant_mass / (density_ratio - 1.0)
+
+
+def _bisection_search_f(
+    evaluate,
+    target_rate: float,
+) -> bool:
+    """
+    Legacy bisection on [0, MAX_HELIUM_MASS], keeping the upper (rate >= target) side.
+
+    Same stopping rule as the original search: stops only when the achieved
+    rate matches target_rate at RATE_DECIMALS, else after
+    MAX_BINARY_ITERATIONS halvings. Returns True if the rate matched.
+    """
     lower_mass = 0.0
     upper_mass = MAX_HELIUM_MASS
 
-    best_mass = upper_mass
-    best_rate = max_rate
-    best_gage_force = max_gage_force
-
     for _ in range(MAX_BINARY_ITERATIONS):
         test_mass = 0.5 * (lower_mass + upper_mass)
-        rate, gage_force, failed = simulate_ascent_rate_f(
-            start_altitude,
-            burst_altitude,
-            test_mass,
-        )
+        rate, _, failed = evaluate(test_mass)
 
         if failed or rate < target_rate:
             lower_mass = test_mass
-            continue
+        else:
+            upper_mass = test_mass
+            if round(rate, RATE_DECIMALS) == round(target_rate, RATE_DECIMALS):
+                return True
 
-        upper_mass = test_mass
-        best_mass = test_mass
-        best_rate = rate
-        best_gage_force = gage_force
+    return False
 
-        if round(best_rate, RATE_DECIMALS) == round(target_rate, RATE_DECIMALS):
-            break
 
-    return best_mass, best_rate, best_gage_force
+def _quasi_steady_bracket_f(
+    residual,
+    mass_estimate: float,
+    lower_limit: float,
+    target_rate: float,
+) -> tuple[float, float, float, float, bool]:
+    """
+    Bracket the full-simulation root around a quasi-steady mass estimate.
+
+    Starts from mass_estimate * (1 +/- QUASI_STEADY_BRACKET) and doubles the
+    half-width on whichever side fails to change sign, limited to
+    [lower_limit, MAX_HELIUM_MASS]. The lower limit is the lift-off mass and
+    is known to fail without a simulation.
+
+    Output:
+    - lower_mass, lower_residual, upper_mass, upper_residual, done
+      (done is True when an evaluated mass already met the rate tolerance)
+    """
+    known_lower_residual = -target_rate * target_rate
+    half_width = QUASI_STEADY_BRACKET * mass_estimate
+
+    def probe(mass: float) -> tuple[float, bool]:
+        if mass <= lower_limit:
+            return known_lower_residual, False
+        return residual(mass)
+
+    lower_mass = max(mass_estimate - half_width, lower_limit)
+    upper_mass = min(mass_estimate + half_width, MAX_HELIUM_MASS)
+
+    upper_residual, done = probe(upper_mass)
+    if done:
+        return lower_mass, known_lower_residual, upper_mass, upper_residual, True
+
+    while upper_residual < 0.0 and upper_mass < MAX_HELIUM_MASS:
+        lower_mass = upper_mass
+        half_width *= 2.0
+        upper_mass = min(mass_estimate + half_width, MAX_HELIUM_MASS)
+        upper_residual, done = probe(upper_mass)
+        if done:
+            return lower_mass, known_lower_residual, upper_mass, upper_residual, True
+
+    if upper_residual < 0.0:
+        return lower_mass, known_lower_residual, upper_mass, upper_residual, False
+
+    lower_residual, done = probe(lower_mass)
+    while not done and lower_residual > 0.0:
+        upper_mass, upper_residual = lower_mass, lower_residual
+        half_width *= 2.0
+        lower_mass = max(mass_estimate - half_width, lower_limit)
+        lower_residual, done = probe(lower_mass)
+
+    return lower_mass, lower_residual, upper_mass, upper_residual, done
+
+
+def _brent_search_f(
+    residual,
+    lower_mass: float,
+    lower_residual: float,
+    upper_mass: float,
+    upper_residual: float,
+    mass_tolerance: float,
+) -> bool:
+    """
+    Brent's method (inverse quadratic / secant steps safeguarded by bisection).
+
+    residual(mass) returns (residual, done); the search stops as soon as done
+    is True or the bracket is narrower than mass_tolerance. Returns True if
+    converged.
+    """
+    x_pre, f_pre = lower_mass, lower_residual
+    x_cur, f_cur = upper_mass, upper_residual
+    x_blk, f_blk = x_pre, f_pre
+    s_pre = s_cur = x_cur - x_pre
+
+    for _ in range(MAX_BINARY_ITERATIONS):
+        if f_pre != 0.0 and f_cur != 0.0 and (f_pre < 0.0) != (f_cur < 0.0):
+            x_blk, f_blk = x_pre, f_pre
+            s_pre = s_cur = x_cur - x_pre
+
+        if abs(f_blk) < abs(f_cur):
+            x_pre, x_cur, x_blk = x_cur, x_blk, x_cur
+            f_pre, f_cur, f_blk = f_cur, f_blk, f_cur
+
+        delta = 0.5 * mass_tolerance
+        s_bis = 0.5 * (x_blk - x_cur)
+        if f_cur == 0.0 or abs(s_bis) < delta:
+            return True
+
+        if abs(s_pre) > delta and abs(f_cur) < abs(f_pre):
+            if x_pre == x_blk:
+                # secant step
+                s_try = -f_cur * (x_cur - x_pre) / (f_cur - f_pre)
+            else:
+                # inverse quadratic interpolation
+                d_pre = (f_pre - f_cur) / (x_pre - x_cur)
+                d_blk = (f_blk - f_cur) / (x_blk - x_cur)
+                s_try = -f_cur * (f_blk * d_blk - f_pre * d_pre) / (d_blk * d_pre * (f_blk - f_pre))
+
+            if 2.0 * abs(s_try) < min(abs(s_pre), 3.0 * abs(s_bis) - delta):
+                s_pre, s_cur = s_cur, s_try
+            else:
+                s_pre = s_cur = s_bis
+        else:
+            s_pre = s_cur = s_bis
+
+        x_pre, f_pre = x_cur, f_cur
+        if abs(s_cur) > delta:
+            x_cur += s_cur
+        else:
+            x_cur += delta if s_bis > 0.0 else -delta
+
+        f_cur, done = residual(x_cur)
+        if done:
+            return True
+
+    return False
+
+
+def _illinois_search_f(
+    residual,
+    lower_mass: float,
+    lower_residual: float,
+    upper_mass: float,
+    upper_residual: float,
+    mass_tolerance: float,
+) -> bool:
+    """
+    Illinois (modified regula falsi) search on a sign-changing bracket.
+
+    residual(mass) returns (residual, done); the search stops as soon as done
+    is True or the bracket is narrower than mass_tolerance. Returns True if
+    converged.
+    """
+    a, f_a = lower_mass, lower_residual
+    b, f_b = upper_mass, upper_residual
+    side = 0
+
+    for _ in range(MAX_BINARY_ITERATIONS):
+        c = (f_a * b - f_b * a) / (f_a - f_b)
+        f_c, done = residual(c)
+        if done or f_c == 0.0:
+            return True
+
+        if (f_c < 0.0) == (f_b < 0.0):
+            b, f_b = c, f_c
+            if side == -1:
+                f_a *= 0.5
+            side = -1
+        else:
+            a, f_a = c, f_c
+            if side == 1:
+                f_b *= 0.5
+            side = 1
+
+        if abs(b - a) <= mass_tolerance:
+            return True
+
+    return False
+
+
+def solve_helium_mass_detailed_f(
+    start_altitude: float,
+    burst_altitude: float,
+    target_rate: float,
+    atmosphere_table: AtmosphereTable | None = None,
+    method: str = SOLVER_METHOD,
+    mass_tolerance: float = MASS_TOLERANCE,
+    rate_tolerance: float = RATE_TOLERANCE,
+    integrator: str = "euler",
+    quasi_steady_bracket: bool = False,
+    flight_summary: bool = False,
+    constant_mass: float = CONSTANT_MASS,
+    mass_estimate: float | None = None,
+) -> dict:
+    """
+    Solve for helium mass required to meet target ascent rate and report how.
+
+    Mean ascent rate increases monotonically with helium mass. "brent" and
+    "illinois" search the bracket between the lift-off mass (known to fail,
+    no simulation needed) and MAX_HELIUM_MASS on the residual
+    rate^2 - target^2, which is close to linear in mass because terminal
+    velocity scales with the square root of net lift. "bisection" is the
+    original fixed-halving search on [0, MAX_HELIUM_MASS] with its original
+    stopping rule (rate match at RATE_DECIMALS); mass_tolerance and
+    rate_tolerance apply to "brent" and "illinois" only.
+
+    With quasi_steady_bracket, "brent" and "illinois" first solve the cheap
+    quasi-steady model (quasi_steady_mass_f) and only run full simulations
+    to bracket and refine around that estimate, skipping the simulation at
+    MAX_HELIUM_MASS. A caller-supplied mass_estimate (for example from a
+    precomputed solution surface) is bracketed the same way and takes
+    precedence over the quasi-steady estimate.
+
+    With flight_summary, every simulation runs through
+    simulate_ascent_summary_f and the statistics of the returned mass are
+    reported under "flight", at no extra simulation cost.
+
+    Input:
+    - start_altitude, burst_altitude, target_rate: as solve_helium_mass_f
+    - atmosphere_table: optional AtmosphereTable to interpolate from
+    - method: one of SOLVER_METHODS
+    - mass_tolerance: stop once the mass bracket is narrower than this, kg
+    - rate_tolerance: stop once |rate - target_rate| is within this, m/s
+    - integrator: simulate_ascent_rate_f integrator, "euler" or "rk45"
+    - quasi_steady_bracket: bracket with the quasi-steady model first
+    - flight_summary: also report the flight statistics of the solution
+    - constant_mass: non-helium (payload) mass, kg
+    - mass_estimate: optional starting estimate of the helium mass, kg
+
+    Output (dict):
+    - helium_mass: kg (None if unattainable)
+    - achieved_rate: mean ascent rate at helium_mass, m/s
+    - gage_force: initial gage force at helium_mass, N
+    - method: solver method used
+    - simulations: number of full ascent simulations run
+    - converged: True if a tolerance was met within MAX_BINARY_ITERATIONS
+    - flight: simulate_ascent_summary_f dict at helium_mass (only with
+      flight_summary; None if unattainable)
+    """
+    error = validate_solver_options_f(method, integrator)
+    if error is not None:
+        raise ValueError(error)
+
+    simulations = 0
+    best = {"helium_mass": None, "achieved_rate": 0.0, "gage_force": float("nan")}
+    if flight_summary:
+        best["flight"] = None
+    evaluated: dict[float, tuple[float, float, bool]] = {}
+
+    def evaluate(mass: float) -> tuple[float, float, bool]:
+        nonlocal simulations
+        with perf_phase_f("simulations"):
+            if flight_summary:
+                flight = simulate_ascent_summary_f(
+                    start_altitude,
+                    burst_altitude,
+                    mass,
+                    atmosphere_table,
+                    integrator,
+                    constant_mass,
+                )
+                rate, gage_force, failed = flight["mean_rate"], flight["gage_force"], flight["failed"]
+            else:
+                rate, gage_force, failed = simulate_ascent_rate_f(
+                    start_altitude,
+                    burst_altitude,
+                    mass,
+                    atmosphere_table,
+                    integrator,
+                    constant_mass,
+                )
+        simulations += 1
+        evaluated[mass] = (rate, gage_force, failed)
+
+        if not failed:
+            # bisection keeps the smallest mass that reaches the target;
+            # the root finders keep the closest rate on either side
+            if method == "bisection":
+                better = rate >= target_rate and (best["helium_mass"] is None or mass < best["helium_mass"])
+            else:
+                better = best["helium_mass"] is None or abs(rate - target_rate) < abs(best["achieved_rate"] - target_rate)
+            if better:
+                best.update(helium_mass=mass, achieved_rate=rate, gage_force=gage_force)
+                if flight_summary:
+                    best["flight"] = flight
+        return rate, gage_force, failed
+
+    def residual(mass: float) -> tuple[float, bool]:
+        rate, _, failed = evaluate(mass)
+        if failed:
+            rate = 0.0
+        return rate * rate - target_rate * target_rate, abs(rate - target_rate) <= rate_tolerance
+
+    result = {
+        "helium_mass": None,
+        "achieved_rate": 0.0,
+        "gage_force": float("nan"),
+        "method": method,
+        "simulations": 0,
+        "converged": False,
+    }
+    if flight_summary:
+        result["flight"] = None
+
+    search = _brent_search_f if method == "brent" else _illinois_search_f
+
+    if method != "bisection":
+        if mass_estimate is None and quasi_steady_bracket:
+            with perf_phase_f("quasi_steady_estimate"):
+                mass_estimate = quasi_steady_mass_f(
+                    start_altitude, burst_altitude, target_rate, atmosphere_table, constant_mass,
+                )
+        if mass_estimate is not None:
+            lower_limit = min(lift_off_mass_f(start_altitude, atmosphere_table, constant_mass), MAX_HELIUM_MASS)
+            mass_estimate = min(max(mass_estimate, lower_limit), MAX_HELIUM_MASS)
+            lower_mass, lower_residual, upper_mass, upper_residual, done = _quasi_steady_bracket_f(
+                residual, mass_estimate, lower_limit, target_rate,
+            )
+
+            if done:
+                converged = True
+            elif upper_residual < 0.0:
+                # Even MAX_HELIUM_MASS misses the target in the full model
+                max_rate, max_gage_force, _ = evaluated[upper_mass]
+                result.update(achieved_rate=max_rate, gage_force=max_gage_force, simulations=simulations)
+                return result
+            else:
+                converged = search(
+                    residual, lower_mass, lower_residual, upper_mass, upper_residual, mass_tolerance,
+                )
+
+            result.update(best)
+            result.update(simulations=simulations, converged=converged)
+            return result
+
+    max_rate, max_gage_force, failed = evaluate(MAX_HELIUM_MASS)
+
+    if failed or max_rate < target_rate:
+        result.update(achieved_rate=max_rate, gage_force=max_gage_force, simulations=simulations)
+        return result
+
+    if method == "bisection":
+        converged = _bisection_search_f(evaluate, target_rate)
+    elif abs(max_rate - target_rate) <= rate_tolerance:
+        converged = True
+    else:
+        lower_mass = min(lift_off_mass_f(start_altitude, atmosphere_table, constant_mass), MAX_HELIUM_MASS)
+        converged = search(
+            residual,
+            lower_mass,
+            -target_rate * target_rate,
+            MAX_HELIUM_MASS,
+            max_rate * max_rate - target_rate * target_rate,
+            mass_tolerance,
+        )
+
+    result.update(best)
+    result.update(simulations=simulations, converged=converged)
+    return result
+
+
+def solve_helium_mass_f(
+    start_altitude: float,
+    burst_altitude: float,
+    target_rate: float,
+    atmosphere_table: AtmosphereTable | None = None,
+    method: str = SOLVER_METHOD,
+    mass_tolerance: float = MASS_TOLERANCE,
+    rate_tolerance: float = RATE_TOLERANCE,
+    integrator: str = "euler",
+    quasi_steady_bracket: bool = False,
+    constant_mass: float = CONSTANT_MASS,
+) -> tuple:
+    """
+    Solve for helium mass required to meet target ascent rate.
+
+    Passing an AtmosphereTable makes every simulation interpolate the
+    atmosphere from the table instead of evaluating the layer model. See
+    solve_helium_mass_detailed_f for the solver methods and tolerances, and
+    for the flight statistics of the solution (flight_summary).
+
+    Output:
+    - helium_mass (or None if unattainable)
+    - achieved mean ascent rate, m/s
+    - initial gage force, N
+    """
+    result = solve_helium_mass_detailed_f(
+        start_altitude,
+        burst_altitude,
+        target_rate,
+        atmosphere_table,
+        method,
+        mass_tolerance,
+        rate_tolerance,
+        integrator,
+        quasi_steady_bracket,
+        constant_mass=constant_mass,
+    )
+    return result["helium_mass"], result["achieved_rate"], result["gage_force"]
 
 
 def ascent_solver_f(
@@ -216,17 +1175,55 @@ def ascent_solver_f(
     burst_altitude: float,
     target_rate: float,
     run_simulation: bool = False,
+    atmosphere_table: AtmosphereTable | None = None,
+    method: str = SOLVER_METHOD,
+    integrator: str = "euler",
+    quasi_steady_bracket: bool = False,
+    flight_summary: bool = False,
+    constant_mass: float = CONSTANT_MASS,
+    perf: bool = False,
 ) -> dict:
     """
     High-level ascent solver interface.
 
+    Pass an AtmosphereTable to run every simulation against the interpolated
+    atmosphere instead of the exact layer model. method selects the helium
+    mass search (see SOLVER_METHODS); its cost is reported under "solver".
+    integrator selects fixed-step "euler" or adaptive "rk45" simulations.
+    quasi_steady_bracket brackets the search with the terminal-velocity model
+    before running full simulations. flight_summary adds the solution's
+    flight statistics (simulate_ascent_summary_f) under "flight".
+    constant_mass is the non-helium (payload) mass in kg.
+    perf adds simulation, integration step and atmosphere evaluation counts
+    and per-phase wall times (solve, simulations, quasi_steady_estimate,
+    launch_forces, verification) under "perf"
+    (see modules.perf_counters_f).
+
     Returns a structured summary dictionary.
     """
+    if perf:
+        with collect_perf_f() as counters:
+            summary = ascent_solver_f(
+                start_altitude,
+                burst_altitude,
+                target_rate,
+                run_simulation,
+                atmosphere_table,
+                method,
+                integrator,
+                quasi_steady_bracket,
+                flight_summary,
+                constant_mass,
+            )
+        summary["perf"] = counters.as_dict()
+        return summary
+
     summary = {
         "inputs": {
             "start_altitude": start_altitude,
             "burst_altitude": burst_altitude,
             "target_rate": target_rate,
+            "constant_mass": constant_mass,
         },
         "results": {
             "helium_mass": None,
@@ -239,35 +1236,64 @@ def ascent_solver_f(
             "atmosphere_ceiling": MAX_ATMOSPHERE_ALTITUDE,
         },
         "forces_at_launch": None,
+        "flight": None,
+        "solver": {
+            "method": method,
+            "integrator": integrator,
+            "quasi_steady_bracket": quasi_steady_bracket,
+            "simulations": 0,
+            "converged": False,
+            "mass_tolerance": MASS_TOLERANCE,
+            "rate_tolerance": RATE_TOLERANCE,
+        },
         "status": {
             "solution_found": False,
             "error": None,
         },
+        "perf": None,
     }
 
-    error = validate_inputs_f(start_altitude, burst_altitude, target_rate)
+    error = validate_inputs_f(start_altitude, burst_altitude, target_rate, constant_mass)
+    if error is None:
+        error = validate_solver_options_f(method, integrator)
     if error is not None:
         summary["status"]["error"] = error
         return summary
 
-    helium_mass, rate, gage_force = solve_helium_mass_f(
-        start_altitude,
-        burst_altitude,
-        target_rate,
+    with perf_phase_f("solve"):
+        solution = solve_helium_mass_detailed_f(
+            start_altitude,
+            burst_altitude,
+            target_rate,
+            atmosphere_table,
+            method,
+            integrator=integrator,
+            quasi_steady_bracket=quasi_steady_bracket,
+            flight_summary=flight_summary,
+            constant_mass=constant_mass,
+        )
+    helium_mass = solution["helium_mass"]
+    rate = solution["achieved_rate"]
+    gage_force = solution["gage_force"]
+
+    summary["solver"].update(
+        simulations=solution["simulations"],
+        converged=solution["converged"],
     )
 
     if helium_mass is None:
         summary["status"]["error"] = "Target ascent rate not achievable"
         return summary
 
-    atmosphere = atmosphere_at_altitude_f(start_altitude)
+    with perf_phase_f("launch_forces"):
+        atmosphere = atmosphere_at_altitude_f(start_altitude, atmosphere_table)
 
-    buoyant = buoyant_force_f(start_altitude, helium_mass, atm=atmosphere)  # N
-    gravity = gravity_force_f(start_altitude, CONSTANT_MASS + helium_mass)  # N
-    correction = force_correction_f(helium_mass, start_altitude)             # N
+        buoyant = buoyant_force_f(start_altitude, helium_mass, atm=atmosphere)  # N
+        gravity = gravity_force_f(start_altitude, constant_mass + helium_mass)  # N
+        correction = force_correction_f(helium_mass, start_altitude)             # N
 
     net_force = buoyant - gravity
-    initial_acceleration = net_force / (CONSTANT_MASS + helium_mass)
+    initial_acceleration = net_force / (constant_mass + helium_mass)
 
     summary["forces_at_launch"] = {
         "buoyant_force": buoyant,
@@ -284,19 +1310,26 @@ def ascent_solver_f(
         "success": True,
     })
 
+    summary["flight"] = solution.get("flight")
+
     summary["status"]["solution_found"] = True
 
     if run_simulation:
-        simulate_ascent_motion_f(
-            helium_mass_kg=helium_mass,
-            start_altitude_m=start_altitude,
-            max_altitude_m=burst_altitude,
-            time_step_s=TIME_STEP,
-            constant_mass_kg=CONSTANT_MASS,
-            make_plots=False,
-            log_scale_plots=False,
-            hard_stop_on_nonpositive_net_force=True,
-        )
+        with perf_phase_f("verification"):
+            verification = simulate_ascent_motion_f(
+                helium_mass_kg=helium_mass,
+                start_altitude_m=start_altitude,
+                max_altitude_m=burst_altitude,
+                time_step_s=TIME_STEP,
+                constant_mass_kg=constant_mass,
+                make_plots=False,
+                log_scale_plots=False,
+                hard_stop_on_nonpositive_net_force=True,
+                atmosphere_table=atmosphere_table,
+                integrator=integrator,
+            )
+        if perf_counters_f.ACTIVE is not None:
+            perf_counters_f.ACTIVE.count_simulation(verification["steps"])
 
     return summary
 
@@ -0,0 +1,313 @@
+########################################################################
+# Purdue Orbital, Flight Dynamics
+#
+# Project Name: Ascent / Descent Modeling
+#
+# Script Name: Ascent Surface
+# File Name: ascent_surface.py
+#
+# Contributors: Purdue Orbital Flight Dynamics Team
+# Date Created: 10/18/2026
+# Last Updated: 10/18/2026
+#
+# Script Description:
+#   Precomputes the required helium mass over a 3-D grid of (start
+#   altitude, burst altitude, target rate) for one vehicle configuration,
+#   stores it as a compressed .npz artifact and answers new inputs by
+#   trilinear interpolation with an error estimate.
+#
+#   The script:
+#     - Solves the grid with the sweep engine (ascent_sweep.run_sweep_f)
+#     - Saves the axes, the mass grid and a JSON metadata header (model
+#       hash and physical model constants, payload mass, solver settings)
+#       with numpy.savez_compressed
+#     - Estimates the interpolation error of each query from the grid
+#       curvature: along an axis with spacing h the linear interpolation
+#       error is |f''| * t * (1 - t) * h^2 / 2 for cell fraction t, with
+#       |f''| taken as the largest second difference at the cell corners
+#     - Optionally falls back to a full solve, or polishes the interpolated
+#       mass with a bracketed solve, when the estimate exceeds a tolerance
+#
+# Notes:
+#   - Grid points with no solution (unattainable target, burst <= start)
+#     are stored as nan; queries in a cell touching one report an infinite
+#     error estimate.
+#   - Queries outside the grid are clamped to it and flagged in_domain
+#     False, with an infinite error estimate.
+#
+# References:
+#   None
+#
+# Input Parameters:
+#   - start_altitudes, burst_altitudes, target_rates: grid axes
+#     (strictly increasing), m, m, m/s
+#   - constant_mass: non-helium (payload) mass, kg
+#
+# Output:
+#   - SolutionSurface (query, save, load)
+#
+########################################################################
+
+from __future__ import annotations
+
+import bisect
+import json
+import math
+
+import numpy as np
+
+from ascent_cache import model_hash_f
+from ascent_simulation import CONSTANT_MASS, SOLVER_METHOD, solve_helium_mass_detailed_f
+from ascent_sweep import run_sweep_f, sweep_grid_f
+from modules.model_constants_f import model_constants_f
+
+
+# --------------------------- CONSTANTS --------------------------------
+SURFACE_FORMAT = 1              # artifact layout version
+SURFACE_AXES = ("start_altitude", "burst_altitude", "target_rate")
+FALLBACK_MODES = ("none", "solve", "polish")
+# ---------------------------------------------------------------------
+
+
+def _second_differences(values: np.ndarray, axis_values: np.ndarray, axis: int) -> np.ndarray:
+    """Return |f''| per node along one axis (nan where undefined, 0 for short axes)."""
+    curvature = np.zeros_like(values)
+    if axis_values.size < 3:
+        return curvature
+
+    moved = np.moveaxis(values, axis, 0)
+    h_left = np.diff(axis_values)[:-1].reshape((-1,) + (1,) * (values.ndim - 1))
+    h_right = np.diff(axis_values)[1:].reshape((-1,) + (1,) * (values.ndim - 1))
+    interior = 2.0 * (
+        (moved[2:] - moved[1:-1]) / h_right - (moved[1:-1] - moved[:-2]) / h_left
+    ) / (h_left + h_right)
+
+    out = np.moveaxis(curvature, axis, 0)
+    out[1:-1] = np.abs(interior)
+    out[0] = out[1]
+    out[-1] = out[-2]
+    return curvature
+
+
+class SolutionSurface:
+    """
+    Helium mass solution surface on a (start, burst, rate) grid.
+
+    Build with SolutionSurface.build, or load a saved artifact with
+    SolutionSurface.load.
+    """
+
+    def __init__(
+        self,
+        start_altitudes,
+        burst_altitudes,
+        target_rates,
+        helium_mass,
+        metadata: dict | None = None,
+    ) -> None:
+        self.axes = tuple(
+            np.asarray(axis, dtype=float) for axis in (start_altitudes, burst_altitudes, target_rates)
+        )
+        self.helium_mass = np.asarray(helium_mass, dtype=float)
+        self.metadata = dict(metadata or {})
+
+        for name, axis in zip(SURFACE_AXES, self.axes):
+            if axis.ndim != 1 or axis.size < 2 or np.any(np.diff(axis) <= 0.0):
+                raise ValueError(f"{name} axis must be strictly increasing with at least 2 points")
+        if self.helium_mass.shape != tuple(axis.size for axis in self.axes):
+            raise ValueError("helium_mass shape does not match the axes")
+
+        # Largest |f''| along each axis over the 8 corners of every cell
+        self._cell_curvature = []
+        for axis_index, axis in enumerate(self.axes):
+            curvature = _second_differences(self.helium_mass, axis, axis_index)
+            cell = np.maximum.reduce([
+                curvature[i:curvature.shape[0] - 1 + i, j:curvature.shape[1] - 1 + j, k:curvature.shape[2] - 1 + k]
+                for i in (0, 1) for j in (0, 1) for k in (0, 1)
+            ])
+            cell = np.where(np.isnan(cell), np.inf, cell)
+            self._cell_curvature.append(cell.tolist())
+
+        self._axis_lists = [axis.tolist() for axis in self.axes]
+        self._mass_list = self.helium_mass.tolist()
+
+    @classmethod
+    def build(
+        cls,
+        start_altitudes,
+        burst_altitudes,
+        target_rates,
+        constant_mass: float = CONSTANT_MASS,
+        workers: int | None = None,
+        method: str = SOLVER_METHOD,
+        quasi_steady_bracket: bool = True,
+    ) -> SolutionSurface:
+        """
+        Solve every grid point with the sweep engine and return the surface.
+
+        Input:
+        - start_altitudes, burst_altitudes, target_rates: grid axes
+        - constant_mass: non-helium (payload) mass, kg
+        - workers: sweep worker processes (None -> os.cpu_count())
+        - method, quasi_steady_bracket: ascent_solver_f options
+
+        Output:
+        - SolutionSurface
+        """
+        axes = [np.unique(np.asarray(axis, dtype=float)) for axis in (start_altitudes, burst_altitudes, target_rates)]
+        cases = sweep_grid_f(*axes, constant_masses=(constant_mass,))
+        table = run_sweep_f(
+            cases,
+            workers=workers,
+            method=method,
+            quasi_steady_bracket=quasi_steady_bracket,
+        )
+        helium_mass = table["helium_mass"].reshape(tuple(axis.size for axis in axes))
+
+        metadata = {
+            "format": SURFACE_FORMAT,
+            "model_hash": model_hash_f(),
+            "model": model_constants_f(),
+            "constant_mass": constant_mass,
+            "method": method,
+            "quasi_steady_bracket": quasi_steady_bracket,
+            "solved_points": int(np.count_nonzero(table["success"])),
+        }
+        return cls(*axes, helium_mass, metadata)
+
+    def save(self, path: str) -> None:
+        """Save the surface as a compressed .npz artifact."""
+        np.savez_compressed(
+            path,
+            start_altitude=self.axes[0],
+            burst_altitude=self.axes[1],
+            target_rate=self.axes[2],
+            helium_mass=self.helium_mass,
+            metadata=np.array(json.dumps(self.metadata)),
+        )
+
+    @classmethod
+    def load(cls, path: str, check_model: bool = True) -> SolutionSurface:
+        """
+        Load a saved surface.
+
+        With check_model, raises ValueError if the artifact was built with
+        different model constants (see ascent_cache.model_hash_f).
+        """
+        with np.load(path, allow_pickle=False) as artifact:
+            metadata = json.loads(str(artifact["metadata"]))
+            surface = cls(
+                artifact["start_altitude"],
+                artifact["burst_altitude"],
+                artifact["target_rate"],
+                artifact["helium_mass"],
+                metadata,
+            )
+        if check_model and metadata.get("model_hash") != model_hash_f():
+            raise ValueError("surface was built with different model constants")
+        return surface
+
+    def _locate(self, axis_index: int, value: float) -> tuple[int, float, bool]:
+        """Return (cell index, fraction in cell, inside grid) along one axis."""
+        nodes = self._axis_lists[axis_index]
+        inside = nodes[0] <= value <= nodes[-1]
+        value = min(max(value, nodes[0]), nodes[-1])
+        index = min(max(bisect.bisect_right(nodes, value) - 1, 0), len(nodes) - 2)
+        fraction = (value - nodes[index]) / (nodes[index + 1] - nodes[index])
+        return index, fraction, inside
+
+    def interpolate(
+        self,
+        start_altitude: float,
+        burst_altitude: float,
+        target_rate: float,
+    ) -> tuple[float, float, bool]:
+        """
+        Trilinearly interpolate the helium mass.
+
+        Output:
+        - helium_mass: interpolated mass, kg (nan if a corner is unsolved)
+        - error_estimate: curvature-based interpolation error bound, kg
+        - in_domain: True if the inputs lie inside the grid
+        """
+        i, u, inside_i = self._locate(0, start_altitude)
+        j, v, inside_j = self._locate(1, burst_altitude)
+        k, w, inside_k = self._locate(2, target_rate)
+
+        m = self._mass_list
+        c00 = m[i][j][k] * (1.0 - w) + m[i][j][k + 1] * w
+        c01 = m[i][j + 1][k] * (1.0 - w) + m[i][j + 1][k + 1] * w
+        c10 = m[i + 1][j][k] * (1.0 - w) + m[i + 1][j][k + 1] * w
+        c11 = m[i + 1][j + 1][k] * (1.0 - w) + m[i + 1][j + 1][k + 1] * w
+        helium_mass = (c00 * (1.0 - v) + c01 * v) * (1.0 - u) + (c10 * (1.0 - v) + c11 * v) * u
+
+        error_estimate = 0.0
+        for axis_index, fraction, cell in ((0, u, i), (1, v, j), (2, w, k)):
+            nodes = self._axis_lists[axis_index]
+            spacing = nodes[cell + 1] - nodes[cell]
+            curvature = self._cell_curvature[axis_index][i][j][k]
+            if fraction > 0.0:
+                error_estimate += 0.5 * curvature * fraction * (1.0 - fraction) * spacing * spacing
+
+        in_domain = inside_i and inside_j and inside_k
+        if not in_domain or math.isnan(helium_mass):
+            error_estimate = math.inf
+        return helium_mass, error_estimate, in_domain
+
+    def query(
+        self,
+        start_altitude: float,
+        burst_altitude: float,
+        target_rate: float,
+        tolerance: float | None = None,
+        fallback: str = "none",
+    ) -> dict:
+        """
+        Answer a helium mass query from the surface.
+
+        Input:
+        - start_altitude, burst_altitude, target_rate: as ascent_solver_f
+        - tolerance: acceptable error estimate, kg (None accepts any)
+        - fallback: what to do when the estimate exceeds tolerance:
+          "none" (return the interpolated value), "solve" (full solve) or
+          "polish" (solve bracketed around the interpolated mass)
+
+        Output (dict):
+        - helium_mass: kg (nan if no answer)
+        - error_estimate: kg (0 after a solve that converged)
+        - in_domain: True if the inputs lie inside the grid
+        - source: "surface", "solve" or "polish"
+        - simulations: full ascent simulations run
+        """
+        if fallback not in FALLBACK_MODES:
+            raise ValueError(f"fallback must be one of {FALLBACK_MODES}")
+
+        helium_mass, error_estimate, in_domain = self.interpolate(start_altitude, burst_altitude, target_rate)
+        result = {
+            "helium_mass": helium_mass,
+            "error_estimate": error_estimate,
+            "in_domain": in_domain,
+            "source": "surface",
+            "simulations": 0,
+        }
+
+        if tolerance is None or error_estimate <= tolerance or fallback == "none":
+            return result
+
+        estimate = helium_mass if fallback == "polish" and math.isfinite(helium_mass) else None
+        solution = solve_helium_mass_detailed_f(
+            start_altitude,
+            burst_altitude,
+            target_rate,
+            method=self.metadata.get("method", SOLVER_METHOD),
+            constant_mass=self.metadata.get("constant_mass", CONSTANT_MASS),
+            mass_estimate=estimate,
+        )
+        solved = solution["helium_mass"]
+        result.update(
+            helium_mass=float("nan") if solved is None else solved,
+            error_estimate=0.0 if solution["converged"] else math.inf,
+            source=fallback,
+            simulations=solution["simulations"],
+        )
+        return result
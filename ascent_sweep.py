@@ -0,0 +1,235 @@
+########################################################################
+# Purdue Orbital, Flight Dynamics
+#
+# Project Name: Ascent / Descent Modeling
+#
+# Script Name: Ascent Sweep
+# File Name: ascent_sweep.py
+#
+# Contributors: Purdue Orbital Flight Dynamics Team
+# Date Created: 10/18/2026
+# Last Updated: 10/18/2026
+#
+# Script Description:
+#   Runs ascent_solver_f over a parameter grid or an explicit case list,
+#   fanning the cases out across a process pool, and collects the results
+#   into a columnar table (one NumPy array per field, rows in input order).
+#
+#   The script:
+#     - Builds the Cartesian product of start altitude, burst altitude,
+#       target rate and payload (constant) mass with sweep_grid_f
+#     - Schedules cases in contiguous chunks with ProcessPoolExecutor.map,
+#       so per-task overhead is paid once per chunk and order is preserved
+#     - Records missing fields, validation errors, unattainable targets
+#       and exceptions as data (success / error columns) instead of raising
+#     - Optionally builds one AtmosphereTable per worker process
+#
+# Notes:
+#   - Cases are independent and CPU bound, so throughput scales with the
+#     number of worker processes up to the core count. Solve times vary
+#     with the target (unattainable targets stop after one simulation), so
+#     the default chunk size gives each worker several chunks to balance.
+#   - workers=1 runs serially in the calling process (no pool).
+#
+# References:
+#   None
+#
+# Input Parameters:
+#   - cases: iterable of dicts with SWEEP_FIELDS keys (constant_mass is
+#     optional and defaults to CONSTANT_MASS)
+#   - workers: worker process count (None -> os.cpu_count())
+#   - chunk_size: cases per scheduled task (None -> automatic)
+#   - table_resolution_m: AtmosphereTable resolution per worker, m, or None
+#     for the exact atmosphere model
+#   - method, integrator, quasi_steady_bracket: ascent_solver_f options
+#
+# Output:
+#   - dict of ndarrays, one per RESULT_FIELDS entry, aligned with cases
+#
+########################################################################
+
+from __future__ import annotations
+
+import itertools
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from ascent_simulation import CONSTANT_MASS, SOLVER_METHOD, ascent_solver_f
+from case_fields import init_worker_table_f, worker_table_f
+
+
+# --------------------------- CONSTANTS --------------------------------
+SWEEP_FIELDS = ("start_altitude", "burst_altitude", "target_rate", "constant_mass")
+REQUIRED_FIELDS = SWEEP_FIELDS[:3]  # constant_mass defaults to CONSTANT_MASS
+RESULT_FIELDS = SWEEP_FIELDS + (
+    "helium_mass",
+    "achieved_rate",
+    "initial_gage_force",
+    "success",
+    "converged",
+    "simulations",
+    "error",
+)
+CHUNKS_PER_WORKER = 4           # scheduled chunks per worker (load balance)
+# ---------------------------------------------------------------------
+
+
+def sweep_grid_f(
+    start_altitudes,
+    burst_altitudes,
+    target_rates,
+    constant_masses=(CONSTANT_MASS,),
+) -> list[dict]:
+    """
+    Build the case list for every combination of the given values.
+
+    Input:
+    - start_altitudes: starting altitudes, m
+    - burst_altitudes: burst altitudes, m
+    - target_rates: desired mean ascent rates, m/s
+    - constant_masses: non-helium (payload) masses, kg
+
+    Output:
+    - list of case dicts, the last field varying fastest
+    """
+    return [
+        dict(zip(SWEEP_FIELDS, values))
+        for values in itertools.product(
+            np.atleast_1d(start_altitudes).tolist(),
+            np.atleast_1d(burst_altitudes).tolist(),
+            np.atleast_1d(target_rates).tolist(),
+            np.atleast_1d(constant_masses).tolist(),
+        )
+    ]
+
+
+def _solve_case_f(case: dict, solver_options: dict) -> dict:
+    """Solve one case, returning a result row; failures become data."""
+    row = {
+        "start_altitude": float("nan"),
+        "burst_altitude": float("nan"),
+        "target_rate": float("nan"),
+        "constant_mass": CONSTANT_MASS,
+        "helium_mass": float("nan"),
+        "achieved_rate": float("nan"),
+        "initial_gage_force": float("nan"),
+        "success": False,
+        "converged": False,
+        "simulations": 0,
+        "error": "",
+    }
+
+    missing = [field for field in REQUIRED_FIELDS if field not in case]
+    if missing:
+        row["error"] = f"missing field(s): {', '.join(missing)}"
+        return row
+
+    try:
+        for field in SWEEP_FIELDS:
+            if field in case:
+                row[field] = float(case[field])
+
+        summary = ascent_solver_f(
+            row["start_altitude"],
+            row["burst_altitude"],
+            row["target_rate"],
+            atmosphere_table=worker_table_f(),
+            constant_mass=row["constant_mass"],
+            **solver_options,
+        )
+    except Exception as exc:
+        row["error"] = f"{type(exc).__name__}: {exc}"
+        return row
+
+    results = summary["results"]
+    row.update(
+        achieved_rate=results["achieved_rate"],
+        initial_gage_force=results["initial_gage_force"],
+        success=results["success"],
+        converged=summary["solver"]["converged"],
+        simulations=summary["solver"]["simulations"],
+        error=summary["status"]["error"] or "",
+    )
+    if results["helium_mass"] is not None:
+        row["helium_mass"] = results["helium_mass"]
+    return row
+
+
+def _solve_chunk_f(cases: list[dict], solver_options: dict) -> list[dict]:
+    """Solve a contiguous chunk of cases in one task."""
+    return [_solve_case_f(case, solver_options) for case in cases]
+
+
+def _to_columns_f(rows: list[dict]) -> dict[str, np.ndarray]:
+    """Convert result rows into one array per RESULT_FIELDS entry."""
+    columns = {}
+    for field in RESULT_FIELDS:
+        values = [row[field] for row in rows]
+        if field == "error":
+            columns[field] = np.array(values, dtype=object)
+        elif field in ("success", "converged"):
+            columns[field] = np.array(values, dtype=bool)
+        elif field == "simulations":
+            columns[field] = np.array(values, dtype=np.int64)
+        else:
+            columns[field] = np.array(values, dtype=float)
+    return columns
+
+
+def run_sweep_f(
+    cases,
+    workers: int | None = None,
+    chunk_size: int | None = None,
+    table_resolution_m: float | None = None,
+    method: str = SOLVER_METHOD,
+    integrator: str = "euler",
+    quasi_steady_bracket: bool = False,
+) -> dict[str, np.ndarray]:
+    """
+    Solve every case with ascent_solver_f and return a columnar table.
+
+    Input:
+    - cases: iterable of case dicts (see sweep_grid_f)
+    - workers: worker processes (None -> os.cpu_count(); 1 -> serial)
+    - chunk_size: cases per task (None -> about CHUNKS_PER_WORKER chunks
+      per worker)
+    - table_resolution_m: per-worker AtmosphereTable resolution, m, or None
+    - method, integrator, quasi_steady_bracket: ascent_solver_f options
+
+    Output:
+    - dict of ndarrays keyed by RESULT_FIELDS, rows in input order; failed
+      cases have success False, helium_mass nan and a non-empty error
+    """
+    cases = list(cases)
+    solver_options = {
+        "method": method,
+        "integrator": integrator,
+        "quasi_steady_bracket": quasi_steady_bracket,
+    }
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+    workers = max(1, min(int(workers), len(cases) or 1))
+
+    if chunk_size is None:
+        chunk_size = math.ceil(len(cases) / (workers * CHUNKS_PER_WORKER)) if cases else 1
+    chunk_size = max(1, int(chunk_size))
+    chunks = [cases[i:i + chunk_size] for i in range(0, len(cases), chunk_size)]
+
+    if workers == 1:
+        init_worker_table_f(table_resolution_m)
+        rows = [row for chunk in chunks for row in _solve_chunk_f(chunk, solver_options)]
+        return _to_columns_f(rows)
+
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=init_worker_table_f,
+        initargs=(table_resolution_m,),
+    ) as executor:
+        chunk_rows = executor.map(_solve_chunk_f, chunks, itertools.repeat(solver_options))
+        rows = [row for chunk in chunk_rows for row in chunk]
+
+    return _to_columns_f(rows)
@@ -1,17 +1,496 @@
+########################################################################
+# Purdue Orbital, Flight Dynamics
+#
+# Project Name: Ascent / Descent Modeling
+#
+# Script Name: Ascent Web Integration
+# File Name: ascent_web_integration.py
+#
+# Contributors: Purdue Orbital Flight Dynamics Team
+# Date Created: 10/18/2026
+# Last Updated: 10/18/2026
+#
+# Script Description:
+#   Local HTTP/1.1 JSON service for the web front end, built on asyncio
+#   streams. The event loop only parses requests and writes responses;
+#   every solve runs in a bounded pool of worker processes.
+#
+#   Endpoints:
+#     - POST /solve: ascent_solver_f summary (case_fields.SOLVE_FIELDS in
+#       the body)
+#     - POST /flight: run_flight_f summary with the ascent + descent
+#       timeline (case_fields.FLIGHT_FIELDS in the body)
+#     - GET /health: pool size, in-flight computations and counters
+#
+#   The script:
+#     - Coalesces identical in-flight requests (same endpoint and same
+#       normalized parameters) into one computation whose response bytes
+#       are shared by every waiter
+#     - Runs at most "workers" computations at once; further distinct
+#       computations queue in the event loop, and beyond max_pending the
+#       service answers 503 with Retry-After (backpressure) instead of
+#       queueing without bound
+#     - Answers 504 when a result takes longer than the request timeout;
+#       the computation keeps running for any other waiters, and one that
+#       has not started yet is dropped when its last waiter leaves
+#     - Times out slow request headers and bodies, limits body size, and
+#       keeps connections alive between requests
+#
+# Notes:
+#   - Responses are serialized to JSON inside the worker process (arrays
+#     become lists, nan/inf become null), so large timelines never occupy
+#     the event loop.
+#   - Solver validation errors and unattainable targets are returned with
+#     status 200 in the summary's "status" section, as ascent_solver_f
+#     reports them; malformed requests get 400 with {"error": ...}.
+#   - A worker that dies takes the pool with it; the pool is rebuilt and
+#     the affected requests get 500.
+#   - Intended for local use behind the front end: no TLS and no
+#     authentication. cors_origin adds the CORS headers for a browser
+#     front end served from another origin.
+#
+# References:
+#   None
+#
+# Input Parameters (command line):
+#   - --host, --port: listening address
+#   - --workers: worker processes (default os.cpu_count())
+#   - --max-pending: distinct computations accepted at once
+#   - --timeout: seconds a request waits for its result
+#   - --table-resolution: per-worker AtmosphereTable resolution, m
+#     (default: exact atmosphere model for /solve)
+#   - --cors-origin: value of Access-Control-Allow-Origin
+#
+# Output:
+#   - JSON responses; one log line per request on stdout
+#
+########################################################################
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import functools
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from http import HTTPStatus
+
 from ascent_simulation import ascent_solver_f
+from case_fields import FLIGHT_FIELDS, SOLVE_FIELDS, init_worker_table_f, parse_case_f, worker_table_f
+from flight_pipeline import run_flight_f
+from modules.json_safe_f import summary_json_f
+
+
+# --------------------------- CONSTANTS --------------------------------
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8080
+MAX_PENDING = 64                # distinct computations queued or running
+REQUEST_TIMEOUT_S = 30.0        # wait for a result, s
+HEADER_TIMEOUT_S = 10.0         # read request headers / idle keep-alive, s
+BODY_TIMEOUT_S = 10.0           # read request body, s
+MAX_HEADER_BYTES = 16 * 1024    # request line + headers
+MAX_BODY_BYTES = 64 * 1024      # JSON request body
+RETRY_AFTER_S = 1               # Retry-After on 503
+
+ENDPOINTS = {
+    "/solve": SOLVE_FIELDS,
+    "/flight": FLIGHT_FIELDS,
+}
+# ---------------------------------------------------------------------
+
+
+# --------------------------- WORKER SIDE ------------------------------
+def _warm_worker_f() -> None:
+    """No-op task used to start the worker processes ahead of the first request."""
+
+
+def _run_job_f(path: str, params: dict) -> bytes:
+    """Run one endpoint's computation and return the JSON response body."""
+    table = worker_table_f()
+    if path == "/solve":
+        summary = ascent_solver_f(atmosphere_table=table, **params)
+    else:
+        if table is not None:
+            params = dict(params, atmosphere_table=table)
+        summary = run_flight_f(**params)
+    return summary_json_f(summary).encode()
+
+
+# --------------------------- REQUESTS ---------------------------------
+class RequestError(Exception):
+    """A request the service rejects with an HTTP status and a message."""
+
+    def __init__(self, status: HTTPStatus, message: str) -> None:
+        super().__init__(message)
+        self.status = status
+
+
+def parse_params_f(body: bytes, fields: dict) -> dict:
+    """
+    Validate a JSON request body against an endpoint's field table.
+
+    Input:
+    - body: request body bytes (a JSON object)
+    - fields: {name: (type, default)} (case_fields.SOLVE_FIELDS or
+      FLIGHT_FIELDS)
+
+    Output:
+    - dict with every field, defaults filled in and numbers converted;
+      raises RequestError (400) on malformed JSON, unknown or missing
+      fields, wrongly typed or non-finite values (NaN, Infinity and
+      out-of-range numbers) and values outside CHOICES
+    """
+    try:
+        payload = json.loads(body or b"{}")
+    except (UnicodeDecodeError, json.JSONDecodeError) as exc:
+        raise RequestError(HTTPStatus.BAD_REQUEST, f"invalid JSON: {exc}") from None
+    if not isinstance(payload, dict):
+        raise RequestError(HTTPStatus.BAD_REQUEST, "body must be a JSON object")
+
+    try:
+        return parse_case_f(payload, fields)
+    except ValueError as exc:
+        raise RequestError(HTTPStatus.BAD_REQUEST, str(exc)) from None
+
+
+async def _read_request_f(reader: asyncio.StreamReader) -> tuple[str, str, str, dict, bytes] | None:
+    """Read one request; return (method, path, version, headers, body) or None at EOF."""
+    try:
+        head = await asyncio.wait_for(reader.readuntil(b"\r\n\r\n"), HEADER_TIMEOUT_S)
+    except asyncio.IncompleteReadError as exc:
+        if exc.partial.strip():
+            raise RequestError(HTTPStatus.BAD_REQUEST, "incomplete request") from None
+        return None
+    except asyncio.LimitOverrunError:
+        raise RequestError(HTTPStatus.REQUEST_HEADER_FIELDS_TOO_LARGE, "headers too large") from None
+    except asyncio.TimeoutError:
+        return None
+
+    lines = head.decode("latin-1").split("\r\n")
+    try:
+        method, target, version = lines[0].split(" ")
+    except ValueError:
+        raise RequestError(HTTPStatus.BAD_REQUEST, "malformed request line") from None
+
+    headers = {}
+    for line in lines[1:]:
+        if line:
+            name, _, value = line.partition(":")
+            headers[name.strip().lower()] = value.strip()
+
+    if "transfer-encoding" in headers:
+        raise RequestError(HTTPStatus.NOT_IMPLEMENTED, "chunked request bodies are not supported")
+    try:
+        length = int(headers.get("content-length", "0"))
+    except ValueError:
+        raise RequestError(HTTPStatus.BAD_REQUEST, "invalid Content-Length") from None
+    if length < 0:
+        raise RequestError(HTTPStatus.BAD_REQUEST, "invalid Content-Length")
+    if length > MAX_BODY_BYTES:
+        raise RequestError(HTTPStatus.REQUEST_ENTITY_TOO_LARGE, f"body larger than {MAX_BODY_BYTES} bytes")
+
+    try:
+        body = await asyncio.wait_for(reader.readexactly(length), BODY_TIMEOUT_S)
+    except (asyncio.IncompleteReadError, asyncio.TimeoutError):
+        raise RequestError(HTTPStatus.REQUEST_TIMEOUT, "request body not received") from None
+
+    return method.upper(), target.split("?", 1)[0], version, headers, body
+
+
+# --------------------------- SERVICE ----------------------------------
+class _Computation:
+    """One in-flight computation and the number of requests waiting on it."""
+
+    __slots__ = ("task", "waiters", "started")
+
+    def __init__(self) -> None:
+        self.task: asyncio.Task | None = None
+        self.waiters = 0
+        self.started = False
+
+
+class AscentService:
+    """
+    asyncio HTTP service running ascent_solver_f / run_flight_f in a process pool.
+
+    Use as an async context manager (or call start() and close()); serve
+    with serve_forever().
+    """
+
+    def __init__(
+        self,
+        host: str = DEFAULT_HOST,
+        port: int = DEFAULT_PORT,
+        workers: int | None = None,
+        max_pending: int = MAX_PENDING,
+        request_timeout_s: float = REQUEST_TIMEOUT_S,
+        table_resolution_m: float | None = None,
+        cors_origin: str | None = None,
+        log: bool = True,
+    ) -> None:
+        if max_pending < 1:
+            raise ValueError("max_pending must be at least 1")
+        if request_timeout_s <= 0.0:
+            raise ValueError("request_timeout_s must be positive")
+
+        self.host = host
+        self.port = port
+        self.workers = max(1, int(workers or os.cpu_count() or 1))
+        self.max_pending = int(max_pending)
+        self.request_timeout_s = float(request_timeout_s)
+        self.table_resolution_m = table_resolution_m
+        self.cors_origin = cors_origin
+        self.log = log
+
+        self.counters = dict.fromkeys(
+            ("requests", "computations", "coalesced", "rejected", "timeouts", "failures"), 0
+        )
+        self._computations: dict[str, _Computation] = {}
+        self._slots: asyncio.Semaphore | None = None
+        self._executor: ProcessPoolExecutor | None = None
+        self._server: asyncio.base_events.Server | None = None
+
+    async def __aenter__(self) -> AscentService:
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    def _new_executor_f(self) -> ProcessPoolExecutor:
+        return ProcessPoolExecutor(
+            max_workers=self.workers,
+            initializer=init_worker_table_f,
+            initargs=(self.table_resolution_m,),
+        )
+
+    async def start(self) -> None:
+        """Start the worker processes and begin listening."""
+        loop = asyncio.get_running_loop()
+        self._slots = asyncio.Semaphore(self.workers)
+        self._executor = self._new_executor_f()
+        await asyncio.gather(*(
+            loop.run_in_executor(self._executor, _warm_worker_f) for _ in range(self.workers)
+        ))
+        self._server = await asyncio.start_server(
+            self._handle_connection_f, self.host, self.port, limit=MAX_HEADER_BYTES
+        )
+        self.port = self._server.sockets[0].getsockname()[1]
+
+    async def serve_forever(self) -> None:
+        """Serve until cancelled."""
+        await self._server.serve_forever()
+
+    async def close(self) -> None:
+        """Stop listening, cancel queued computations and shut the pool down."""
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+        for computation in list(self._computations.values()):
+            computation.task.cancel()
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+
+    def health_f(self) -> dict:
+        """Return the pool size, in-flight computations and request counters."""
+        return {
+            "status": "ok",
+            "workers": self.workers,
+            "in_flight": len(self._computations),
+            "running": sum(computation.started for computation in self._computations.values()),
+            "max_pending": self.max_pending,
+            "request_timeout": self.request_timeout_s,
+            **self.counters,
+        }
+
+    async def _compute_f(self, computation: _Computation, path: str, params: dict) -> bytes:
+        """Wait for a worker slot and run the job in the pool."""
+        async with self._slots:
+            computation.started = True
+            executor = self._executor
+            try:
+                return await asyncio.get_running_loop().run_in_executor(executor, _run_job_f, path, params)
+            except BrokenProcessPool:
+                if self._executor is executor:
+                    self._executor = self._new_executor_f()
+                raise
+
+    def _finished_f(self, key: str, computation: _Computation, task: asyncio.Task) -> None:
+        """Forget a finished computation (retrieving its exception if nobody did)."""
+        if self._computations.get(key) is computation:
+            del self._computations[key]
+        if not task.cancelled():
+            task.exception()
+
+    async def result_f(self, path: str, params: dict) -> bytes:
+        """
+        Return the response body for a validated request, sharing identical
+        in-flight computations.
+
+        Raises RequestError with 503 when max_pending distinct computations
+        are already in flight and 504 when the result takes longer than the
+        request timeout.
+        """
+        key = path + json.dumps(params, sort_keys=True)
+        computation = self._computations.get(key)
+        if computation is None:
+            if len(self._computations) >= self.max_pending:
+                self.counters["rejected"] += 1
+                raise RequestError(HTTPStatus.SERVICE_UNAVAILABLE, "service busy, retry later")
+            computation = _Computation()
+            self._computations[key] = computation
+            computation.task = asyncio.create_task(self._compute_f(computation, path, params))
+            computation.task.add_done_callback(functools.partial(self._finished_f, key, computation))
+            self.counters["computations"] += 1
+        else:
+            self.counters["coalesced"] += 1
+
+        computation.waiters += 1
+        try:
+            return await asyncio.wait_for(asyncio.shield(computation.task), self.request_timeout_s)
+        except asyncio.TimeoutError:
+            self.counters["timeouts"] += 1
+            raise RequestError(HTTPStatus.GATEWAY_TIMEOUT, "computation timed out") from None
+        finally:
+            computation.waiters -= 1
+            # Nobody is left to read a result that has not started: drop it
+            if computation.waiters == 0 and not computation.started:
+                computation.task.cancel()
+
+    async def _respond_f(
+        self,
+        request: tuple[str, str, str, dict, bytes],
+    ) -> tuple[HTTPStatus, bytes]:
+        """Route one parsed request to a status and a response body."""
+        method, path, _, _, body = request
+
+        if path == "/health":
+            if method != "GET":
+                raise RequestError(HTTPStatus.METHOD_NOT_ALLOWED, "use GET")
+            return HTTPStatus.OK, json.dumps(self.health_f()).encode()
+
+        fields = ENDPOINTS.get(path)
+        if fields is None:
+            raise RequestError(HTTPStatus.NOT_FOUND, f"no endpoint {path}")
+        if method != "POST":
+            raise RequestError(HTTPStatus.METHOD_NOT_ALLOWED, "use POST with a JSON body")
+
+        params = parse_params_f(body, fields)
+        try:
+            return HTTPStatus.OK, await self.result_f(path, params)
+        except RequestError:
+            raise
+        except Exception as exc:
+            self.counters["failures"] += 1
+            raise RequestError(HTTPStatus.INTERNAL_SERVER_ERROR, f"{type(exc).__name__}: {exc}") from None
+
+    def _write_response_f(
+        self,
+        writer: asyncio.StreamWriter,
+        status: HTTPStatus,
+        body: bytes,
+        keep_alive: bool,
+    ) -> None:
+        """Write status line, headers and body."""
+        headers = [
+            f"HTTP/1.1 {status.value} {status.phrase}",
+            f"Content-Length: {len(body)}",
+            f"Connection: {'keep-alive' if keep_alive else 'close'}",
+        ]
+        if body:
+            headers.append("Content-Type: application/json")
+        if status == HTTPStatus.SERVICE_UNAVAILABLE:
+            headers.append(f"Retry-After: {RETRY_AFTER_S}")
+        if self.cors_origin is not None:
+            headers.append(f"Access-Control-Allow-Origin: {self.cors_origin}")
+            if status == HTTPStatus.NO_CONTENT:
+                headers.append("Access-Control-Allow-Methods: GET, POST, OPTIONS")
+                headers.append("Access-Control-Allow-Headers: Content-Type")
+        writer.write(("\r\n".join(headers) + "\r\n\r\n").encode("latin-1") + body)
+
+    async def _handle_connection_f(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """Serve requests on one connection until it closes or asks to."""
+        try:
+            while True:
+                start = time.perf_counter()
+                try:
+                    request = await _read_request_f(reader)
+                except RequestError as exc:
+                    body = json.dumps({"error": str(exc)}).encode()
+                    self._write_response_f(writer, exc.status, body, keep_alive=False)
+                    await writer.drain()
+                    return
+                if request is None:
+                    return
+
+                method, path, version, headers, _ = request
+                connection = headers.get("connection", "").lower()
+                keep_alive = connection != "close" and (version == "HTTP/1.1" or connection == "keep-alive")
+                self.counters["requests"] += 1
+
+                if method == "OPTIONS":
+                    status, body = HTTPStatus.NO_CONTENT, b""
+                else:
+                    try:
+                        status, body = await self._respond_f(request)
+                    except RequestError as exc:
+                        status, body = exc.status, json.dumps({"error": str(exc)}).encode()
+
+                self._write_response_f(writer, status, body, keep_alive)
+                await writer.drain()
+                if self.log:
+                    elapsed_ms = 1000.0 * (time.perf_counter() - start)
+                    print(f"{method} {path} {status.value} {len(body)}B {elapsed_ms:.1f} ms", flush=True)
+                if not keep_alive:
+                    return
+        except (ConnectionError, asyncio.CancelledError):
+            pass
+        finally:
+            writer.close()
+
+
+async def serve_f(**options) -> None:
+    """Run an AscentService (AscentService keyword options) until cancelled."""
+    async with AscentService(**options) as service:
+        print(f"Ascent service on http://{service.host}:{service.port} "
+              f"({service.workers} workers, max {service.max_pending} pending)", flush=True)
+        await service.serve_forever()
+
 
-data = ascent_solver_f(
-    start_altitude=0.0,
-    burst_altitude=10000.0,
-    target_rate=5.0,
-)
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Local JSON service for ascent_solver_f and run_flight_f.")
+    parser.add_argument("--host", default=DEFAULT_HOST)
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: CPU count)")
+    parser.add_argument("--max-pending", type=int, default=MAX_PENDING,
+                        help="distinct computations accepted at once before answering 503")
+    parser.add_argument("--timeout", type=float, default=REQUEST_TIMEOUT_S,
+                        help="seconds a request waits for its result before 504")
+    parser.add_argument("--table-resolution", type=float, default=None,
+                        help="per-worker AtmosphereTable resolution, m (default: exact model)")
+    parser.add_argument("--cors-origin", default=None, help="Access-Control-Allow-Origin value")
+    parser.add_argument("--quiet", action="store_true", help="no per-request log lines")
+    args = parser.parse_args()
 
-for section, contents in data.items():
-    print(f"\n[{section}]")
+    try:
+        asyncio.run(serve_f(
+            host=args.host,
+            port=args.port,
+            workers=args.workers,
+            max_pending=args.max_pending,
+            request_timeout_s=args.timeout,
+            table_resolution_m=args.table_resolution,
+            cors_origin=args.cors_origin,
+            log=not args.quiet,
+        ))
+    except KeyboardInterrupt:
+        pass
 
-    if not isinstance(contents, dict):
-        print(contents)
-        continue
 
-    for key, value in contents.items():
-        print(f"{key:30s} {value}")
\ No newline at end of file
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,318 @@
+########################################################################
+# Purdue Orbital, Flight Dynamics
+#
+# Project Name: Ascent / Descent Modeling
+#
+# Script Name: Batch Runner
+# File Name: batch_runner.py
+#
+# Contributors: Purdue Orbital Flight Dynamics Team
+# Date Created: 10/18/2026
+# Last Updated: 10/18/2026
+#
+# Script Description:
+#   Non-interactive command-line entry point: reads cases as JSON Lines or
+#   CSV from a file or stdin, solves each one and streams one JSON result
+#   line per case to stdout (or a file) as soon as it is available.
+#
+#   The script:
+#     - Runs ascent_solver_f ("ascent" mode), descent_solver_f ("descent")
+#       or run_flight_f ("flight") with the case fields in MODE_FIELDS
+#       (the case_fields tables, shared with the web service)
+#     - Reads and solves lazily, so arbitrarily long inputs stream through
+#       with constant memory
+#     - Fans cases out across worker processes (--workers), keeping at most
+#       IN_FLIGHT_PER_WORKER cases per worker queued
+#     - Writes results in input order (--order ordered) or as they finish
+#       (--order unordered); every record carries the case index (and the
+#       case "id" when given) so unordered output can be matched up
+#     - Records malformed cases and exceptions as data instead of stopping
+#
+# Notes:
+#   - Output record: {"index", "id", "error", "summary"}. error is set for
+#     unreadable cases and exceptions (summary is then null); solver
+#     validation errors and unattainable targets stay in the summary's
+#     "status" section.
+#   - CSV input needs a header row naming the fields; empty cells take the
+#     default. Fields outside MODE_FIELDS (other than "id") are errors.
+#   - Exit status 1 when any case has an error; a summary line goes to
+#     stderr. Output stops quietly if the reader closes the pipe.
+#
+# References:
+#   None
+#
+# Input Parameters (command line):
+#   - input: JSONL or CSV file, or "-" for stdin (default)
+#   - --mode: ascent, descent or flight
+#   - --format: jsonl or csv (default: from the file extension, else jsonl)
+#   - --output: result file (default stdout)
+#   - --workers: worker processes (1 -> serial in this process)
+#   - --order: ordered or unordered
+#   - --table-resolution: per-worker AtmosphereTable resolution, m
+#   - --timeline: include the flight timeline ("flight" mode)
+#
+# Output:
+#   - One JSON line per case
+#
+# Example:
+#   printf '{"start_altitude": 0, "burst_altitude": 25000, "target_rate": 5}\n' |
+#       python batch_runner.py --workers 4
+#
+########################################################################
+
+from __future__ import annotations
+
+import argparse
+import collections
+import csv
+import json
+import os
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+from ascent_simulation import ascent_solver_f
+from case_fields import (
+    DESCENT_FIELDS,
+    FLIGHT_FIELDS,
+    SOLVE_FIELDS,
+    init_worker_table_f,
+    parse_case_f,
+    worker_table_f,
+)
+from descent_simulation import descent_solver_f
+from flight_pipeline import run_flight_f
+from modules.json_safe_f import summary_json_f
+
+
+# --------------------------- CONSTANTS --------------------------------
+MODES = ("ascent", "descent", "flight")
+INPUT_FORMATS = ("jsonl", "csv")
+ORDERS = ("ordered", "unordered")
+IN_FLIGHT_PER_WORKER = 4        # cases queued per worker process
+
+# mode: field table (see case_fields)
+MODE_FIELDS = {
+    "ascent": SOLVE_FIELDS,
+    "descent": DESCENT_FIELDS,
+    "flight": FLIGHT_FIELDS,
+}
+# ---------------------------------------------------------------------
+
+
+def read_records_f(stream, input_format: str):
+    """
+    Yield one raw case dict per JSONL line or CSV row.
+
+    Blank JSONL lines are skipped; a line that is not a JSON object is
+    yielded as a string (the error message) so it becomes an error record.
+    CSV values stay strings and empty cells are dropped.
+    """
+    if input_format == "csv":
+        for row in csv.DictReader(stream):
+            yield {name.strip(): value.strip() for name, value in row.items() if name and value and value.strip()}
+        return
+
+    for line_number, line in enumerate(stream, start=1):
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+        except json.JSONDecodeError as exc:
+            yield f"line {line_number}: invalid JSON: {exc}"
+            continue
+        if not isinstance(record, dict):
+            yield f"line {line_number}: not a JSON object"
+            continue
+        yield record
+
+
+def _run_case_f(mode: str, params: dict, timeline: bool) -> tuple[str | None, str | None]:
+    """Solve one case; return (summary JSON, None) or (None, error message)."""
+    table = worker_table_f()
+    try:
+        if mode == "ascent":
+            summary = ascent_solver_f(atmosphere_table=table, **params)
+        elif mode == "descent":
+            summary = descent_solver_f(atmosphere_table=table, **params)
+        else:
+            if table is not None:
+                params = dict(params, atmosphere_table=table)
+            summary = run_flight_f(**params)
+            if not timeline:
+                summary.pop("timeline", None)
+        return summary_json_f(summary), None
+    except Exception as exc:
+        return None, f"{type(exc).__name__}: {exc}"
+
+
+def _result_line_f(index: int, case_id, summary_json: str | None, error: str | None) -> str:
+    """Format one output record (the summary JSON is inserted as is)."""
+    head = json.dumps({"index": index, "id": case_id, "error": error})
+    return f"{head[:-1]}, \"summary\": {summary_json or 'null'}}}\n"
+
+
+def run_batch_f(
+    records,
+    out,
+    mode: str = "ascent",
+    workers: int = 1,
+    order: str = "ordered",
+    table_resolution_m: float | None = None,
+    timeline: bool = False,
+) -> tuple[int, int]:
+    """
+    Solve every record and write one result line per case to out.
+
+    Input:
+    - records: iterable of raw case dicts (see read_records_f); strings are
+      reported as unreadable cases
+    - out: text stream; flushed after every line
+    - mode: one of MODES
+    - workers: worker processes (1 -> serial in this process)
+    - order: "ordered" (input order) or "unordered" (completion order)
+    - table_resolution_m: per-worker AtmosphereTable resolution, m, or None
+    - timeline: keep the flight timeline in "flight" mode
+
+    Output:
+    - (cases, errors) counts
+    """
+    if mode not in MODES:
+        raise ValueError(f"mode must be one of {MODES}")
+    if order not in ORDERS:
+        raise ValueError(f"order must be one of {ORDERS}")
+    fields = MODE_FIELDS[mode]
+
+    cases = 0
+    errors = 0
+
+    def emit(index: int, case_id, summary_json: str | None, error: str | None) -> None:
+        nonlocal errors
+        errors += error is not None
+        out.write(_result_line_f(index, case_id, summary_json, error))
+        out.flush()
+
+    def parsed():
+        """Yield (index, id, params or None, error or None) per record."""
+        nonlocal cases
+        for index, record in enumerate(records):
+            cases += 1
+            if isinstance(record, str):
+                yield index, None, None, record
+                continue
+            case_id = record.get("id")
+            case = {name: value for name, value in record.items() if name != "id"}
+            try:
+                yield index, case_id, parse_case_f(case, fields, strings=True), None
+            except ValueError as exc:
+                yield index, case_id, None, str(exc)
+
+    if workers <= 1:
+        init_worker_table_f(table_resolution_m)
+        for index, case_id, params, error in parsed():
+            if error is None:
+                emit(index, case_id, *_run_case_f(mode, params, timeline))
+            else:
+                emit(index, case_id, None, error)
+        return cases, errors
+
+    max_in_flight = workers * IN_FLIGHT_PER_WORKER
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=init_worker_table_f,
+        initargs=(table_resolution_m,),
+    ) as executor:
+        # ordered: queue of (index, id, future or None, error) in input order
+        # unordered: {future: (index, id)}
+        queue = collections.deque()
+        running = {}
+
+        def drain(limit: int) -> None:
+            """Write finished results until at most limit cases are in flight."""
+            if order == "ordered":
+                while queue and (len(queue) > limit or queue[0][2] is None or queue[0][2].done()):
+                    index, case_id, future, error = queue.popleft()
+                    if future is None:
+                        emit(index, case_id, None, error)
+                    else:
+                        emit(index, case_id, *future.result())
+            else:
+                while len(running) > limit:
+                    done, _ = wait(running, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        emit(*running.pop(future), *future.result())
+
+        for index, case_id, params, error in parsed():
+            if error is not None:
+                if order == "ordered":
+                    queue.append((index, case_id, None, error))
+                else:
+                    emit(index, case_id, None, error)
+                continue
+
+            future = executor.submit(_run_case_f, mode, params, timeline)
+            if order == "ordered":
+                queue.append((index, case_id, future, None))
+            else:
+                running[future] = (index, case_id)
+            drain(max_in_flight - 1)
+
+        drain(0)
+
+    return cases, errors
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Solve ascent, descent or flight cases from JSONL/CSV and stream JSONL results."
+    )
+    parser.add_argument("input", nargs="?", default="-", help="case file, or - for stdin (default)")
+    parser.add_argument("--mode", choices=MODES, default="ascent")
+    parser.add_argument("--format", choices=INPUT_FORMATS, default=None,
+                        help="input format (default: from the file extension, else jsonl)")
+    parser.add_argument("--output", default="-", help="result file, or - for stdout (default)")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="worker processes; 0 -> CPU count, 1 -> serial (default)")
+    parser.add_argument("--order", choices=ORDERS, default="ordered",
+                        help="write results in input order or as they finish")
+    parser.add_argument("--table-resolution", type=float, default=None,
+                        help="per-worker AtmosphereTable resolution, m (default: exact model)")
+    parser.add_argument("--timeline", action="store_true", help="include the flight timeline (flight mode)")
+    args = parser.parse_args()
+
+    input_format = args.format
+    if input_format is None:
+        input_format = "csv" if args.input.lower().endswith(".csv") else "jsonl"
+    workers = args.workers if args.workers > 0 else (os.cpu_count() or 1)
+
+    source = sys.stdin if args.input == "-" else open(args.input, newline="", encoding="utf-8")
+    out = sys.stdout if args.output == "-" else open(args.output, "w", encoding="utf-8")
+    start = time.perf_counter()
+    try:
+        cases, errors = run_batch_f(
+            read_records_f(source, input_format),
+            out,
+            mode=args.mode,
+            workers=workers,
+            order=args.order,
+            table_resolution_m=args.table_resolution,
+            timeline=args.timeline,
+        )
+    except BrokenPipeError:
+        # The reader went away (e.g. "| head"); silence the flush at exit
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        raise SystemExit(1)
+    finally:
+        if source is not sys.stdin:
+            source.close()
+        if out is not sys.stdout:
+            out.close()
+
+    elapsed = time.perf_counter() - start
+    print(f"{cases} cases, {errors} errors, {elapsed:.2f} s", file=sys.stderr)
+    if errors:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
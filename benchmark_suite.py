@@ -0,0 +1,381 @@
+########################################################################
+# Purdue Orbital, Flight Dynamics
+#
+# Project Name: Ascent / Descent Modeling
+#
+# Script Name: Benchmark Suite
+# File Name: benchmark_suite.py
+#
+# Contributors: Purdue Orbital Flight Dynamics Team
+# Date Created: 10/18/2026
+# Last Updated: 10/18/2026
+#
+# Script Description:
+#   Times the simulation hot paths one by one, records their peak Python
+#   memory, writes the results as a JSON baseline and compares a run
+#   against a stored baseline with configurable regression thresholds.
+#
+#   The script:
+#     - Registers one benchmark per hot path (_benchmarks_f): atmosphere_m
+#       (scalar and array), AtmosphereTable lookups, every modules/*_f
+#       force function, simulate_ascent_rate_f, simulate_ascent_motion_f,
+#       solve_helium_mass_f for representative flights and the descent
+#       loop
+#     - Times each benchmark with time.perf_counter: calls are batched until
+#       a batch lasts at least min_time, and the best of repeat batches
+#       gives the time per call
+#     - Measures peak traced memory of one call with tracemalloc, in a
+#       separate untimed run (tracing slows the code down)
+#     - Writes {"environment", "results"} JSON and, given a baseline,
+#       flags every benchmark slower (or larger) than the baseline by more
+#       than its threshold; the exit status is 1 if any regressed
+#
+# Notes:
+#   - Thresholds are relative: 0.10 allows a run 10 % slower than the
+#     baseline. Per-benchmark overrides take "name=fraction". Peaks below
+#     MIN_COMPARED_PEAK_BYTES in the baseline are not compared.
+#   - Timings are only comparable on the same machine and environment;
+#     the baseline records Python, NumPy and JIT availability to make a
+#     mismatch visible.
+#
+# References:
+#   None
+#
+# Usage:
+#   python benchmark_suite.py --output baseline.json
+#   python benchmark_suite.py --baseline baseline.json --threshold 0.15
+#   python benchmark_suite.py --filter solve --list
+#
+########################################################################
+
+from __future__ import annotations
+
+import argparse
+import fnmatch
+import json
+import platform
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+
+from ascent_simulation import simulate_ascent_rate_f, solve_helium_mass_f
+from descent_simulation import simulate_descent_f
+from modules import march_kernels_f
+from modules.ascent_forces_f import ascent_forces_f
+from modules.atmosphere_f import AtmosphereTable, atmosphere_m
+from modules.balloon_cross_sectional_area_f import balloon_cross_sectional_area_f
+from modules.balloon_density_f import balloon_density_f
+from modules.buoyant_force_f import buoyant_force_f
+from modules.drag_force_descent_f import PARACHUTE_AREA_M2, drag_force_descent_f
+from modules.drag_force_f import drag_force_f
+from modules.force_correction_f import force_correction_f
+from modules.gravity_acceleration_f import gravity_acceleration_f
+from modules.gravity_force_f import gravity_force_f
+from modules.helium_mass_f import helium_mass_f
+from modules.simulate_ascent_motion_f import simulate_ascent_motion_f
+from modules.system_m_f import system_mass_f
+from modules.volume_balloon_f import volume_balloon_f
+
+
+# --------------------------- CONSTANTS --------------------------------
+BASELINE_FORMAT = 1             # JSON layout version
+DEFAULT_MIN_TIME = 0.2          # shortest timed batch, s
+DEFAULT_REPEAT = 5              # timed batches per benchmark (best is kept)
+DEFAULT_THRESHOLD = 0.10        # allowed relative slowdown
+DEFAULT_MEMORY_THRESHOLD = 0.20  # allowed relative peak-memory growth
+MIN_COMPARED_PEAK_BYTES = 4096  # smaller peaks are noise and not compared, bytes
+
+# Representative flight: sea-level launch, 30 km burst, 5 m/s
+START_ALTITUDE = 0.0            # m
+BURST_ALTITUDE = 30_000.0       # m
+TARGET_RATE = 5.0               # m/s
+HELIUM_MASS = 1.79              # kg, close to the solution for the flight above
+PROBE_ALTITUDE = 12_345.0       # m, altitude for the per-call force benchmarks
+PROBE_VELOCITY = 5.0            # m/s
+PROBE_SYSTEM_MASS = 10.59       # kg
+# ---------------------------------------------------------------------
+
+
+def _benchmarks_f() -> dict:
+    """Return {name: zero-argument callable}, in run order."""
+    atm = atmosphere_m(PROBE_ALTITUDE, geometric=True, output="state")
+    table = AtmosphereTable()
+    altitudes_m = np.linspace(0.0, BURST_ALTITUDE, 1000)
+
+    return {
+        # --- Atmosphere
+        "atmosphere_m.scalar": lambda: atmosphere_m(PROBE_ALTITUDE, geometric=True, output="state"),
+        "atmosphere_m.array_1000": lambda: atmosphere_m(altitudes_m, geometric=True, output="state"),
+        "atmosphere_table.scalar": lambda: table.atmosphere_m(PROBE_ALTITUDE, geometric=True, output="state"),
+
+        # --- Force functions (one atmosphere sample, as in the loops)
+        "ascent_forces_f": lambda: ascent_forces_f(
+            PROBE_ALTITUDE, PROBE_VELOCITY, HELIUM_MASS, PROBE_SYSTEM_MASS, atm=atm,
+        ),
+        "balloon_cross_sectional_area_f": lambda: balloon_cross_sectional_area_f(PROBE_ALTITUDE, HELIUM_MASS, atm=atm),
+        "balloon_density_f": lambda: balloon_density_f(PROBE_ALTITUDE, atm=atm),
+        "buoyant_force_f": lambda: buoyant_force_f(PROBE_ALTITUDE, HELIUM_MASS, atm=atm),
+        "drag_force_f": lambda: drag_force_f(PROBE_VELOCITY, HELIUM_MASS, PROBE_ALTITUDE, atm=atm),
+        "drag_force_descent_f": lambda: drag_force_descent_f(
+            -PROBE_VELOCITY, PROBE_ALTITUDE, PARACHUTE_AREA_M2, atm=atm,
+        ),
+        "force_correction_f": lambda: force_correction_f(HELIUM_MASS, PROBE_ALTITUDE),
+        "gravity_acceleration_f": lambda: gravity_acceleration_f(PROBE_ALTITUDE),
+        "gravity_force_f": lambda: gravity_force_f(PROBE_ALTITUDE, PROBE_SYSTEM_MASS),
+        "helium_mass_f": lambda: helium_mass_f(START_ALTITUDE, 20.0),
+        "system_mass_f": lambda: system_mass_f(START_ALTITUDE, 20.0),
+        "volume_balloon_f": lambda: volume_balloon_f(PROBE_ALTITUDE, HELIUM_MASS, atm=atm),
+
+        # --- Ascent
+        "simulate_ascent_rate_f.euler": lambda: simulate_ascent_rate_f(START_ALTITUDE, BURST_ALTITUDE, HELIUM_MASS),
+        "simulate_ascent_rate_f.rk45": lambda: simulate_ascent_rate_f(
+            START_ALTITUDE, BURST_ALTITUDE, HELIUM_MASS, integrator="rk45",
+        ),
+        "simulate_ascent_motion_f.euler": lambda: simulate_ascent_motion_f(
+            HELIUM_MASS, START_ALTITUDE, BURST_ALTITUDE, make_plots=False,
+        ),
+        "solve_helium_mass_f.brent": lambda: solve_helium_mass_f(START_ALTITUDE, BURST_ALTITUDE, TARGET_RATE),
+        "solve_helium_mass_f.quasi_steady_bracket": lambda: solve_helium_mass_f(
+            START_ALTITUDE, BURST_ALTITUDE, TARGET_RATE, quasi_steady_bracket=True,
+        ),
+        "solve_helium_mass_f.high_launch_table": lambda: solve_helium_mass_f(
+            1500.0, 25_000.0, 4.0, atmosphere_table=table, quasi_steady_bracket=True,
+        ),
+
+        # --- Descent
+        "simulate_descent_f.euler": lambda: simulate_descent_f(BURST_ALTITUDE, START_ALTITUDE),
+        "simulate_descent_f.rk45": lambda: simulate_descent_f(BURST_ALTITUDE, START_ALTITUDE, integrator="rk45"),
+    }
+
+
+def time_call_f(function, min_time: float = DEFAULT_MIN_TIME, repeat: int = DEFAULT_REPEAT) -> dict:
+    """
+    Time a zero-argument callable.
+
+    Calls are batched (1, 2, 5, 10, 20, ...) until one batch lasts at least
+    min_time; that batch size is then timed repeat times.
+
+    Output (dict):
+    - seconds: best time per call, s
+    - median_seconds: median time per call over the batches, s
+    - calls: calls per batch
+    """
+    calls = 1
+    steps = (2, 2.5, 2)
+    step_index = 0
+    while True:
+        start = time.perf_counter()
+        for _ in range(calls):
+            function()
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time:
+            break
+        calls = int(calls * steps[step_index % 3])
+        step_index += 1
+
+    per_call = [elapsed / calls]
+    for _ in range(max(int(repeat), 1) - 1):
+        start = time.perf_counter()
+        for _ in range(calls):
+            function()
+        per_call.append((time.perf_counter() - start) / calls)
+
+    return {
+        "seconds": min(per_call),
+        "median_seconds": float(np.median(per_call)),
+        "calls": calls,
+    }
+
+
+def peak_memory_f(function) -> int:
+    """Return the peak traced memory of one call, bytes."""
+    tracemalloc.start()
+    try:
+        tracemalloc.reset_peak()
+        baseline_bytes = tracemalloc.get_traced_memory()[0]
+        function()
+        peak_bytes = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return max(peak_bytes - baseline_bytes, 0)
+
+
+def environment_f() -> dict:
+    """Describe the machine and libraries a run was measured with."""
+    return {
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "jit": march_kernels_f.JIT_AVAILABLE and march_kernels_f.USE_JIT,
+    }
+
+
+def run_benchmarks_f(
+    patterns=None,
+    min_time: float = DEFAULT_MIN_TIME,
+    repeat: int = DEFAULT_REPEAT,
+    memory: bool = True,
+    progress=None,
+) -> dict:
+    """
+    Run the selected benchmarks.
+
+    Input:
+    - patterns: fnmatch patterns selecting benchmark names (None -> all)
+    - min_time, repeat: time_call_f options
+    - memory: also measure peak memory
+    - progress: optional callable(name, result) called after each benchmark
+
+    Output:
+    - {"format", "environment", "results": {name: time_call_f dict plus
+      peak_bytes}}
+    """
+    results = {}
+    for name, function in _benchmarks_f().items():
+        if patterns and not any(fnmatch.fnmatch(name, pattern) for pattern in patterns):
+            continue
+        function()  # warm-up (imports, caches, JIT compilation)
+        result = time_call_f(function, min_time, repeat)
+        result["peak_bytes"] = peak_memory_f(function) if memory else None
+        results[name] = result
+        if progress is not None:
+            progress(name, result)
+
+    return {"format": BASELINE_FORMAT, "environment": environment_f(), "results": results}
+
+
+def compare_f(
+    current: dict,
+    baseline: dict,
+    threshold: float = DEFAULT_THRESHOLD,
+    memory_threshold: float = DEFAULT_MEMORY_THRESHOLD,
+    overrides: dict | None = None,
+) -> list[dict]:
+    """
+    Compare a run against a baseline.
+
+    Input:
+    - current, baseline: run_benchmarks_f outputs (or loaded JSON)
+    - threshold: allowed relative slowdown
+    - memory_threshold: allowed relative peak-memory growth
+    - overrides: {name: threshold} per-benchmark time thresholds
+
+    Output (list of dicts, one per benchmark in both runs):
+    - name, baseline_seconds, seconds, ratio, peak_ratio, regressed
+    """
+    overrides = overrides or {}
+    rows = []
+    for name, result in current["results"].items():
+        reference = baseline["results"].get(name)
+        if reference is None:
+            continue
+
+        ratio = result["seconds"] / reference["seconds"]
+        allowed = overrides.get(name, threshold)
+        regressed = ratio > 1.0 + allowed
+
+        peak_ratio = None
+        if result.get("peak_bytes") is not None and (reference.get("peak_bytes") or 0) >= MIN_COMPARED_PEAK_BYTES:
+            peak_ratio = result["peak_bytes"] / reference["peak_bytes"]
+            regressed = regressed or peak_ratio > 1.0 + memory_threshold
+
+        rows.append({
+            "name": name,
+            "baseline_seconds": reference["seconds"],
+            "seconds": result["seconds"],
+            "ratio": ratio,
+            "peak_ratio": peak_ratio,
+            "regressed": regressed,
+        })
+    return rows
+
+
+def _format_seconds(seconds: float) -> str:
+    """Format a duration with a readable unit."""
+    for unit, scale in (("s", 1.0), ("ms", 1e-3), ("us", 1e-6)):
+        if seconds >= scale:
+            return f"{seconds / scale:8.3f} {unit}"
+    return f"{seconds / 1e-9:8.1f} ns"
+
+
+def _parse_overrides(items) -> dict:
+    """Parse "name=fraction" threshold overrides."""
+    overrides = {}
+    for item in items or ():
+        name, _, value = item.partition("=")
+        if not value:
+            raise argparse.ArgumentTypeError(f"expected name=fraction, got {item!r}")
+        overrides[name] = float(value)
+    return overrides
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Time the ascent/descent simulation hot paths.")
+    parser.add_argument("--filter", action="append", metavar="PATTERN",
+                        help="only run benchmarks matching this fnmatch pattern (repeatable)")
+    parser.add_argument("--list", action="store_true", help="list benchmark names and exit")
+    parser.add_argument("--output", metavar="FILE", help="write the results as a JSON baseline")
+    parser.add_argument("--baseline", metavar="FILE", help="compare against this JSON baseline")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="allowed relative slowdown (default %(default)s)")
+    parser.add_argument("--memory-threshold", type=float, default=DEFAULT_MEMORY_THRESHOLD,
+                        help="allowed relative peak-memory growth (default %(default)s)")
+    parser.add_argument("--threshold-for", action="append", metavar="NAME=FRACTION",
+                        help="per-benchmark slowdown threshold (repeatable)")
+    parser.add_argument("--min-time", type=float, default=DEFAULT_MIN_TIME,
+                        help="shortest timed batch in seconds (default %(default)s)")
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT,
+                        help="timed batches per benchmark (default %(default)s)")
+    parser.add_argument("--no-memory", action="store_true", help="skip the tracemalloc peak-memory runs")
+    args = parser.parse_args(argv)
+
+    if args.list:
+        for name in _benchmarks_f():
+            if not args.filter or any(fnmatch.fnmatch(name, pattern) for pattern in args.filter):
+                print(name)
+        return 0
+
+    overrides = _parse_overrides(args.threshold_for)
+
+    def progress(name: str, result: dict) -> None:
+        peak = "" if result["peak_bytes"] is None else f"  peak {result['peak_bytes'] / 1024:10.1f} KiB"
+        print(f"{name:45s} {_format_seconds(result['seconds'])}{peak}", flush=True)
+
+    run = run_benchmarks_f(args.filter, args.min_time, args.repeat, not args.no_memory, progress)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as handle:
+            json.dump(run, handle, indent=2, sort_keys=True)
+        print(f"wrote {args.output}")
+
+    if not args.baseline:
+        return 0
+
+    with open(args.baseline, encoding="utf-8") as handle:
+        baseline = json.load(handle)
+    if baseline.get("environment") != run["environment"]:
+        print("warning: baseline was recorded in a different environment", file=sys.stderr)
+
+    rows = compare_f(run, baseline, args.threshold, args.memory_threshold, overrides)
+    print()
+    print(f"{'benchmark':45s} {'baseline':>11s} {'current':>11s}  ratio   peak")
+    for row in rows:
+        peak = "   -" if row["peak_ratio"] is None else f"{row['peak_ratio']:5.2f}"
+        flag = "  REGRESSED" if row["regressed"] else ""
+        print(
+            f"{row['name']:45s} {_format_seconds(row['baseline_seconds'])} "
+            f"{_format_seconds(row['seconds'])}  {row['ratio']:5.2f}  {peak}{flag}"
+        )
+
+    regressions = [row["name"] for row in rows if row["regressed"]]
+    if regressions:
+        print(f"\n{len(regressions)} regression(s): {', '.join(regressions)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
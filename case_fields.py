@@ -0,0 +1,187 @@
+########################################################################
+# Purdue Orbital, Flight Dynamics
+#
+# Project Name: Ascent / Descent Modeling
+#
+# Script Name: Case Fields
+# File Name: case_fields.py
+#
+# Contributors: Purdue Orbital Flight Dynamics Team
+# Date Created: 10/18/2026
+# Last Updated: 10/18/2026
+#
+# Script Description:
+#   Case definitions shared by the entry points that take cases from
+#   outside Python (the web service, ascent_web_integration.py, and the
+#   batch runner, batch_runner.py) and the per-process atmosphere table
+#   used by every process pool (those two and ascent_sweep.py).
+#
+#   The script:
+#     - Defines the field tables of an ascent solve (SOLVE_FIELDS), a
+#       descent solve (DESCENT_FIELDS) and a whole flight (FLIGHT_FIELDS):
+#       field name, type and default
+#     - Validates a raw case against a table with parse_case_f: unknown and
+#       missing fields, wrongly typed or non-finite numbers and values
+#       outside CHOICES raise ValueError
+#     - Builds one AtmosphereTable per worker process (init_worker_table_f)
+#       and hands it to the cases that process runs (worker_table_f)
+#
+# Notes:
+#   - Defaults are the solver defaults, so a case that omits a field runs
+#     exactly like a direct call that omits the argument.
+#   - strings=True also accepts numbers and booleans written as strings
+#     (CSV cells); JSON requests keep strict types.
+#
+# References:
+#   None
+#
+# Input Parameters:
+#   - record: raw case dict (JSON values, or strings with strings=True)
+#   - fields: one of the field tables
+#
+# Output:
+#   - parse_case_f: dict with every field of the table, defaults filled in
+#
+########################################################################
+
+from __future__ import annotations
+
+import math
+
+from ascent_simulation import CONSTANT_MASS, INTEGRATORS, SOLVER_METHOD, SOLVER_METHODS
+from descent_simulation import DESCENT_MASS
+from modules.atmosphere_f import AtmosphereTable
+from modules.drag_force_descent_f import PARACHUTE_AREA_M2
+
+
+# --------------------------- CONSTANTS --------------------------------
+REQUIRED = object()             # default marking a field that must be present
+
+# name: (type, default); REQUIRED fields must be present
+SOLVE_FIELDS = {
+    "start_altitude": (float, REQUIRED),
+    "burst_altitude": (float, REQUIRED),
+    "target_rate": (float, REQUIRED),
+    "constant_mass": (float, CONSTANT_MASS),
+    "method": (str, SOLVER_METHOD),
+    "integrator": (str, "euler"),
+    "quasi_steady_bracket": (bool, False),
+    "flight_summary": (bool, False),
+}
+DESCENT_FIELDS = {
+    "burst_altitude": (float, REQUIRED),
+    "ground_level": (float, REQUIRED),
+    "burst_velocity": (float, 0.0),
+    "drag_area": (float, PARACHUTE_AREA_M2),
+    "descent_mass": (float, DESCENT_MASS),
+    "integrator": (str, "euler"),
+}
+FLIGHT_FIELDS = {
+    "start_altitude": (float, REQUIRED),
+    "burst_altitude": (float, REQUIRED),
+    "target_rate": (float, REQUIRED),
+    "ground_level": (float, None),
+    "constant_mass": (float, CONSTANT_MASS),
+    "drag_area": (float, PARACHUTE_AREA_M2),
+    "descent_mass": (float, None),
+    "method": (str, SOLVER_METHOD),
+    "integrator": (str, "euler"),
+    "quasi_steady_bracket": (bool, True),
+    "record_every": (int, 10),
+}
+CHOICES = {
+    "method": SOLVER_METHODS,
+    "integrator": INTEGRATORS,
+}
+_TRUE_STRINGS = ("true", "1", "yes")
+_FALSE_STRINGS = ("false", "0", "no")
+# ---------------------------------------------------------------------
+
+_WORKER_TABLE: AtmosphereTable | None = None
+
+
+def _convert_f(name: str, kind: type, value, strings: bool):
+    """Convert one value to the field type (ValueError if it does not fit)."""
+    if kind is float:
+        if strings and isinstance(value, str):
+            try:
+                value = float(value)
+            except ValueError:
+                raise ValueError(f"{name} must be float") from None
+        elif not isinstance(value, (int, float)) or isinstance(value, bool):
+            raise ValueError(f"{name} must be float")
+        try:
+            value = float(value)
+        except OverflowError:
+            value = math.inf
+        if not math.isfinite(value):
+            raise ValueError(f"{name} must be a finite number")
+        return value
+
+    if strings and isinstance(value, str) and kind is not str:
+        text = value.lower()
+        if kind is bool:
+            if text in _TRUE_STRINGS or text in _FALSE_STRINGS:
+                return text in _TRUE_STRINGS
+        else:
+            try:
+                return kind(value)
+            except ValueError:
+                pass
+    elif kind is bool:
+        if isinstance(value, bool):
+            return value
+    elif kind is int:
+        if isinstance(value, int) and not isinstance(value, bool):
+            return value
+    elif isinstance(value, str):
+        return value
+    raise ValueError(f"{name} must be {kind.__name__}")
+
+
+def parse_case_f(record: dict, fields: dict, strings: bool = False) -> dict:
+    """
+    Validate one case against a field table.
+
+    Input:
+    - record: raw case dict; a None value counts as missing
+    - fields: {name: (type, default)} (SOLVE_FIELDS, DESCENT_FIELDS or
+      FLIGHT_FIELDS)
+    - strings: also accept numbers and booleans written as strings
+
+    Output:
+    - dict with every field, defaults filled in and numbers converted;
+      raises ValueError on unknown or missing fields, wrongly typed or
+      non-finite values (NaN, infinity, numbers too large for a float) and
+      values outside CHOICES
+    """
+    unknown = sorted(set(record) - set(fields))
+    if unknown:
+        raise ValueError(f"unknown fields: {', '.join(unknown)}")
+
+    params = {}
+    for name, (kind, default) in fields.items():
+        if record.get(name) is None:
+            if default is REQUIRED:
+                raise ValueError(f"missing field: {name}")
+            params[name] = default
+            continue
+        value = _convert_f(name, kind, record[name], strings)
+        if name in CHOICES and value not in CHOICES[name]:
+            raise ValueError(f"{name} must be one of {CHOICES[name]}")
+        params[name] = value
+
+    if params.get("record_every", 1) < 1:
+        raise ValueError("record_every must be at least 1")
+    return params
+
+
+def init_worker_table_f(table_resolution_m: float | None) -> None:
+    """Build this process's AtmosphereTable once (pool initializer); None -> exact model."""
+    global _WORKER_TABLE
+    _WORKER_TABLE = None if table_resolution_m is None else AtmosphereTable(table_resolution_m)
+
+
+def worker_table_f() -> AtmosphereTable | None:
+    """Return the AtmosphereTable built by init_worker_table_f in this process."""
+    return _WORKER_TABLE
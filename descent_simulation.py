@@ -4,11 +4,12 @@
 # Project Name: Ascent/Descent Modeling
 #
 # Function Name: descent_simulation_driver
-# File Name: descent_simulation_driver.py
+# File Name: descent_simulation.py
 #
-# Contributors: Samuel Landers, Aanand Shah, Garion Cheng
+# Contributors: Samuel Landers, Aanand Shah, Garion Cheng,
+#               Purdue Orbital Flight Dynamics Team
 # Date Created: 02/04/2026
-# Last Updated: 02/16/2026
+# Last Updated: 10/18/2026
 #
 # Function Description:
 #   Simulates vertical descent of the high-altitude balloon (HAB)
@@ -18,108 +19,611 @@
 #       Upward direction is positive.
 #       During descent, velocity is negative.
 #
-#   Inputs (user prompt):
+#   The script:
+#     - Exposes descent_solver_f, returning the same structured summary
+#       sections as ascent_solver_f (inputs, results, limits, solver,
+#       status), with no terminal I/O
+#     - Integrates whole arrays of burst altitudes, burst velocities and
+#       drag areas in lockstep with descent_solver_batch_f
+#     - Records the descent time history with simulate_descent_trajectory_f
+#     - Runs the fixed-step march as a compiled kernel when Numba is
+#       installed (modules.march_kernels_f), else in Python
+#     - Evaluates the atmosphere once per step and passes it to
+#       drag_force_descent_f
+#     - Optionally integrates adaptively (integrator="rk45", see
+#       simulate_descent_adaptive_f): exact ground impact and a
+#       terminal-velocity quadrature once the descent is quasi-steady, so
+#       full-length descents need a few hundred steps
+#     - Prompts for inputs only when run as a script (main)
+#
+#   Inputs:
 #   - burst_altitude: initial altitude, meters, positive
 #   - ground_level: ground altitude, meters, positive
 #   - burst_velocity: velocity at burst, m/s, varies (negative for descent)
+#   - drag_area: balloon/parachute drag area, m^2, positive
 #
 #   Outputs:
-#   - Prints average descent rate, m/s, positive magnitude
+#   - Average descent rate, m/s, positive magnitude
+#   - Descent time, s
 #
 # References:
 #   N/A
 #
 #************************************************************************
 
-#import numpy as np
+from __future__ import annotations
 
+import math
 
-import statistics
+import numpy as np
 
-from modules.drag_force_descent_f import drag_force_descent_f
+from modules import march_kernels_f
+from modules.atmosphere_f import AtmosphereTable, atmosphere_m
+from modules.drag_force_descent_f import DRAG_COEFF_DESCENT, PARACHUTE_AREA_M2, drag_force_descent_f
+from modules.gravity_acceleration_f import EARTH_RADIUS_M, STANDARD_GRAVITY_MPS2
 from modules.gravity_force_f import gravity_force_f
-from modules.system_m_f import system_mass_f
+from modules.simulate_descent_adaptive_f import simulate_descent_adaptive_f
 
 
 # --- Simulation constants
-DT = 0.1            # time step, seconds
-STOP_STEPS = 10000   # maximum iteration steps, dimensionless
+DT = 0.1               # time step, seconds
+STOP_STEPS = 100_000   # maximum iteration steps (10,000 s of descent), dimensionless
+DESCENT_MASS = 8.8     # descending system mass, kg
+BATCH_SCALAR_LANES = 4  # lanes left when a batch finishes per lane
+INTEGRATORS = ("euler", "rk45")
 
 
-# --- User inputs (SI units)
-burst_altitude = float(input("Enter balloon burst altitude (m): "))  # m, positive
-ground_level = float(input("Enter ground level (m): "))              # m, positive
-burst_velocity = float(input("Enter velocity at burst (m/s): "))     # m/s, varies
-cross_sec_area = float(input("Enter balloon area (m^2): "))
+def validate_descent_inputs_f(
+    burst_altitude: float,
+    ground_level: float,
+    drag_area: float,
+    descent_mass: float,
+    burst_velocity: float = 0.0,
+) -> str | None:
+    """
+    Validate descent inputs.
 
-# --- Initial state
-current_time = 0.0            # seconds
-position = burst_altitude     # meters
-velocity = burst_velocity     # m/s
-acceleration = 0.0            # m/s^2
-total_mass = 8.8
+    Output:
+    - error message, or None if the inputs are valid
+    """
+    if not all(
+        math.isfinite(value) for value in (burst_altitude, ground_level, drag_area, descent_mass, burst_velocity)
+    ):
+        return "burst_altitude, ground_level, burst_velocity, drag_area and descent_mass must be finite"
+    if ground_level < 0:
+        return "ground_level must be non-negative"
+    if burst_altitude <= ground_level:
+        return "burst_altitude must be greater than ground_level"
+    if drag_area <= 0:
+        return "drag_area must be positive"
+    if descent_mass <= 0:
+        return "descent_mass must be positive"
+    return None
 
 
-# --- Data logging vectors
-time_log = [current_time]     # seconds
-position_log = [position]     # meters
-velocity_log = [velocity]     # m/s
-acceleration_log = [acceleration]  # m/s^2
+def _march_descent_f(
+    position: float,
+    velocity: float,
+    ground_level: float,
+    drag_area: float,
+    descent_mass: float,
+    atmosphere_lookup,
+    max_steps: int,
+    history: list | None = None,
+) -> tuple[float, int, int, float, float]:
+    """
+    Forward-Euler descent march for one lane from a given state to the ground.
 
+    Shared by simulate_descent_f, simulate_descent_trajectory_f and the tail
+    of simulate_descent_batch_f so all follow the same update. If history
+    is a list, (position, velocity, acceleration) at the start of every
+    step is appended to it.
 
-step_index = 0
+    Output:
+    - speed_sum: sum of descent speeds (-v) over steps with v < 0, m/s
+    - speed_count: number of those steps
+    - steps: number of completed steps
+    - position: final altitude, m
+    - velocity: final velocity, m/s
+    """
+    if march_kernels_f.USE_JIT and history is None and atmosphere_lookup is atmosphere_m:
+        return march_kernels_f.descent_march_kernel_f(
+            position, velocity, ground_level, drag_area, descent_mass, DRAG_COEFF_DESCENT, DT, max_steps,
+        )
 
+    speed_sum = 0.0
+    speed_count = 0
+    steps = 0
 
-#************************************************************************
-# Simulation Loop
-#************************************************************************
-while position > ground_level:
+    while position > ground_level and steps < max_steps:
+        atmosphere = atmosphere_lookup(position, geometric=True, output="state")
 
-    if step_index >= STOP_STEPS:
-        break
+        # --- Gravity force (downward = negative since upward is positive)
+        gravity_force = -gravity_force_f(position, descent_mass)  # N
 
-    # --- Gravity force (must be downward = negative if upward is positive)
-    gravity_force = -abs(gravity_force_f(position, total_mass))  # N
+        # --- Drag force (opposes velocity direction)
+        drag_force = drag_force_descent_f(velocity, position, drag_area, atm=atmosphere)  # N
+        if velocity > 0:
+            drag_force = -drag_force
+        elif velocity == 0:
+            drag_force = 0.0
 
-    # --- Drag force (must oppose velocity direction)
-    drag_force = drag_force_descent_f(velocity, position, cross_sec_area)  # N
+        # --- State update (Forward Euler)
+        acceleration = (gravity_force + drag_force) / descent_mass  # m/s^2
+        if history is not None:
+            history.append((position, velocity, acceleration))
+        velocity = velocity + acceleration * DT                     # m/s
+        position = position + velocity * DT                         # m
+        steps += 1
 
-    # If drag function returns magnitude only, enforce correct sign
-    if velocity > 0:
-        drag_force = -abs(drag_force)
-    elif velocity < 0:
-        drag_force = abs(drag_force)
-    else:
-        drag_force = 0.0
+        if velocity < 0:
+            speed_sum -= velocity
+            speed_count += 1
 
-    # --- Net force
-    net_force = gravity_force + drag_force  # N
-    # print(net_force)
+    return speed_sum, speed_count, steps, position, velocity
 
-    # --- State update (Forward Euler)
-    acceleration = net_force / total_mass         # m/s^2
-    velocity = velocity + acceleration * DT      # m/s
-    position = position + velocity * DT          # m
-    current_time = current_time + DT             # s
 
-    # --- Log state
-    time_log.append(current_time)
-    position_log.append(position)
-    velocity_log.append(velocity)
-    acceleration_log.append(acceleration)
-    print(acceleration)
-    step_index += 1
+def simulate_descent_f(
+    burst_altitude: float,
+    ground_level: float,
+    burst_velocity: float = 0.0,
+    drag_area: float = PARACHUTE_AREA_M2,
+    descent_mass: float = DESCENT_MASS,
+    atmosphere_table: AtmosphereTable | None = None,
+    integrator: str = "euler",
+) -> dict:
+    """
+    Simulate descent from burst to the ground for one case.
 
+    With "euler" the average descent rate is the mean descent speed over
+    the burst state and every post-step state that is moving down, as in
+    the original script. With "rk45" it is the time-averaged rate,
+    (burst_altitude - ground_level) / descent_time, and the descent ends
+    exactly on ground_level.
 
-#************************************************************************
-# Statistics
-#************************************************************************
+    Input:
+    - burst_altitude: initial altitude, m
+    - ground_level: ground altitude, m
+    - burst_velocity: velocity at burst, m/s (negative is down)
+    - drag_area: balloon/parachute drag area, m^2
+    - descent_mass: descending system mass, kg
+    - atmosphere_table: optional AtmosphereTable used instead of the exact
+      atmosphere model at every step
+    - integrator: "euler" (fixed DT) or "rk45" (adaptive)
+
+    Output (dict):
+    - average_descent_rate: m/s, positive magnitude
+    - descent_time: s
+    - impact_velocity: velocity at the last step, m/s
+    - steps: number of completed (accepted) steps
+    - hit_step_limit: True if STOP_STEPS was reached above the ground
+    """
+    if integrator not in INTEGRATORS:
+        raise ValueError(f"integrator must be one of {INTEGRATORS}")
+
+    if integrator == "rk45":
+        descent = simulate_descent_adaptive_f(
+            burst_altitude,
+            ground_level,
+            burst_velocity,
+            drag_area,
+            descent_mass,
+            max_steps=STOP_STEPS,
+            record_history=False,
+            atmosphere_table=atmosphere_table,
+        )
+        return {
+            "average_descent_rate": descent["mean_descent_rate_mps"],
+            "descent_time": descent["descent_time_s"],
+            "impact_velocity": descent["impact_velocity_mps"],
+            "steps": descent["steps"],
+            # an aborted integration also stopped above the ground, as the
+            # Euler march's position > ground_level
+            "hit_step_limit": descent["hit_step_limit"] or descent["had_error"],
+        }
+
+    atmosphere_lookup = atmosphere_m if atmosphere_table is None else atmosphere_table.atmosphere_m
+
+    speed_sum, speed_count, steps, position, velocity = _march_descent_f(
+        burst_altitude,
+        burst_velocity,
+        ground_level,
+        drag_area,
+        descent_mass,
+        atmosphere_lookup,
+        STOP_STEPS,
+    )
+    if burst_velocity < 0:
+        speed_sum -= burst_velocity
+        speed_count += 1
+
+    return {
+        "average_descent_rate": speed_sum / speed_count if speed_count else 0.0,
+        "descent_time": steps * DT,
+        "impact_velocity": velocity,
+        "steps": steps,
+        "hit_step_limit": position > ground_level,
+    }
+
+
+def simulate_descent_trajectory_f(
+    burst_altitude: float,
+    ground_level: float,
+    burst_velocity: float = 0.0,
+    drag_area: float = PARACHUTE_AREA_M2,
+    descent_mass: float = DESCENT_MASS,
+    atmosphere_table: AtmosphereTable | None = None,
+    integrator: str = "euler",
+    record_every: int = 1,
+) -> dict:
+    """
+    Simulate descent for one case and keep its time history.
+
+    Same integration and scalar results as simulate_descent_f. The history
+    holds the state and acceleration at every record_every-th step from
+    burst (t = 0), always ending with the final state.
+
+    Output (dict):
+    - time_s, position_m, velocity_mps, acceleration_mps2: histories,
+      ndarrays (time from burst)
+    - average_descent_rate, descent_time, impact_velocity, steps,
+      hit_step_limit: as simulate_descent_f
+    """
+    if integrator not in INTEGRATORS:
+        raise ValueError(f"integrator must be one of {INTEGRATORS}")
+    if record_every < 1:
+        raise ValueError("record_every must be at least 1")
+
+    if integrator == "rk45":
+        descent = simulate_descent_adaptive_f(
+            burst_altitude,
+            ground_level,
+            burst_velocity,
+            drag_area,
+            descent_mass,
+            max_steps=STOP_STEPS,
+            atmosphere_table=atmosphere_table,
+        )
+        keep = np.arange(descent["time_s"].size)
+        keep = keep[(keep % record_every == 0) | (keep == keep.size - 1)]
+        return {
+            "time_s": descent["time_s"][keep],
+            "position_m": descent["position_m"][keep],
+            "velocity_mps": descent["velocity_mps"][keep],
+            "acceleration_mps2": descent["acceleration_mps2"][keep],
+            "average_descent_rate": descent["mean_descent_rate_mps"],
+            "descent_time": descent["descent_time_s"],
+            "impact_velocity": descent["impact_velocity_mps"],
+            "steps": descent["steps"],
+            "hit_step_limit": descent["hit_step_limit"],
+        }
+
+    atmosphere_lookup = atmosphere_m if atmosphere_table is None else atmosphere_table.atmosphere_m
+
+    history = []
+    speed_sum, speed_count, steps, position, velocity = _march_descent_f(
+        burst_altitude,
+        burst_velocity,
+        ground_level,
+        drag_area,
+        descent_mass,
+        atmosphere_lookup,
+        STOP_STEPS,
+        history,
+    )
+    if burst_velocity < 0:
+        speed_sum -= burst_velocity
+        speed_count += 1
+
+    states = np.array(history[::record_every], dtype=float).reshape(-1, 3)
+    time_s = np.arange(0, steps, record_every) * DT  # s
+    final_acceleration = history[-1][2] if history else 0.0
+
+    return {
+        "time_s": np.append(time_s, steps * DT),
+        "position_m": np.append(states[:, 0], position),
+        "velocity_mps": np.append(states[:, 1], velocity),
+        "acceleration_mps2": np.append(states[:, 2], final_acceleration),
+        "average_descent_rate": speed_sum / speed_count if speed_count else 0.0,
+        "descent_time": steps * DT,
+        "impact_velocity": velocity,
+        "steps": steps,
+        "hit_step_limit": position > ground_level,
+    }
+
+
+def simulate_descent_batch_f(
+    burst_altitude: float | np.ndarray,
+    ground_level: float | np.ndarray,
+    burst_velocity: float | np.ndarray = 0.0,
+    drag_area: float | np.ndarray = PARACHUTE_AREA_M2,
+    descent_mass: float | np.ndarray = DESCENT_MASS,
+    atmosphere_table: AtmosphereTable | None = None,
+) -> dict:
+    """
+    Simulate many descents in lockstep.
+
+    Every argument broadcasts to a common 1-D shape, one lane per element,
+    and each lane follows the same forward-Euler update as
+    simulate_descent_f. Lanes that reach the ground drop out of the active
+    set; once BATCH_SCALAR_LANES or fewer remain, the stragglers finish with
+    the scalar march.
+
+    Output (dict of ndarrays, one element per lane):
+    - average_descent_rate, descent_time, impact_velocity, steps,
+      hit_step_limit: as simulate_descent_f
+    """
+    burst, ground, velocity, area, mass = (
+        lane.ravel().copy() for lane in np.broadcast_arrays(
+            *(np.atleast_1d(np.asarray(value, dtype=float)) for value in (
+                burst_altitude, ground_level, burst_velocity, drag_area, descent_mass,
+            ))
+        )
+    )
+
+    lane_count = burst.size
+    position = burst.copy()                   # m
+    speed_sum = np.where(velocity < 0, -velocity, 0.0)  # m/s
+    speed_count = (velocity < 0).astype(np.int64)
+    steps = np.zeros(lane_count, dtype=np.int64)
+
+    atmosphere_lookup = atmosphere_m if atmosphere_table is None else atmosphere_table.atmosphere_m
+
+    active = np.flatnonzero(position > ground)
+    step_index = 0
+
+    while active.size > BATCH_SCALAR_LANES and step_index < STOP_STEPS:
+        lane_position = position[active]
+        lane_velocity = velocity[active]
+        lane_mass = mass[active]
+
+        atmosphere = atmosphere_lookup(lane_position, geometric=True, output="state")
+        gravity = STANDARD_GRAVITY_MPS2 * (EARTH_RADIUS_M / (EARTH_RADIUS_M + lane_position)) ** 2  # m/s^2
+        gravity_force = -(gravity * lane_mass)  # N
+        drag_force = -np.sign(lane_velocity) * drag_force_descent_f(
+            lane_velocity, lane_position, area[active], atm=atmosphere,
+        )  # N
+
+        acceleration = (gravity_force + drag_force) / lane_mass      # m/s^2
+        lane_velocity = lane_velocity + acceleration * DT            # m/s
+        lane_position = lane_position + lane_velocity * DT           # m
+
+        velocity[active] = lane_velocity
+        position[active] = lane_position
+        steps[active] += 1
+        descending = lane_velocity < 0
+        speed_sum[active[descending]] -= lane_velocity[descending]
+        speed_count[active[descending]] += 1
+        step_index += 1
+
+        active = active[lane_position > ground[active]]
+
+    for lane in active:
+        lane_sum, lane_count_down, lane_steps, lane_position, lane_velocity = _march_descent_f(
+            float(position[lane]),
+            float(velocity[lane]),
+            float(ground[lane]),
+            float(area[lane]),
+            float(mass[lane]),
+            atmosphere_lookup,
+            STOP_STEPS - int(steps[lane]),
+        )
+        speed_sum[lane] += lane_sum
+        speed_count[lane] += lane_count_down
+        steps[lane] += lane_steps
+        position[lane] = lane_position
+        velocity[lane] = lane_velocity
+
+    average_descent_rate = np.zeros(lane_count)
+    moving = speed_count > 0
+    average_descent_rate[moving] = speed_sum[moving] / speed_count[moving]
+
+    return {
+        "average_descent_rate": average_descent_rate,
+        "descent_time": steps * DT,
+        "impact_velocity": velocity,
+        "steps": steps,
+        "hit_step_limit": position > ground,
+    }
+
+
+def _descent_summary_f(
+    burst_altitude,
+    ground_level,
+    burst_velocity,
+    drag_area,
+    descent_mass,
+    integrator: str = "euler",
+) -> dict:
+    """Return an empty descent summary with the ascent_solver_f sections."""
+    return {
+        "inputs": {
+            "burst_altitude": burst_altitude,
+            "ground_level": ground_level,
+            "burst_velocity": burst_velocity,
+            "drag_area": drag_area,
+            "descent_mass": descent_mass,
+        },
+        "results": {
+            "average_descent_rate": 0.0,
+            "descent_time": float("nan"),
+            "impact_velocity": float("nan"),
+            "success": False,
+        },
+        "limits": {
+            "time_step": DT,
+            "max_steps": STOP_STEPS,
+        },
+        "solver": {
+            "integrator": integrator,
+            "steps": 0,
+            "hit_step_limit": False,
+        },
+        "status": {
+            "solution_found": False,
+            "error": None,
+        },
+    }
+
+
+def descent_solver_f(
+    burst_altitude: float,
+    ground_level: float,
+    burst_velocity: float = 0.0,
+    drag_area: float = PARACHUTE_AREA_M2,
+    descent_mass: float = DESCENT_MASS,
+    atmosphere_table: AtmosphereTable | None = None,
+    integrator: str = "euler",
+) -> dict:
+    """
+    High-level descent solver interface.
+
+    Returns a structured summary dictionary with the same sections as
+    ascent_solver_f. Nothing is printed or read from the terminal.
+    integrator selects the fixed-step "euler" or adaptive "rk45" descent;
+    invalid inputs or an unknown integrator are reported in the status
+    section, as ascent_solver_f does.
+    """
+    summary = _descent_summary_f(burst_altitude, ground_level, burst_velocity, drag_area, descent_mass, integrator)
+
+    error = validate_descent_inputs_f(burst_altitude, ground_level, drag_area, descent_mass, burst_velocity)
+    if error is None and integrator not in INTEGRATORS:
+        error = f"integrator must be one of {INTEGRATORS}"
+    if error is not None:
+        summary["status"]["error"] = error
+        return summary
+
+    descent = simulate_descent_f(
+        burst_altitude,
+        ground_level,
+        burst_velocity,
+        drag_area,
+        descent_mass,
+        atmosphere_table,
+        integrator,
+    )
+
+    summary["solver"].update(steps=descent["steps"], hit_step_limit=descent["hit_step_limit"])
+    summary["results"].update({
+        "average_descent_rate": descent["average_descent_rate"],
+        "descent_time": descent["descent_time"],
+        "impact_velocity": descent["impact_velocity"],
+    })
+
+    if descent["hit_step_limit"]:
+        summary["status"]["error"] = "Step limit reached before ground level"
+        return summary
+
+    summary["results"]["success"] = True
+    summary["status"]["solution_found"] = True
+    return summary
+
+
+def descent_solver_batch_f(
+    burst_altitude,
+    ground_level,
+    burst_velocity=0.0,
+    drag_area=PARACHUTE_AREA_M2,
+    descent_mass=DESCENT_MASS,
+    atmosphere_table: AtmosphereTable | None = None,
+    integrator: str = "euler",
+) -> dict:
+    """
+    Batched descent_solver_f: integrates every lane together.
+
+    Inputs broadcast to one lane per element. Returns the descent_solver_f
+    summary sections with an ndarray per field (status "error" is an object
+    array holding None for valid lanes); invalid lanes are not integrated.
+    With integrator "rk45" each lane is integrated adaptively in turn
+    (adaptive steps differ per lane, so there is no lockstep). An unknown
+    integrator is reported in the status of every otherwise valid lane.
+    """
+    burst, ground, velocity, area, mass = (
+        lane.ravel() for lane in np.broadcast_arrays(
+            *(np.atleast_1d(np.asarray(value, dtype=float)) for value in (
+                burst_altitude, ground_level, burst_velocity, drag_area, descent_mass,
+            ))
+        )
+    )
+    lane_count = burst.size
+
+    summary = _descent_summary_f(burst.copy(), ground.copy(), velocity.copy(), area.copy(), mass.copy(), integrator)
+    integrator_error = None if integrator in INTEGRATORS else f"integrator must be one of {INTEGRATORS}"
+    errors = np.array(
+        [
+            validate_descent_inputs_f(*lane) or integrator_error
+            for lane in zip(burst, ground, area, mass, velocity)
+        ],
+        dtype=object,
+    )
+    valid = np.array([error is None for error in errors], dtype=bool)
+
+    average_descent_rate = np.zeros(lane_count)
+    descent_time = np.full(lane_count, np.nan)
+    impact_velocity = np.full(lane_count, np.nan)
+    steps = np.zeros(lane_count, dtype=np.int64)
+    hit_step_limit = np.zeros(lane_count, dtype=bool)
+
+    if valid.any() and integrator == "rk45":
+        for lane in np.flatnonzero(valid):
+            descent = simulate_descent_f(
+                float(burst[lane]),
+                float(ground[lane]),
+                float(velocity[lane]),
+                float(area[lane]),
+                float(mass[lane]),
+                atmosphere_table,
+                integrator,
+            )
+            average_descent_rate[lane] = descent["average_descent_rate"]
+            descent_time[lane] = descent["descent_time"]
+            impact_velocity[lane] = descent["impact_velocity"]
+            steps[lane] = descent["steps"]
+            hit_step_limit[lane] = descent["hit_step_limit"]
+    elif valid.any():
+        descent = simulate_descent_batch_f(
+            burst[valid], ground[valid], velocity[valid], area[valid], mass[valid], atmosphere_table,
+        )
+        average_descent_rate[valid] = descent["average_descent_rate"]
+        descent_time[valid] = descent["descent_time"]
+        impact_velocity[valid] = descent["impact_velocity"]
+        steps[valid] = descent["steps"]
+        hit_step_limit[valid] = descent["hit_step_limit"]
+
+    errors[valid & hit_step_limit] = "Step limit reached before ground level"
+    success = valid & ~hit_step_limit
+
+    summary["results"].update({
+        "average_descent_rate": average_descent_rate,
+        "descent_time": descent_time,
+        "impact_velocity": impact_velocity,
+        "success": success,
+    })
+    summary["solver"].update(steps=steps, hit_step_limit=hit_step_limit)
+    summary["status"].update(solution_found=success.copy(), error=errors)
+    return summary
+
+
+def main() -> None:
+    # --- User inputs (SI units)
+    burst_altitude = float(input("Enter balloon burst altitude (m): "))  # m, positive
+    ground_level = float(input("Enter ground level (m): "))              # m, positive
+    burst_velocity = float(input("Enter velocity at burst (m/s): "))     # m/s, varies
+    cross_sec_area = float(input("Enter balloon area (m^2): "))
+
+    summary = descent_solver_f(
+        burst_altitude=burst_altitude,
+        ground_level=ground_level,
+        burst_velocity=burst_velocity,
+        drag_area=cross_sec_area,
+    )
+
+    if summary["status"]["error"] is not None:
+        raise SystemExit(summary["status"]["error"])
+
+    print(f"Average descent rate: {summary['results']['average_descent_rate']:.2f} m/s")
+    print(f"Descent time: {summary['results']['descent_time']:.1f} s")
 
-# Average descent rate (positive magnitude)
-descent_speeds = [-v for v in velocity_log if v < 0]  # m/s
-if len(descent_speeds) > 0:
-    average_descent_rate = float(statistics.mean(descent_speeds))  # m/s
-else:
-    average_descent_rate = 0.0
 
-print(f"Average descent rate: {average_descent_rate:.2f} m/s")
+if __name__ == "__main__":
+    main()
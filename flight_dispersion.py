@@ -0,0 +1,300 @@
+########################################################################
+# Purdue Orbital, Flight Dynamics
+#
+# Project Name: Ascent / Descent Modeling
+#
+# Script Name: Flight Dispersion
+# File Name: flight_dispersion.py
+#
+# Contributors: Purdue Orbital Flight Dynamics Team
+# Date Created: 10/18/2026
+# Last Updated: 10/18/2026
+#
+# Script Description:
+#   Seeded Monte Carlo dispersion analysis of a full flight (ascent to
+#   burst, then descent to the ground) for a fixed helium fill.
+#
+#   The script:
+#     - Draws normally distributed perturbations of the ascent drag
+#       coefficient (DRAG_COEFF_SPHERE), the descent drag coefficient
+#       (DRAG_COEFF_DESCENT), each payload component mass
+#       (PAYLOAD_COMPONENT_MASSES), the helium fill and an atmosphere
+#       temperature offset from numpy.random.default_rng(seed)
+#     - Evaluates all samples as arrays with the quasi-steady (terminal
+#       velocity) ascent and descent models, in chunks of DISPERSION_CHUNK
+#       samples to bound memory
+#     - Reports mean, standard deviation, percentiles and histograms of the
+#       ascent rate, time to burst, descent rate, descent time and total
+#       flight time
+#
+# Notes:
+#   - The quasi-steady models differ from the time-marched ones by a few
+#     1e-4 relative (see quasi_steady_deviation_f), well below typical
+#     dispersions, and cost microseconds per sample instead of a full
+#     simulation each.
+#   - Drag coefficients and masses are clipped to stay positive.
+#   - Samples whose ascent fails (no net lift somewhere below burst) are
+#     flagged and excluded from the statistics.
+#
+# References:
+#   None
+#
+# Input Parameters:
+#   - start_altitude: launch altitude, m
+#   - burst_altitude: burst altitude, m
+#   - helium_mass: nominal helium fill, kg
+#   - sample_count: number of Monte Carlo samples
+#   - seed: random seed (same seed, same samples)
+#   - dispersions: optional overrides of DEFAULT_DISPERSIONS (1-sigma)
+#
+# Output:
+#   - dict of samples, per-sample outputs, statistics and histograms
+#
+########################################################################
+
+from __future__ import annotations
+
+import numpy as np
+
+from ascent_simulation import simulate_ascent_rate_quasi_steady_f
+from modules.atmosphere_f import AtmosphereTable
+from modules.descent_quasi_steady_f import descent_quasi_steady_f
+from modules.drag_force_descent_f import DRAG_COEFF_DESCENT, PARACHUTE_AREA_M2
+from modules.drag_force_f import DRAG_COEFF_SPHERE
+from modules.system_m_f import PAYLOAD_COMPONENT_MASSES
+
+
+# --------------------------- CONSTANTS --------------------------------
+DEFAULT_SAMPLES = 10_000        # Monte Carlo sample count
+DISPERSION_CHUNK = 2048         # samples evaluated per vectorized pass
+HISTOGRAM_BINS = 40             # bins per output histogram
+PERCENTILES = (1.0, 5.0, 25.0, 50.0, 75.0, 95.0, 99.0)
+MIN_DRAG_COEFFICIENT = 1e-3     # clip for sampled drag coefficients, -
+MIN_COMPONENT_MASS = 0.0        # clip for sampled payload masses, kg
+
+# 1-sigma dispersions
+DEFAULT_DISPERSIONS = {
+    "ascent_drag_fraction": 0.10,       # relative, of DRAG_COEFF_SPHERE
+    "descent_drag_fraction": 0.10,      # relative, of DRAG_COEFF_DESCENT
+    "component_mass_kg": 0.05,          # absolute, per payload component, kg
+    "helium_fill_fraction": 0.02,       # relative, of the nominal fill
+    "temperature_offset_K": 5.0,        # absolute, K
+}
+
+OUTPUT_FIELDS = (
+    "ascent_rate",
+    "time_to_burst",
+    "descent_rate",
+    "descent_time",
+    "flight_time",
+)
+# ---------------------------------------------------------------------
+
+
+def sample_dispersions_f(
+    sample_count: int,
+    helium_mass: float,
+    seed: int | None = None,
+    dispersions: dict | None = None,
+) -> dict:
+    """
+    Draw the perturbed inputs for every sample.
+
+    Input:
+    - sample_count: number of samples
+    - helium_mass: nominal helium fill, kg
+    - seed: random seed
+    - dispersions: optional overrides of DEFAULT_DISPERSIONS
+
+    Output (dict of ndarrays, one element per sample):
+    - ascent_drag_coefficient, descent_drag_coefficient: -
+    - constant_mass: payload mass (sum of components), kg
+    - helium_mass: helium fill, kg
+    - temperature_offset: K
+    """
+    sigma = dict(DEFAULT_DISPERSIONS)
+    if dispersions:
+        unknown = set(dispersions) - set(sigma)
+        if unknown:
+            raise ValueError(f"unknown dispersions: {sorted(unknown)}")
+        sigma.update(dispersions)
+
+    rng = np.random.default_rng(seed)
+    size = int(sample_count)
+
+    ascent_drag = DRAG_COEFF_SPHERE * (1.0 + sigma["ascent_drag_fraction"] * rng.standard_normal(size))
+    descent_drag = DRAG_COEFF_DESCENT * (1.0 + sigma["descent_drag_fraction"] * rng.standard_normal(size))
+    components = np.asarray(PAYLOAD_COMPONENT_MASSES) + sigma["component_mass_kg"] * rng.standard_normal(
+        (size, len(PAYLOAD_COMPONENT_MASSES))
+    )
+    fill = helium_mass * (1.0 + sigma["helium_fill_fraction"] * rng.standard_normal(size))
+    temperature_offset = sigma["temperature_offset_K"] * rng.standard_normal(size)
+
+    return {
+        "ascent_drag_coefficient": np.maximum(ascent_drag, MIN_DRAG_COEFFICIENT),
+        "descent_drag_coefficient": np.maximum(descent_drag, MIN_DRAG_COEFFICIENT),
+        "constant_mass": np.maximum(components, MIN_COMPONENT_MASS).sum(axis=1),
+        "helium_mass": np.maximum(fill, 0.0),
+        "temperature_offset": temperature_offset,
+    }
+
+
+def evaluate_dispersions_f(
+    samples: dict,
+    start_altitude: float,
+    burst_altitude: float,
+    ground_level: float | None = None,
+    drag_area: float = PARACHUTE_AREA_M2,
+    atmosphere_table: AtmosphereTable | None = None,
+) -> tuple[dict, np.ndarray]:
+    """
+    Evaluate every sample's flight with the vectorized quasi-steady models.
+
+    Input:
+    - samples: sample_dispersions_f output
+    - start_altitude, burst_altitude: m
+    - ground_level: landing altitude, m (None -> start_altitude)
+    - drag_area: descent drag reference area, m^2
+    - atmosphere_table: optional AtmosphereTable to interpolate from
+
+    Output:
+    - outputs: dict of ndarrays keyed by OUTPUT_FIELDS (nan where failed),
+      rates in m/s and times in s
+    - failed: True where the ascent fails
+    """
+    if ground_level is None:
+        ground_level = start_altitude
+
+    sample_count = samples["helium_mass"].size
+    outputs = {field: np.full(sample_count, np.nan) for field in OUTPUT_FIELDS}
+    failed = np.zeros(sample_count, dtype=bool)
+
+    for first in range(0, sample_count, DISPERSION_CHUNK):
+        chunk = slice(first, min(first + DISPERSION_CHUNK, sample_count))
+
+        ascent_rate, _, ascent_failed = simulate_ascent_rate_quasi_steady_f(
+            start_altitude,
+            burst_altitude,
+            samples["helium_mass"][chunk],
+            atmosphere_table,
+            constant_mass=samples["constant_mass"][chunk],
+            drag_coefficient=samples["ascent_drag_coefficient"][chunk],
+            temperature_offset=samples["temperature_offset"][chunk],
+        )
+        descent_rate, descent_time = descent_quasi_steady_f(
+            burst_altitude,
+            ground_level,
+            samples["constant_mass"][chunk],
+            drag_area,
+            drag_coefficient=samples["descent_drag_coefficient"][chunk],
+            temperature_offset_K=samples["temperature_offset"][chunk],
+            atmosphere_table=atmosphere_table,
+        )
+
+        with np.errstate(divide="ignore"):
+            time_to_burst = (burst_altitude - start_altitude) / ascent_rate
+
+        ok = ~ascent_failed
+        for field, values in (
+            ("ascent_rate", ascent_rate),
+            ("time_to_burst", time_to_burst),
+            ("descent_rate", descent_rate),
+            ("descent_time", descent_time),
+            ("flight_time", time_to_burst + descent_time),
+        ):
+            outputs[field][chunk] = np.where(ok, values, np.nan)
+        failed[chunk] = ascent_failed
+
+    return outputs, failed
+
+
+def summarize_dispersions_f(outputs: dict, failed: np.ndarray, bins: int = HISTOGRAM_BINS) -> tuple[dict, dict]:
+    """
+    Compute statistics and histograms over the successful samples.
+
+    Output:
+    - statistics: {field: {"mean", "std", "percentiles": {p: value}}}
+    - histograms: {field: {"counts", "edges"}}
+    """
+    statistics = {}
+    histograms = {}
+    ok = ~failed
+
+    for field in OUTPUT_FIELDS:
+        values = outputs[field][ok]
+        if values.size == 0:
+            statistics[field] = {
+                "mean": float("nan"),
+                "std": float("nan"),
+                "percentiles": {p: float("nan") for p in PERCENTILES},
+            }
+            histograms[field] = {"counts": np.zeros(bins, dtype=np.int64), "edges": np.full(bins + 1, np.nan)}
+            continue
+
+        levels = np.percentile(values, PERCENTILES)
+        statistics[field] = {
+            "mean": float(np.mean(values)),
+            "std": float(np.std(values)),
+            "percentiles": {p: float(level) for p, level in zip(PERCENTILES, levels)},
+        }
+        counts, edges = np.histogram(values, bins=bins)
+        histograms[field] = {"counts": counts, "edges": edges}
+
+    return statistics, histograms
+
+
+def run_flight_dispersion_f(
+    start_altitude: float,
+    burst_altitude: float,
+    helium_mass: float,
+    sample_count: int = DEFAULT_SAMPLES,
+    seed: int | None = 0,
+    dispersions: dict | None = None,
+    ground_level: float | None = None,
+    drag_area: float = PARACHUTE_AREA_M2,
+    atmosphere_table: AtmosphereTable | None = None,
+    bins: int = HISTOGRAM_BINS,
+) -> dict:
+    """
+    Run a seeded Monte Carlo dispersion of the full flight.
+
+    Input:
+    - start_altitude, burst_altitude: m
+    - helium_mass: nominal helium fill, kg
+    - sample_count: number of samples
+    - seed: random seed (None draws fresh entropy)
+    - dispersions: optional overrides of DEFAULT_DISPERSIONS (1-sigma)
+    - ground_level: landing altitude, m (None -> start_altitude)
+    - drag_area: descent drag reference area, m^2
+    - atmosphere_table: optional AtmosphereTable to interpolate from
+    - bins: histogram bin count
+
+    Output (dict):
+    - samples: sample_dispersions_f output
+    - outputs: per-sample OUTPUT_FIELDS arrays (nan where failed)
+    - failed: per-sample ascent failure flags
+    - failure_fraction: fraction of failed samples
+    - statistics, histograms: summarize_dispersions_f output
+    - seed, sample_count: as given
+    """
+    samples = sample_dispersions_f(sample_count, helium_mass, seed, dispersions)
+    outputs, failed = evaluate_dispersions_f(
+        samples,
+        start_altitude,
+        burst_altitude,
+        ground_level,
+        drag_area,
+        atmosphere_table,
+    )
+    statistics, histograms = summarize_dispersions_f(outputs, failed, bins)
+
+    return {
+        "samples": samples,
+        "outputs": outputs,
+        "failed": failed,
+        "failure_fraction": float(np.mean(failed)) if failed.size else 0.0,
+        "statistics": statistics,
+        "histograms": histograms,
+        "seed": seed,
+        "sample_count": int(sample_count),
+    }
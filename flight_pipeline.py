@@ -0,0 +1,483 @@
+########################################################################
+# Purdue Orbital, Flight Dynamics
+#
+# Project Name: Ascent / Descent Modeling
+#
+# Script Name: Flight Pipeline
+# File Name: flight_pipeline.py
+#
+# Contributors: Purdue Orbital Flight Dynamics Team
+# Date Created: 10/18/2026
+# Last Updated: 10/18/2026
+#
+# Script Description:
+#   Predicts a whole flight in one call: solves the helium mass for the
+#   target ascent rate, integrates the ascent to burst and the descent from
+#   burst to the ground, and joins both into one timeline.
+#
+#   The script:
+#     - Chains ascent_solver_f, simulate_ascent_motion_f and
+#       simulate_descent_trajectory_f (run_flight_f), passing the state
+#       at burst into the descent as its initial state
+#     - Evaluates every phase against one atmosphere: the exact model or
+#       one shared AtmosphereTable
+#     - Returns a combined timeline (time from launch, position, velocity,
+#       acceleration and a phase flag per sample)
+#     - Runs many cases as arrays with run_flight_batch_f: helium solves per
+#       case, then one lockstep ascent and one lockstep descent over all
+#       solved cases, with the burst state handed over as arrays
+#
+# Notes:
+#   - After burst the balloon and helium are gone; the descent mass
+#     defaults to the payload (constant) mass.
+#   - The batch path integrates with fixed-step Euler, like the other batch
+#     functions, so it matches run_flight_f with integrator "euler".
+#   - The descent starts from the ascent's final state (position, velocity
+#     and time), so the timeline is continuous at burst; with Euler that
+#     state is the first one at or above the burst altitude. The Euler
+#     ascent history of simulate_ascent_motion_f stamps each post-step
+#     state with the pre-step time, so the timeline re-stamps it by one
+#     step.
+#   - By default every phase uses the exact atmosphere model when the
+#     compiled march kernels are available (march_kernels_f.USE_JIT; the
+#     kernels only run on the exact model) and an AtmosphereTable at
+#     TABLE_RESOLUTION_M otherwise.
+#
+# References:
+#   None
+#
+# Input Parameters:
+#   - start_altitude: launch altitude, m, >= 0
+#   - burst_altitude: burst altitude, m, > start altitude
+#   - target_rate: desired mean ascent rate, m/s, > 0
+#   - ground_level: landing altitude, m (None -> start_altitude)
+#   - constant_mass: non-helium (payload) mass, kg
+#   - drag_area: descent drag reference area, m^2
+#
+# Output:
+#   - run_flight_f: summary dict with ascent, descent, results, timeline
+#     and status sections
+#   - run_flight_batch_f: dict of ndarrays, one per BATCH_FIELDS entry
+#
+########################################################################
+
+from __future__ import annotations
+
+import numpy as np
+
+from ascent_simulation import (
+    CONSTANT_MASS,
+    SOLVER_METHOD,
+    TIME_STEP,
+    ascent_solver_f,
+    simulate_ascent_rate_batch_f,
+    solve_helium_mass_detailed_f,
+    validate_inputs_f,
+)
+from ascent_sweep import run_sweep_f
+from descent_simulation import (
+    simulate_descent_batch_f,
+    simulate_descent_trajectory_f,
+    validate_descent_inputs_f,
+)
+from modules import march_kernels_f
+from modules.atmosphere_f import AtmosphereTable
+from modules.drag_force_descent_f import PARACHUTE_AREA_M2
+from modules.simulate_ascent_motion_f import simulate_ascent_motion_f
+
+
+# --------------------------- CONSTANTS --------------------------------
+TABLE_RESOLUTION_M = 10.0       # shared AtmosphereTable resolution without the JIT kernels, m
+AUTO_TABLE = "auto"             # table_resolution_m default: see _shared_table_f
+CONTINUITY_TOLERANCE = 1e-6     # relative mismatch allowed where the phases join
+PHASE_ASCENT = 0                # timeline phase flag
+PHASE_DESCENT = 1               # timeline phase flag
+TIMELINE_FIELDS = ("time_s", "position_m", "velocity_mps", "acceleration_mps2", "phase")
+BATCH_FIELDS = (
+    "start_altitude",
+    "burst_altitude",
+    "target_rate",
+    "ground_level",
+    "constant_mass",
+    "drag_area",
+    "helium_mass",
+    "achieved_rate",
+    "time_to_burst",
+    "burst_velocity",
+    "average_descent_rate",
+    "descent_time",
+    "impact_velocity",
+    "flight_time",
+    "success",
+    "error",
+)
+# ---------------------------------------------------------------------
+
+
+def _shared_table_f(
+    atmosphere_table: AtmosphereTable | None,
+    table_resolution_m: float | str | None,
+) -> AtmosphereTable | None:
+    """
+    Return the table every phase interpolates from (None -> exact model).
+
+    AUTO_TABLE picks the exact model when the compiled kernels are in use
+    (they evaluate it inline, faster than a Python table lookup) and a
+    TABLE_RESOLUTION_M table otherwise.
+    """
+    if table_resolution_m == AUTO_TABLE:
+        table_resolution_m = None if march_kernels_f.USE_JIT else TABLE_RESOLUTION_M
+    if atmosphere_table is not None or table_resolution_m is None:
+        return atmosphere_table
+    return AtmosphereTable(table_resolution_m)
+
+
+def build_timeline_f(ascent: dict, descent: dict, time_to_burst: float) -> dict:
+    """
+    Join ascent and descent histories into one timeline.
+
+    The descent must start from the last ascent sample: its first sample
+    (time 0 from burst) repeats the burst state, so the timeline has two
+    samples at burst, one per phase. A mismatch beyond CONTINUITY_TOLERANCE
+    in time, position or velocity raises ValueError.
+
+    Input:
+    - ascent: history dict (time_s, position_m, velocity_mps,
+      acceleration_mps2), time from launch
+    - descent: history dict from simulate_descent_trajectory_f (time from
+      burst)
+    - time_to_burst: ascent duration, s; offsets the descent times
+
+    Output:
+    - dict of ndarrays keyed by TIMELINE_FIELDS, time from launch; phase is
+      PHASE_ASCENT or PHASE_DESCENT per sample
+    """
+    ascent_count = len(ascent["time_s"])
+    descent_count = len(descent["time_s"])
+
+    if ascent_count and descent_count:
+        for field, descent_value in (
+            ("time_s", time_to_burst + descent["time_s"][0]),
+            ("position_m", descent["position_m"][0]),
+            ("velocity_mps", descent["velocity_mps"][0]),
+        ):
+            ascent_value = ascent[field][-1]
+            if abs(descent_value - ascent_value) > CONTINUITY_TOLERANCE * max(abs(ascent_value), 1.0):
+                raise ValueError(
+                    f"timeline is discontinuous at burst: {field} {float(ascent_value)!r} (ascent) "
+                    f"vs {float(descent_value)!r} (descent)"
+                )
+
+    timeline = {
+        field: np.concatenate((np.asarray(ascent[field], dtype=float), np.asarray(descent[field], dtype=float)))
+        for field in TIMELINE_FIELDS[:-1]
+    }
+    timeline["time_s"][ascent_count:] += time_to_burst
+    timeline["phase"] = np.concatenate((
+        np.full(ascent_count, PHASE_ASCENT, dtype=np.int8),
+        np.full(descent_count, PHASE_DESCENT, dtype=np.int8),
+    ))
+    return timeline
+
+
+def run_flight_f(
+    start_altitude: float,
+    burst_altitude: float,
+    target_rate: float,
+    ground_level: float | None = None,
+    constant_mass: float = CONSTANT_MASS,
+    drag_area: float = PARACHUTE_AREA_M2,
+    descent_mass: float | None = None,
+    atmosphere_table: AtmosphereTable | None = None,
+    table_resolution_m: float | str | None = AUTO_TABLE,
+    method: str = SOLVER_METHOD,
+    integrator: str = "euler",
+    quasi_steady_bracket: bool = True,
+    record_every: int = 1,
+) -> dict:
+    """
+    Predict one flight: helium solve, ascent to burst, descent to ground.
+
+    Input:
+    - start_altitude, burst_altitude, target_rate: as ascent_solver_f
+    - ground_level: landing altitude, m (None -> start_altitude)
+    - constant_mass: non-helium (payload) mass, kg
+    - drag_area: descent drag reference area, m^2
+    - descent_mass: descending mass, kg (None -> constant_mass)
+    - atmosphere_table: AtmosphereTable shared by every phase; if None one
+      is built at table_resolution_m (None -> exact atmosphere model;
+      AUTO_TABLE -> exact model with the JIT kernels, else
+      TABLE_RESOLUTION_M)
+    - method, integrator, quasi_steady_bracket: ascent_solver_f options;
+      integrator also selects the descent integrator
+    - record_every: keep every n-th step of each phase in the timeline
+
+    Output (dict):
+    - inputs: the arguments above
+    - ascent: helium_mass, achieved_rate, initial_gage_force,
+      time_to_burst, burst_altitude, burst_velocity, steps (the burst
+      state is the ascent's last sample)
+    - descent: average_descent_rate, descent_time, impact_velocity, steps,
+      hit_step_limit
+    - results: flight_time, success
+    - timeline: build_timeline_f output (None unless successful)
+    - solver: ascent_solver_f solver section
+    - status: solution_found, error
+    """
+    if ground_level is None:
+        ground_level = start_altitude
+    if descent_mass is None:
+        descent_mass = constant_mass
+
+    summary = {
+        "inputs": {
+            "start_altitude": start_altitude,
+            "burst_altitude": burst_altitude,
+            "target_rate": target_rate,
+            "ground_level": ground_level,
+            "constant_mass": constant_mass,
+            "drag_area": drag_area,
+            "descent_mass": descent_mass,
+        },
+        "ascent": None,
+        "descent": None,
+        "results": {
+            "flight_time": float("nan"),
+            "success": False,
+        },
+        "timeline": None,
+        "solver": None,
+        "status": {
+            "solution_found": False,
+            "error": None,
+        },
+    }
+
+    error = validate_descent_inputs_f(burst_altitude, ground_level, drag_area, descent_mass)
+    if error is not None:
+        summary["status"]["error"] = error
+        return summary
+
+    table = _shared_table_f(atmosphere_table, table_resolution_m)
+
+    solution = ascent_solver_f(
+        start_altitude,
+        burst_altitude,
+        target_rate,
+        atmosphere_table=table,
+        method=method,
+        integrator=integrator,
+        quasi_steady_bracket=quasi_steady_bracket,
+        constant_mass=constant_mass,
+    )
+    summary["solver"] = solution["solver"]
+    if not solution["status"]["solution_found"]:
+        summary["status"]["error"] = solution["status"]["error"]
+        return summary
+    helium_mass = solution["results"]["helium_mass"]
+
+    ascent = simulate_ascent_motion_f(
+        helium_mass_kg=helium_mass,
+        start_altitude_m=start_altitude,
+        max_altitude_m=burst_altitude,
+        time_step_s=TIME_STEP,
+        constant_mass_kg=constant_mass,
+        make_plots=False,
+        atmosphere_table=table,
+        integrator=integrator,
+        record_every=record_every,
+    )
+    if ascent["had_error"]:
+        summary["status"]["error"] = f"Ascent failed: {ascent['error_reason']}"
+        return summary
+
+    if integrator == "rk45":
+        time_to_burst = float(ascent["time_s"][-1])
+    else:
+        # simulate_ascent_motion_f stamps each post-step state with the
+        # pre-step time; stamp it with the time it is reached, so the last
+        # sample falls at steps * TIME_STEP (as in the batch path)
+        ascent = dict(ascent, time_s=ascent["time_s"] + TIME_STEP)
+        time_to_burst = ascent["steps"] * TIME_STEP
+    burst_altitude_reached = float(ascent["position_m"][-1])
+    burst_velocity = float(ascent["velocity_mps"][-1])
+
+    summary["ascent"] = {
+        "helium_mass": helium_mass,
+        "achieved_rate": solution["results"]["achieved_rate"],
+        "initial_gage_force": solution["results"]["initial_gage_force"],
+        "time_to_burst": time_to_burst,
+        "burst_altitude": burst_altitude_reached,
+        "burst_velocity": burst_velocity,
+        "steps": ascent["steps"],
+    }
+
+    descent = simulate_descent_trajectory_f(
+        burst_altitude_reached,
+        ground_level,
+        burst_velocity,
+        drag_area,
+        descent_mass,
+        table,
+        integrator,
+        record_every,
+    )
+    summary["descent"] = {
+        "average_descent_rate": descent["average_descent_rate"],
+        "descent_time": descent["descent_time"],
+        "impact_velocity": descent["impact_velocity"],
+        "steps": descent["steps"],
+        "hit_step_limit": descent["hit_step_limit"],
+    }
+    if descent["hit_step_limit"]:
+        summary["status"]["error"] = "Step limit reached before ground level"
+        return summary
+
+    summary["timeline"] = build_timeline_f(ascent, descent, time_to_burst)
+    summary["results"].update(flight_time=time_to_burst + descent["descent_time"], success=True)
+    summary["status"]["solution_found"] = True
+    return summary
+
+
+def run_flight_batch_f(
+    start_altitude,
+    burst_altitude,
+    target_rate,
+    ground_level=None,
+    constant_mass=CONSTANT_MASS,
+    drag_area=PARACHUTE_AREA_M2,
+    atmosphere_table: AtmosphereTable | None = None,
+    table_resolution_m: float | str | None = AUTO_TABLE,
+    method: str = SOLVER_METHOD,
+    quasi_steady_bracket: bool = True,
+    workers: int | None = 1,
+) -> dict[str, np.ndarray]:
+    """
+    Predict many flights, one lane per case, as arrays.
+
+    Inputs broadcast to one lane per element. The helium mass of every
+    lane is solved first (serially against the shared table, or with the
+    sweep engine when workers > 1); then all solved lanes ascend together
+    (simulate_ascent_rate_batch_f) and their burst velocities seed one
+    lockstep descent (simulate_descent_batch_f). The descent mass is the
+    payload mass.
+
+    Input:
+    - start_altitude, burst_altitude, target_rate, ground_level,
+      constant_mass, drag_area: scalars or arrays (ground_level None ->
+      start_altitude)
+    - atmosphere_table, table_resolution_m: as run_flight_f
+    - method, quasi_steady_bracket: ascent_solver_f options
+    - workers: helium solve processes (1 -> serial in this process, sharing
+      the table; None -> os.cpu_count(), each worker builds its own table)
+
+    Output:
+    - dict of ndarrays keyed by BATCH_FIELDS; failed lanes have success
+      False, nan results and a non-empty error
+    """
+    if ground_level is None:
+        ground_level = start_altitude
+
+    start, burst, target, ground, payload, area = (
+        lane.ravel().copy() for lane in np.broadcast_arrays(
+            *(np.atleast_1d(np.asarray(value, dtype=float)) for value in (
+                start_altitude, burst_altitude, target_rate, ground_level, constant_mass, drag_area,
+            ))
+        )
+    )
+    lane_count = start.size
+
+    columns = {
+        "start_altitude": start,
+        "burst_altitude": burst,
+        "target_rate": target,
+        "ground_level": ground,
+        "constant_mass": payload,
+        "drag_area": area,
+    }
+    for field in BATCH_FIELDS[6:-2]:
+        columns[field] = np.full(lane_count, np.nan)
+    success = np.zeros(lane_count, dtype=bool)
+    errors = np.array([
+        validate_inputs_f(lane_start, lane_burst, lane_target, lane_payload)
+        or validate_descent_inputs_f(lane_burst, lane_ground, lane_area, lane_payload)
+        for lane_start, lane_burst, lane_target, lane_ground, lane_payload, lane_area
+        in zip(start, burst, target, ground, payload, area)
+    ], dtype=object)
+
+    table = _shared_table_f(atmosphere_table, table_resolution_m)
+
+    # --- Helium solve, per lane
+    valid = np.flatnonzero([error is None for error in errors])
+    if workers == 1:
+        for lane in valid:
+            solution = solve_helium_mass_detailed_f(
+                float(start[lane]),
+                float(burst[lane]),
+                float(target[lane]),
+                table,
+                method,
+                quasi_steady_bracket=quasi_steady_bracket,
+                constant_mass=float(payload[lane]),
+            )
+            if solution["helium_mass"] is None:
+                errors[lane] = "Target ascent rate not achievable"
+            else:
+                columns["helium_mass"][lane] = solution["helium_mass"]
+                columns["achieved_rate"][lane] = solution["achieved_rate"]
+    elif valid.size:
+        solved = run_sweep_f(
+            [
+                {
+                    "start_altitude": start[lane],
+                    "burst_altitude": burst[lane],
+                    "target_rate": target[lane],
+                    "constant_mass": payload[lane],
+                }
+                for lane in valid
+            ],
+            workers=workers,
+            table_resolution_m=None if table is None else table.resolution_m,
+            method=method,
+            quasi_steady_bracket=quasi_steady_bracket,
+        )
+        columns["helium_mass"][valid] = solved["helium_mass"]
+        columns["achieved_rate"][valid] = solved["achieved_rate"]
+        errors[valid[~solved["success"]]] = solved["error"][~solved["success"]]
+
+    # --- Ascent and descent, all solved lanes in lockstep
+    lanes = np.flatnonzero(~np.isnan(columns["helium_mass"]))
+    if lanes.size:
+        _, _, failed, burst_velocity, time_to_burst, burst_altitude_reached = simulate_ascent_rate_batch_f(
+            start[lanes],
+            burst[lanes],
+            columns["helium_mass"][lanes],
+            payload[lanes],
+            table,
+            burst_state=True,
+        )
+        errors[lanes[failed]] = "Ascent failed: net_force_N <= 0"
+        lanes = lanes[~failed]
+        columns["burst_velocity"][lanes] = burst_velocity[~failed]
+        columns["time_to_burst"][lanes] = time_to_burst[~failed]
+        burst_altitude_reached = burst_altitude_reached[~failed]
+
+    if lanes.size:
+        descent = simulate_descent_batch_f(
+            burst_altitude_reached,
+            ground[lanes],
+            columns["burst_velocity"][lanes],
+            area[lanes],
+            payload[lanes],
+            table,
+        )
+        landed = ~descent["hit_step_limit"]
+        errors[lanes[~landed]] = "Step limit reached before ground level"
+        for field in ("average_descent_rate", "descent_time", "impact_velocity"):
+            columns[field][lanes] = descent[field]
+        success[lanes[landed]] = True
+
+    columns["flight_time"] = np.where(success, columns["time_to_burst"] + columns["descent_time"], np.nan)
+    columns["success"] = success
+    columns["error"] = np.array(["" if error is None else error for error in errors], dtype=object)
+    return columns
@@ -0,0 +1,99 @@
+########################################################################
+# Purdue Orbital, Flight Dynamics
+#
+# Project Name: Ascent/Descent Modeling
+#
+# Function Name: ascent_forces_f
+# File Name: ascent_forces_f.py
+#
+# Contributors: Purdue Orbital Flight Dynamics Team
+# Date Created: 10/18/2026
+# Last Updated: 10/18/2026
+#
+# Function Description:
+#   Computes every force acting on the balloon during ascent from a single
+#   atmosphere sample, sharing the intermediate terms between them:
+#       g(h)   = g0 * (R / (R + h))^2
+#       V      = m_he / rho_he,   rho_he = (p * M_he) / (R_u * T)
+#       F_b    = rho_air * V * g
+#       D      = 0.5 * C_D * rho_air * A * v^2,   A = pi * r^2 (sphere of volume V)
+#       F_g    = m_sys * g
+#       F_corr = (m_misc + m_he) * g
+#       F_net  = F_b - D - F_g
+#
+# Notes:
+#   - Fused form of buoyant_force_f, drag_force_f, gravity_force_f and
+#     force_correction_f for the ascent time-step loops. Gravity is evaluated
+#     once and the helium volume once, so results match the per-force
+#     reference functions to floating-point round-off.
+#   - Uses plain arithmetic only, so scalars or NumPy arrays (one element per
+#     lane) are both accepted.
+#
+# References:
+#   None
+#
+# Input variables:
+# - altitude_m: geometric altitude, m, non-negative
+# - velocity_mps: vertical velocity, m/s, sign varies
+# - helium_mass_kg: helium mass in balloon, kg, non-negative
+# - system_mass_kg: total system mass (payload + helium), kg, positive
+# - drag_coefficient: balloon drag coefficient, -, positive
+#   (DRAG_COEFF_SPHERE unless dispersed per lane)
+# - atm: AtmosphereState from modules.atmosphere_f.atmosphere_m(..., output="state")
+#   (a legacy atmosphere dict is also accepted), must include:
+#       - T_K (K), p_Pa (Pa), rho_kgm3 (kg/m^3)
+#
+# Output variables:
+# - buoyant_force_N: buoyant force magnitude, N, non-negative
+# - drag_force_N: drag force magnitude, N, non-negative
+# - gravity_force_N: gravitational force magnitude, N, positive
+# - correction_force_N: gage correction force magnitude, N, non-negative
+# - net_force_N: buoyant - drag - gravity, N, sign varies
+#
+########################################################################
+
+from __future__ import annotations
+
+import math
+
+from modules.atmosphere_f import AtmosphereState, as_atmosphere_state
+from modules.balloon_density_f import GAS_CONSTANT, HELIUM_MOLAR_MASS
+from modules.drag_force_f import DRAG_COEFF_SPHERE
+from modules.force_correction_f import BALLOON_MASS_KG, NECK_MASS_KG, OTHER_MASS_KG, ROPE_MASS_KG
+from modules.gravity_acceleration_f import EARTH_RADIUS_M, STANDARD_GRAVITY_MPS2
+
+CORRECTION_MASS_KG = BALLOON_MASS_KG + NECK_MASS_KG + ROPE_MASS_KG + OTHER_MASS_KG  # [kg]
+SPHERE_VOLUME_TO_RADIUS = 3.0 / (4.0 * math.pi)  # [-] r^3 = V * 3 / (4 pi)
+
+
+def ascent_forces_f(
+    altitude_m,
+    velocity_mps,
+    helium_mass_kg,
+    system_mass_kg,
+    *,
+    atm: AtmosphereState | dict,
+    drag_coefficient=DRAG_COEFF_SPHERE,
+) -> tuple:
+    """Return (buoyant, drag, gravity, correction, net) forces in newtons."""
+    if isinstance(atm, dict):
+        atm = as_atmosphere_state(atm, required=("rho_kgm3", "T_K", "p_Pa"))
+    temperature_K = atm.T_K          # [K]
+    pressure_Pa = atm.p_Pa           # [Pa]
+    air_density_kgm3 = atm.rho_kgm3  # [kg/m^3]
+
+    gravity_mps2 = STANDARD_GRAVITY_MPS2 * (EARTH_RADIUS_M / (EARTH_RADIUS_M + altitude_m)) ** 2  # [m/s^2]
+
+    helium_density_kgm3 = (pressure_Pa * HELIUM_MOLAR_MASS) / (GAS_CONSTANT * temperature_K)  # [kg/m^3]
+    volume_m3 = helium_mass_kg / helium_density_kgm3  # [m^3]
+
+    radius_m = (SPHERE_VOLUME_TO_RADIUS * volume_m3) ** (1.0 / 3.0)  # [m]
+    area_m2 = math.pi * radius_m * radius_m  # [m^2]
+
+    buoyant_force_N = air_density_kgm3 * volume_m3 * gravity_mps2  # [N]
+    drag_force_N = 0.5 * drag_coefficient * air_density_kgm3 * area_m2 * (velocity_mps * velocity_mps)  # [N]
+    gravity_force_N = gravity_mps2 * system_mass_kg  # [N]
+    correction_force_N = (CORRECTION_MASS_KG + helium_mass_kg) * gravity_mps2  # [N]
+
+    net_force_N = buoyant_force_N - drag_force_N - gravity_force_N  # [N]
+    return buoyant_force_N, drag_force_N, gravity_force_N, correction_force_N, net_force_N
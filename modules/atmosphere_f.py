@@ -1,5 +1,14 @@
 # atmosphere.py
 import math
+from bisect import bisect_left
+from typing import NamedTuple
+
+import numpy as np
+
+try:
+    from modules import perf_counters_f
+except ModuleNotFoundError:
+    import perf_counters_f
 
 # --- Sea-level and viscosity constants (from your Tables.py) ---
 TZERO   = 288.15        # K
@@ -9,6 +18,85 @@ AZERO   = 340.294       # m/s
 BETAVISC = 1.458E-6     # kg/(m*s*sqrt(K)) style constant used in this form
 SUTH    = 110.4         # K
 
+# --- USSA76 constants ---
+REARTH_KM = 6356.766  # effective Earth radius used in USSA76 (km)
+GMR = 34.163195       # g0*M/R*1000 (dimensionless in table form)
+RSTAR = 8.31432e3     # J/(kmol·K)
+MW_AIR = 28.9644      # kg/kmol
+RGAS = RSTAR / MW_AIR # J/(kg·K)
+GAMMA = 1.4
+
+# Layer base geopotential altitudes (km), base temps (K), base pressure ratios, lapse rates (K/km)
+# Standard USSA76 up to 84.852 km
+HB = (0.0, 11.0, 20.0, 32.0, 47.0, 51.0, 71.0, 84.852)
+LB = (-6.5, 0.0, 1.0, 2.8, 0.0, -2.8, -2.0)  # K/km for each layer (len = len(HB)-1)
+TB = (288.15, 216.65, 216.65, 228.65, 270.65, 270.65, 214.65, 186.946)  # K
+PB = (1.0, 0.223361105092, 0.054032950695, 0.008566678359, 0.001094560133,
+      0.00066063531, 0.000039046, 0.00000368501)  # pressure ratio at base (p/p0)
+
+_HB_ARRAY = np.array(HB)
+_LB_ARRAY = np.array(LB)
+_TB_ARRAY = np.array(TB[:-1])
+_PB_ARRAY = np.array(PB[:-1])
+
+class AtmosphereState(NamedTuple):
+    """Immutable atmosphere sample returned by atmosphere_m(..., output="state").
+
+    Fields are in the same order as output="tuple" and carry the same names as
+    the output="dict" keys, so force functions can use attribute access
+    (atm.rho_kgm3) without per-call dict allocation or string hashing. Fields
+    are floats for scalar queries and ndarrays for array queries.
+    """
+    h_geom_km: float     # geometric altitude (km)
+    h_geopot_km: float   # geopotential altitude (km)
+    T_K: float           # temperature (K)
+    p_Pa: float          # pressure (Pa)
+    rho_kgm3: float      # density (kg/m^3)
+    a_mps: float         # speed of sound (m/s)
+    mu_Pas: float        # dynamic viscosity (Pa·s)
+    theta: float         # temperature ratio (T / T0)
+    delta: float         # pressure ratio (p / p0)
+    sigma: float         # density ratio (rho / rho0)
+
+
+# tuple.__new__ skips the keyword-handling constructor NamedTuple generates
+_new_state = tuple.__new__
+
+
+def as_atmosphere_state(atm, required=AtmosphereState._fields):
+    """Return atm as an AtmosphereState, converting a legacy dict or tuple.
+
+    A dict must hold every field in required (KeyError otherwise). Callers
+    that accept partial dicts pass the fields they read (e.g. ("T_K", "p_Pa"));
+    the other missing fields are then NaN.
+    """
+    if isinstance(atm, AtmosphereState):
+        return atm
+    if isinstance(atm, dict):
+        missing = [field for field in required if field not in atm]
+        if missing:
+            raise KeyError(f"atmosphere dict is missing {', '.join(missing)}")
+        return _new_state(AtmosphereState, (atm.get(field, math.nan) for field in AtmosphereState._fields))
+    return AtmosphereState._make(atm)
+
+def offset_temperature(atm, delta_T_K):
+    """Return atm with temperature shifted by delta_T_K at unchanged pressure.
+
+    A simple hot/cold-day model for dispersion studies: pressure (and hence
+    pressure altitude) is kept, density follows the ideal gas law, and speed
+    of sound and viscosity are recomputed. delta_T_K may be an array that
+    broadcasts against the fields of atm (e.g. one offset per lane).
+    """
+    atm = as_atmosphere_state(atm)
+    T = atm.T_K + delta_T_K
+    rho = atm.rho_kgm3 * (atm.T_K / T)
+    a = np.sqrt(GAMMA * RGAS * T)
+    mu = BETAVISC * np.sqrt(T * T * T) / (T + SUTH)
+    theta = T / TZERO
+    return _new_state(AtmosphereState, (
+        atm.h_geom_km, atm.h_geopot_km, T, atm.p_Pa, rho, a, mu, theta, atm.delta, rho / RHOZERO,
+    ))
+
 def MetricViscosity(theta):
     """Dynamic viscosity (kg/m-s) via Sutherland's law form used in Tables.py."""
     t = theta * TZERO
@@ -17,20 +105,22 @@ def MetricViscosity(theta):
 def Atmosphere(alt_geom=None, alt_geopot=None, *, output="dict"):
     """1976 standard atmosphere (to ~86 km), returning raw SI properties at one altitude.
 
-    Exactly one of alt_geom or alt_geopot must be supplied (km).
+    Exactly one of alt_geom or alt_geopot must be supplied (km). An ndarray (or
+    list/tuple) of altitudes is evaluated in one vectorized pass and every
+    returned property is an ndarray of the same shape.
 
     Parameters
     ----------
-    alt_geom : float | None
+    alt_geom : float | array_like | None
         Geometric altitude (km).
-    alt_geopot : float | None
+    alt_geopot : float | array_like | None
         Geopotential altitude (km).
     output : str
-        "dict" (default) or "tuple".
+        "dict" (default), "tuple" or "state" (AtmosphereState).
 
     Returns
     -------
-    dict | tuple
+    dict | tuple | AtmosphereState
         Includes keys:
         - h_geom_km, h_geopot_km
         - T_K, p_Pa, rho_kgm3
@@ -47,21 +137,8 @@ def Atmosphere(alt_geom=None, alt_geopot=None, *, output="dict"):
     if (alt_geom is None) == (alt_geopot is None):
         raise ValueError("Provide exactly one of alt_geom or alt_geopot (km).")
 
-    # --- Constants ---
-    REARTH_KM = 6356.766  # effective Earth radius used in USSA76 (km)
-    GMR = 34.163195       # g0*M/R*1000 (dimensionless in table form)
-    RSTAR = 8.31432e3     # J/(kmol·K)
-    MW_AIR = 28.9644      # kg/kmol
-    RGAS = RSTAR / MW_AIR # J/(kg·K)
-    GAMMA = 1.4
-
-    # Layer base geopotential altitudes (km), base temps (K), base pressure ratios, lapse rates (K/km)
-    # Standard USSA76 up to 84.852 km
-    hb = [0.0, 11.0, 20.0, 32.0, 47.0, 51.0, 71.0, 84.852]
-    Lb = [-6.5, 0.0, 1.0, 2.8, 0.0, -2.8, -2.0]  # K/km for each layer (len = len(hb)-1)
-    Tb = [288.15, 216.65, 216.65, 228.65, 270.65, 270.65, 214.65, 186.946]  # K
-    pb = [1.0, 0.223361105092, 0.054032950695, 0.008566678359, 0.001094560133,
-          0.00066063531, 0.000039046, 0.00000368501]  # pressure ratio at base (p/p0)
+    if isinstance(alt_geom if alt_geopot is None else alt_geopot, (np.ndarray, list, tuple)):
+        return _atmosphere_array(alt_geom, alt_geopot, output=output)
 
     # Convert geom<->geopot as needed
     if alt_geopot is None:
@@ -72,22 +149,22 @@ def Atmosphere(alt_geom=None, alt_geopot=None, *, output="dict"):
         h_geom = (REARTH_KM * h_geopot) / (REARTH_KM - h_geopot)
 
     # Clamp to table range (optional: could raise instead; keeping clamp avoids crashes)
-    if h_geopot < hb[0]:
-        h_geopot = hb[0]
-    if h_geopot > hb[-1]:
-        h_geopot = hb[-1]
-
-    # Find layer index i such that hb[i] <= h < hb[i+1]
-    i = 0
-    for k in range(len(hb) - 1):
-        if hb[k] <= h_geopot <= hb[k+1]:
-            i = k
-            break
-
-    h0 = hb[i]
-    T0 = Tb[i]
-    p0_ratio = pb[i]
-    L = Lb[i]
+    if h_geopot < HB[0]:
+        h_geopot = HB[0]
+    if h_geopot > HB[-1]:
+        h_geopot = HB[-1]
+
+    # Find layer index i such that HB[i] < h <= HB[i+1] (first layer includes h = 0)
+    i = bisect_left(HB, h_geopot) - 1
+    if i < 0:
+        i = 0
+    elif i > len(LB) - 1:
+        i = len(LB) - 1
+
+    h0 = HB[i]
+    T0 = TB[i]
+    p0_ratio = PB[i]
+    L = LB[i]
 
     dh = h_geopot - h0
 
@@ -115,6 +192,9 @@ def Atmosphere(alt_geom=None, alt_geopot=None, *, output="dict"):
     theta = T / TZERO
     mu = MetricViscosity(theta)
 
+    if output == "state":
+        return _new_state(AtmosphereState, (h_geom, h_geopot, T, p, rho, a, mu, theta, p_ratio, rho_ratio))
+
     if output == "tuple":
         return (
             h_geom,      # float — geometric altitude in kilometers (km)
@@ -143,24 +223,318 @@ def Atmosphere(alt_geom=None, alt_geopot=None, *, output="dict"):
         "sigma": rho_ratio,
     }
 
+def _atmosphere_array(alt_geom, alt_geopot, *, output="dict"):
+    """Vectorized form of Atmosphere(...) for array-like altitudes (km).
+
+    Layers are found with a sorted-index lookup (np.searchsorted) instead of
+    the per-point loop, and every property is returned as an ndarray with the
+    shape of the input. Results match the scalar path to floating-point
+    round-off.
+    """
+    if alt_geopot is None:
+        h_geom = np.asarray(alt_geom, dtype=float)
+        h_geopot = (REARTH_KM * h_geom) / (REARTH_KM + h_geom)
+    else:
+        h_geopot = np.asarray(alt_geopot, dtype=float)
+        h_geom = (REARTH_KM * h_geopot) / (REARTH_KM - h_geopot)
+
+    h_geopot = np.clip(h_geopot, HB[0], HB[-1])
+
+    # Same layer convention as the scalar path: hb[i] < h <= hb[i+1]
+    i = np.clip(np.searchsorted(_HB_ARRAY, h_geopot, side="left") - 1, 0, len(LB) - 1)
+
+    h0 = _HB_ARRAY[i]
+    T0 = _TB_ARRAY[i]
+    p0_ratio = _PB_ARRAY[i]
+    L = _LB_ARRAY[i]
+
+    dh = h_geopot - h0
+
+    T = T0 + L * dh
+
+    isothermal = np.abs(L) < 1e-12
+    L_safe = np.where(isothermal, 1.0, L)
+    p_ratio = np.where(
+        isothermal,
+        p0_ratio * np.exp(-GMR * dh / T0),
+        p0_ratio * (T0 / T) ** (GMR / L_safe),
+    )
+
+    rho_ratio = p_ratio / (T / TZERO)
+
+    p = p_ratio * PZERO
+    rho = rho_ratio * RHOZERO
+
+    a = np.sqrt(GAMMA * RGAS * T)
+
+    theta = T / TZERO
+    t = theta * TZERO
+    mu = BETAVISC * np.sqrt(t * t * t) / (t + SUTH)
+
+    if output == "state":
+        return AtmosphereState(h_geom, h_geopot, T, p, rho, a, mu, theta, p_ratio, rho_ratio)
+
+    if output == "tuple":
+        return (h_geom, h_geopot, T, p, rho, a, mu, theta, p_ratio, rho_ratio)
+
+    return {
+        "h_geom_km": h_geom,
+        "h_geopot_km": h_geopot,
+        "T_K": T,
+        "p_Pa": p,
+        "rho_kgm3": rho,
+        "a_mps": a,
+        "mu_Pas": mu,
+        "theta": theta,
+        "delta": p_ratio,
+        "sigma": rho_ratio,
+    }
+
 def atmosphere_m(altitude_m: float, *, geometric: bool = True, output: str = "dict"):
     """Convenience wrapper around Atmosphere(...) using meters.
 
     Parameters
     ----------
-    altitude_m : float
-        Altitude in meters.
+    altitude_m : float | array_like
+        Altitude in meters. Arrays are evaluated in one vectorized pass.
     geometric : bool
         If True, interpret altitude_m as geometric altitude. If False, geopotential.
     output : str
-        Passed through to Atmosphere(...).
+        Passed through to Atmosphere(...): "dict", "tuple" or "state".
 
     Returns
     -------
-    dict | tuple
+    dict | tuple | AtmosphereState
         Same as Atmosphere(...).
     """
+    if isinstance(altitude_m, (list, tuple)):
+        altitude_m = np.asarray(altitude_m, dtype=float)
+    counters = perf_counters_f.ACTIVE
+    if counters is not None:
+        counters.count("atmosphere_calls")
+        counters.count("atmosphere_points", int(np.size(altitude_m)))
     alt_km = altitude_m / 1000.0
     if geometric:
         return Atmosphere(alt_geom=alt_km, output=output)
     return Atmosphere(alt_geopot=alt_km, output=output)
+
+
+TABLE_CEILING_M = HB[-1] * 1000.0  # USSA76 table ceiling (geopotential), m
+MIN_TABLE_RESOLUTION_M = 1.0       # finest grid AtmosphereTable.for_tolerance will build, m
+_TABLE_FIELDS = ("T_K", "p_Pa", "rho_kgm3", "a_mps", "mu_Pas")
+
+
+class AtmosphereTable:
+    """Precomputed USSA76 grid answering atmosphere_m(...) queries by interpolation.
+
+    The table is built once on a uniform geopotential grid from 0 to 84,852 m
+    using the vectorized Atmosphere(...) path. Queries convert the altitude to
+    geopotential and linearly interpolate T, p, rho, a and mu between the two
+    neighbouring nodes. Layer boundaries fall on grid nodes whenever the
+    resolution divides 1000 m, so the piecewise-linear temperature is exact.
+
+    Parameters
+    ----------
+    resolution_m : float
+        Grid spacing in geopotential meters (default 10 m).
+
+    Attributes
+    ----------
+    resolution_m : float
+        Grid spacing used to build the table.
+    relative_errors : dict
+        Worst-case relative interpolation error per property, measured against
+        the exact model at several interior points of every grid cell and on
+        both sides of every layer base.
+    max_relative_error : float
+        Largest entry of relative_errors.
+
+    Notes
+    -----
+    Queries are clamped to the table range exactly like Atmosphere(...).
+    """
+
+    def __init__(self, resolution_m: float = 10.0):
+        if resolution_m <= 0.0:
+            raise ValueError("resolution_m must be positive.")
+
+        self.resolution_m = float(resolution_m)
+        node_count = int(math.ceil(TABLE_CEILING_M / self.resolution_m)) + 1
+        self._node_count = node_count
+
+        # Node heights in meters first so layer boundaries land exactly on nodes;
+        # the last node sits on the ceiling, making the final cell shorter.
+        h_nodes_m = np.minimum(np.arange(node_count) * self.resolution_m, TABLE_CEILING_M)
+        self._h_nodes_km = h_nodes_m / 1000.0
+        cell_fraction = np.diff(h_nodes_m) / self.resolution_m
+
+        # Nodes are evaluated from both sides so cells next to a layer boundary
+        # interpolate toward the one-sided limit of their own layer.
+        below = _atmosphere_array(None, self._h_nodes_km, output="dict")
+        above = _atmosphere_array(None, np.nextafter(self._h_nodes_km, np.inf), output="dict")
+        self._values = {key: np.asarray(above[key][:-1]) for key in _TABLE_FIELDS}
+        self._slopes = {
+            key: (below[key][1:] - above[key][:-1]) / cell_fraction
+            for key in _TABLE_FIELDS
+        }
+
+        # One plain tuple per cell (value, slope pairs) keeps scalar lookups to a
+        # single list index instead of ten ndarray element accesses.
+        self._cells = list(zip(*(
+            column
+            for key in _TABLE_FIELDS
+            for column in (self._values[key].tolist(), self._slopes[key].tolist())
+        )))
+
+        self.relative_errors = self._measure_errors()
+        self.max_relative_error = max(self.relative_errors.values())
+
+    @classmethod
+    def for_tolerance(cls, relative_tolerance: float, *, start_resolution_m: float = 100.0):
+        """Build the coarsest table whose worst-case relative error is within tolerance.
+
+        The resolution is halved from start_resolution_m until the measured error
+        meets relative_tolerance or MIN_TABLE_RESOLUTION_M is reached.
+        """
+        if relative_tolerance <= 0.0:
+            raise ValueError("relative_tolerance must be positive.")
+
+        resolution_m = float(start_resolution_m)
+        while True:
+            table = cls(resolution_m)
+            if table.max_relative_error <= relative_tolerance or resolution_m <= MIN_TABLE_RESOLUTION_M:
+                return table
+            resolution_m = max(0.5 * resolution_m, MIN_TABLE_RESOLUTION_M)
+
+    def _measure_errors(self) -> dict:
+        """Compare interpolated values against the exact model inside every cell.
+
+        Besides interior points of every cell, both sides of every layer base
+        are sampled: when the resolution does not divide 1000 m a base falls
+        inside a cell and the kink in the temperature profile is where that
+        cell's error peaks. The base itself is skipped because the rounded PB
+        ratios leave a small pressure step there in the exact model.
+        """
+        fractions = np.array([0.125, 0.25, 0.5, 0.75, 0.875])
+        step_km = self.resolution_m / 1000.0
+        h_km = (self._h_nodes_km[:-1, None] + fractions[None, :] * step_km).ravel()
+        h_km = np.concatenate((
+            h_km[h_km <= HB[-1]],
+            np.nextafter(_HB_ARRAY[1:], -np.inf),
+            np.nextafter(_HB_ARRAY[:-1], np.inf),
+        ))
+
+        exact = _atmosphere_array(None, h_km, output="dict")
+        approx = self._interpolate_array(h_km)
+
+        errors = {}
+        for key in _TABLE_FIELDS:
+            errors[key] = float(np.max(np.abs(approx[key] - exact[key]) / np.abs(exact[key])))
+        return errors
+
+    def _interpolate_array(self, h_geopot_km):
+        """Interpolate every tabulated property at clamped geopotential altitudes (km)."""
+        x = h_geopot_km * (1000.0 / self.resolution_m)
+        index = np.minimum(x.astype(np.intp), self._node_count - 2)
+        fraction = x - index
+        return {
+            key: self._values[key][index] + fraction * self._slopes[key][index]
+            for key in _TABLE_FIELDS
+        }
+
+    def atmosphere_m(self, altitude_m, *, geometric: bool = True, output: str = "dict"):
+        """Interpolated drop-in for atmosphere_m(...); same arguments and return layout."""
+        counters = perf_counters_f.ACTIVE
+        if counters is not None:
+            counters.count("table_calls")
+            counters.count("table_points", int(np.size(altitude_m)))
+        if isinstance(altitude_m, (np.ndarray, list, tuple)):
+            return self._atmosphere_m_array(altitude_m, geometric=geometric, output=output)
+
+        alt_km = altitude_m / 1000.0
+        if geometric:
+            h_geom = float(alt_km)
+            h_geopot = (REARTH_KM * h_geom) / (REARTH_KM + h_geom)
+        else:
+            h_geopot = float(alt_km)
+            h_geom = (REARTH_KM * h_geopot) / (REARTH_KM - h_geopot)
+
+        if h_geopot < HB[0]:
+            h_geopot = HB[0]
+        if h_geopot > HB[-1]:
+            h_geopot = HB[-1]
+
+        x = h_geopot * (1000.0 / self.resolution_m)
+        i = int(x)
+        if i > self._node_count - 2:
+            i = self._node_count - 2
+        f = x - i
+
+        T0, dT, p0, dp, rho0, drho, a0, da, mu0, dmu = self._cells[i]
+        T = T0 + f * dT
+        p = p0 + f * dp
+        rho = rho0 + f * drho
+        a = a0 + f * da
+        mu = mu0 + f * dmu
+
+        theta = T / TZERO
+        p_ratio = p / PZERO
+        rho_ratio = rho / RHOZERO
+
+        if output == "state":
+            return _new_state(AtmosphereState, (h_geom, h_geopot, T, p, rho, a, mu, theta, p_ratio, rho_ratio))
+
+        if output == "tuple":
+            return (h_geom, h_geopot, T, p, rho, a, mu, theta, p_ratio, rho_ratio)
+
+        return {
+            "h_geom_km": h_geom,
+            "h_geopot_km": h_geopot,
+            "T_K": T,
+            "p_Pa": p,
+            "rho_kgm3": rho,
+            "a_mps": a,
+            "mu_Pas": mu,
+            "theta": theta,
+            "delta": p_ratio,
+            "sigma": rho_ratio,
+        }
+
+    def _atmosphere_m_array(self, altitude_m, *, geometric: bool, output: str):
+        """Array form of AtmosphereTable.atmosphere_m(...)."""
+        alt_km = np.asarray(altitude_m, dtype=float) / 1000.0
+        if geometric:
+            h_geom = alt_km
+            h_geopot = (REARTH_KM * h_geom) / (REARTH_KM + h_geom)
+        else:
+            h_geopot = alt_km
+            h_geom = (REARTH_KM * h_geopot) / (REARTH_KM - h_geopot)
+
+        h_geopot = np.clip(h_geopot, HB[0], HB[-1])
+        props = self._interpolate_array(h_geopot)
+
+        T = props["T_K"]
+        p = props["p_Pa"]
+        rho = props["rho_kgm3"]
+        theta = T / TZERO
+        p_ratio = p / PZERO
+        rho_ratio = rho / RHOZERO
+
+        if output == "state":
+            return AtmosphereState(h_geom, h_geopot, T, p, rho, props["a_mps"], props["mu_Pas"], theta, p_ratio, rho_ratio)
+
+        if output == "tuple":
+            return (h_geom, h_geopot, T, p, rho, props["a_mps"], props["mu_Pas"], theta, p_ratio, rho_ratio)
+
+        return {
+            "h_geom_km": h_geom,
+            "h_geopot_km": h_geopot,
+            "T_K": T,
+            "p_Pa": p,
+            "rho_kgm3": rho,
+            "a_mps": props["a_mps"],
+            "mu_Pas": props["mu_Pas"],
+            "theta": theta,
+            "delta": p_ratio,
+            "sigma": rho_ratio,
+        }
@@ -8,7 +8,7 @@
 #
 # Contributors: Garion Cheng, Samuel Landers
 # Date Created: 10/??/2025
-# Last Updated: 02/09/2026
+# Last Updated: 10/18/2026
 #
 # Function Description:
 #   Computes cross-sectional area of a high-altitude balloon assuming:
@@ -18,7 +18,7 @@
 #     - Internal temperature equals external temperature
 #
 # Notes:
-#   Updated to accept a precomputed `atm` dict from modules.atmosphere
+#   Updated to accept a precomputed `atm` from modules.atmosphere
 #   to avoid recomputing temperature/pressure repeatedly inside timestep loops.
 #
 # References:
@@ -27,7 +27,8 @@
 # Input variables:
 # - altitude_m: geometric altitude, m, non-negative
 # - helium_mass_kg: helium mass, kg, non-negative
-# - atm: atmosphere dict (SI) from modules.atmosphere.atmosphere_m, must include:
+# - atm: AtmosphereState from modules.atmosphere_f.atmosphere_m(..., output="state")
+#   (a legacy atmosphere dict is also accepted), must include:
 #       - T_K (K)
 #       - p_Pa (Pa)
 #
@@ -40,14 +41,25 @@ from __future__ import annotations
 
 import math
 
+try:
+    from modules.atmosphere_f import AtmosphereState, as_atmosphere_state
+except ModuleNotFoundError:
+    from atmosphere_f import AtmosphereState, as_atmosphere_state
+
 GAS_CONSTANT = 8.314462618      # [J/(mol*K)]
 HELIUM_MOLAR_MASS = 0.00400261  # [kg/mol]
 
 
-def balloon_cross_sectional_area_f(altitude_m: float, helium_mass_kg: float, *, atm: dict) -> float:
+def balloon_cross_sectional_area_f(
+    altitude_m: float,
+    helium_mass_kg: float,
+    *,
+    atm: AtmosphereState | dict,
+) -> float:
     """Return balloon cross-sectional area (m^2)."""
-    temperature_K = float(atm["T_K"])  # [K]
-    pressure_Pa = float(atm["p_Pa"])   # [Pa]
+    atm = as_atmosphere_state(atm, required=("T_K", "p_Pa"))
+    temperature_K = atm.T_K  # [K]
+    pressure_Pa = atm.p_Pa   # [Pa]
 
     helium_moles_mol = helium_mass_kg / HELIUM_MOLAR_MASS  # [mol]
 
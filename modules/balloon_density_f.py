@@ -8,7 +8,7 @@
 #
 # Contributors: Purdue Orbital Flight Dynamics Team
 # Date Created: Unknown
-# Last Updated: 02/09/2026
+# Last Updated: 10/18/2026
 #
 # Function Description:
 #   Computes helium density using the ideal gas law:
@@ -19,7 +19,8 @@
 #
 # Input variables:
 # - altitude_m: geometric altitude, m, non-negative (unused except for consistency)
-# - atm: atmosphere dict (SI) from modules.atmosphere.atmosphere_m, must include:
+# - atm: AtmosphereState from modules.atmosphere_f.atmosphere_m(..., output="state")
+#   (a legacy atmosphere dict is also accepted), must include:
 #       - T_K (K)
 #       - p_Pa (Pa)
 #
@@ -30,14 +31,17 @@
 
 from __future__ import annotations
 
+from modules.atmosphere_f import AtmosphereState, as_atmosphere_state
+
 GAS_CONSTANT = 8.314462618      # [J/(mol*K)]
 HELIUM_MOLAR_MASS = 0.00400261  # [kg/mol]
 
 
-def balloon_density_f(altitude_m: float, *, atm: dict) -> float:
+def balloon_density_f(altitude_m: float, *, atm: AtmosphereState | dict) -> float:
     """Return helium density (kg/m^3) assuming ideal gas behavior."""
-    temperature_K = float(atm["T_K"])  # [K]
-    pressure_Pa = float(atm["p_Pa"])   # [Pa]
+    atm = as_atmosphere_state(atm, required=("T_K", "p_Pa"))
+    temperature_K = atm.T_K  # [K]
+    pressure_Pa = atm.p_Pa   # [Pa]
 
     helium_density_kgm3 = (pressure_Pa * HELIUM_MOLAR_MASS) / (GAS_CONSTANT * temperature_K)  # [kg/m^3]
     return float(helium_density_kgm3)
@@ -8,7 +8,7 @@
 #
 # Contributors: Purdue Orbital Flight Dynamics Team
 # Date Created: Unknown
-# Last Updated: 02/09/2026
+# Last Updated: 10/18/2026
 #
 # Function Description:
 #   Computes buoyant force magnitude (Archimedes principle):
@@ -23,8 +23,9 @@
 # Input variables:
 # - altitude_m: geometric altitude, m, non-negative
 # - helium_mass_kg: helium mass in balloon, kg, non-negative
-# - atm: atmosphere dict (SI) from modules.atmosphere.atmosphere_m, must include:
-#       - rho_kgm3 (kg/m^3)
+# - atm: AtmosphereState from modules.atmosphere_f.atmosphere_m(..., output="state")
+#   (a legacy atmosphere dict is also accepted), must include:
+#       - rho_kgm3 (kg/m^3), T_K (K), p_Pa (Pa)
 #
 # Output variables:
 # - buoyant_force_N: buoyant force magnitude, N, non-negative
@@ -33,13 +34,15 @@
 
 from __future__ import annotations
 
+from modules.atmosphere_f import AtmosphereState, as_atmosphere_state
 from modules.gravity_acceleration_f import gravity_acceleration_f
 from modules.volume_balloon_f import volume_balloon_f
 
 
-def buoyant_force_f(altitude_m: float, helium_mass_kg: float, *, atm: dict) -> float:
+def buoyant_force_f(altitude_m: float, helium_mass_kg: float, *, atm: AtmosphereState | dict) -> float:
     """Return buoyant force magnitude (N)."""
-    air_density_kgm3 = float(atm["rho_kgm3"])  # [kg/m^3]
+    atm = as_atmosphere_state(atm, required=("rho_kgm3", "T_K", "p_Pa"))
+    air_density_kgm3 = atm.rho_kgm3  # [kg/m^3]
     gravity_mps2 = gravity_acceleration_f(altitude_m)  # [m/s^2]
     volume_m3 = volume_balloon_f(altitude_m, helium_mass_kg, atm=atm)  # [m^3]
 
@@ -0,0 +1,114 @@
+########################################################################
+# Purdue Orbital, Flight Dynamics
+#
+# Project Name: Ascent/Descent Modeling
+#
+# Function Name: descent_quasi_steady_f
+# File Name: descent_quasi_steady_f.py
+#
+# Contributors: Purdue Orbital Flight Dynamics Team
+# Date Created: 10/18/2026
+# Last Updated: 10/18/2026
+#
+# Function Description:
+#   Estimates descent time and mean descent rate from burst altitude to
+#   ground level assuming the payload always falls at terminal velocity:
+#       v_t(h) = sqrt(2 * m * g(h) / (rho(h) * C_D * A))
+#       t      = integral from ground to burst of dh / v_t(h)
+#   with Simpson's rule on altitude_points altitudes.
+#   descent_terminal_velocity_f evaluates v_t alone (scalar or array).
+#
+# Notes:
+#   - Ignores the short transient right after burst, when the payload has
+#     not yet reached terminal velocity (a few seconds out of a descent
+#     of tens of minutes).
+#   - Every input except the altitudes may be an array; they broadcast to
+#     one lane per element and are evaluated in one vectorized pass on a
+#     shared altitude grid.
+#
+# References:
+#   None
+#
+# Input variables:
+# - burst_altitude_m: descent start altitude, m, > ground_level_m
+# - ground_level_m: ground altitude, m, non-negative
+# - system_mass_kg: descending mass, kg, positive
+# - drag_area_m2: parachute/balloon drag reference area, m^2, positive
+# - drag_coefficient: descent drag coefficient, -, positive
+# - temperature_offset_K: atmosphere temperature offset at constant
+#   pressure, K (see modules.atmosphere_f.offset_temperature)
+# - altitude_points: quadrature nodes (rounded up to odd)
+# - atmosphere_table: optional AtmosphereTable interpolated instead of the
+#   exact atmosphere model, or None
+#
+# Output variables (descent_quasi_steady_f):
+# - mean_descent_rate_mps: (burst - ground) / descent time, m/s, positive
+# - descent_time_s: time from burst to ground, s
+#
+########################################################################
+
+from __future__ import annotations
+
+import numpy as np
+
+from modules.atmosphere_f import AtmosphereTable, atmosphere_m, offset_temperature
+from modules.drag_force_descent_f import DRAG_COEFF_DESCENT
+from modules.gravity_acceleration_f import EARTH_RADIUS_M, STANDARD_GRAVITY_MPS2
+
+DESCENT_QUASI_STEADY_POINTS = 257  # [-] altitude quadrature nodes (odd, Simpson)
+
+
+def descent_terminal_velocity_f(
+    altitude_m,
+    system_mass_kg,
+    drag_area_m2,
+    *,
+    atm,
+    drag_coefficient=DRAG_COEFF_DESCENT,
+):
+    """Return the terminal descent speed sqrt(2 m g / (rho C_D A)) in m/s (positive)."""
+    gravity_mps2 = STANDARD_GRAVITY_MPS2 * (EARTH_RADIUS_M / (EARTH_RADIUS_M + altitude_m)) ** 2  # [m/s^2]
+    return np.sqrt(2.0 * system_mass_kg * gravity_mps2 / (atm.rho_kgm3 * drag_coefficient * drag_area_m2))  # [m/s]
+
+
+def descent_quasi_steady_f(
+    burst_altitude_m: float,
+    ground_level_m: float,
+    system_mass_kg,
+    drag_area_m2,
+    *,
+    drag_coefficient=DRAG_COEFF_DESCENT,
+    temperature_offset_K=0.0,
+    altitude_points: int = DESCENT_QUASI_STEADY_POINTS,
+    atmosphere_table: AtmosphereTable | None = None,
+) -> tuple:
+    """Return (mean_descent_rate_mps, descent_time_s) at terminal velocity."""
+    mass, area, drag, offset = np.broadcast_arrays(*(
+        np.asarray(value, dtype=float)
+        for value in (system_mass_kg, drag_area_m2, drag_coefficient, temperature_offset_K)
+    ))
+    node_count = max(int(altitude_points), 3) | 1
+
+    altitude_m = np.linspace(ground_level_m, burst_altitude_m, node_count)  # [m]
+    if atmosphere_table is None:
+        atm = atmosphere_m(altitude_m, geometric=True, output="state")
+    else:
+        atm = atmosphere_table.atmosphere_m(altitude_m, geometric=True, output="state")
+    if np.any(offset != 0.0):
+        atm = offset_temperature(atm, offset[..., None])
+
+    terminal_velocity_mps = descent_terminal_velocity_f(
+        altitude_m, mass[..., None], area[..., None], atm=atm, drag_coefficient=drag[..., None],
+    )  # [m/s]
+
+    weights = np.ones(node_count)
+    weights[1:-1:2] = 4.0
+    weights[2:-1:2] = 2.0
+    spacing_m = (burst_altitude_m - ground_level_m) / (node_count - 1)  # [m]
+    descent_time_s = (spacing_m / 3.0) * np.sum(weights / terminal_velocity_mps, axis=-1)  # [s]
+
+    mean_descent_rate_mps = (burst_altitude_m - ground_level_m) / descent_time_s  # [m/s]
+
+    if mass.ndim == 0:
+        return float(mean_descent_rate_mps), float(descent_time_s)
+    return mean_descent_rate_mps, descent_time_s
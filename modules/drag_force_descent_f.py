@@ -1,41 +1,57 @@
 try:
-    from modules.atmosphere_f import atmosphere_m
+    from modules.atmosphere_f import as_atmosphere_state, atmosphere_m
     from modules.balloon_cross_sectional_area_f import balloon_cross_sectional_area_f
 except ModuleNotFoundError:
-    from atmosphere_f import atmosphere_m
+    from atmosphere_f import as_atmosphere_state, atmosphere_m
     from balloon_cross_sectional_area_f import balloon_cross_sectional_area_f
 
-def drag_force_descent_f(velocity: float, altitude: float, cross_sec_area: float) -> float:
+DRAG_COEFF_DESCENT = 1.75  # dimensionless, balloon/parachute drag coefficient
+PARACHUTE_AREA_M2 = 15.0 * 0.3048**2  # m^2, 15 ft^2 parachute from the MATLAB model
+
+
+def drag_force_descent_f(
+    velocity: float,
+    altitude: float,
+    cross_sec_area: float,
+    *,
+    atm=None,
+    drag_coefficient: float = DRAG_COEFF_DESCENT,
+) -> float:
     """
     Computes the drag force acting on the balloon during descent.
 
     Parameters
     ----------
-    velocity : float
+    velocity : float | ndarray
         Descent velocity of balloon (m/s).
-    altitude : float
+    altitude : float | ndarray
         Geometric altitude (m), positive upward.
+    cross_sec_area : float | ndarray
+        Drag reference area (m^2).
+    atm : AtmosphereState | dict | None
+        Atmosphere sample at altitude. When None it is evaluated here; pass
+        it in from the integration loop to avoid a second lookup.
+    drag_coefficient : float | ndarray
+        Drag coefficient of balloon/parachute (dimensionless).
 
     Returns
     -------
-    float
-        Drag force on balloon (N).
+    float | ndarray
+        Drag force magnitude on balloon (N). Arrays broadcast, one element
+        per lane.
     """
-    print("Vel: ", velocity, altitude)
     # Get air density from standard atmosphere (geometric altitude in meters)
-    atm = atmosphere_m(altitude, geometric=True, output="dict")
-    air_density = atm["rho_kgm3"]  # kg/m^3
+    if atm is None:
+        atm = atmosphere_m(altitude, geometric=True, output="state")
+    air_density = as_atmosphere_state(atm, required=("rho_kgm3",)).rho_kgm3  # kg/m^3
 
     # Get balloon cross-sectional area
     #cross_sec_area = balloon_cross_sectional_area_f(altitude, mass, atm=atm)  # m^2
 
-    # Drag coefficient of balloon/parachute
-    DRAG_COEFFICIENT = 1.75  # dimensionless
-
     # Compute drag force
     drag_force = (
         0.5
-        * DRAG_COEFFICIENT
+        * drag_coefficient
         * air_density
         * cross_sec_area
         * velocity**2
@@ -8,7 +8,7 @@
 #
 # Contributors: Purdue Orbital Flight Dynamics Team
 # Date Created: Unknown
-# Last Updated: 02/09/2026
+# Last Updated: 10/18/2026
 #
 # Function Description:
 #   Computes aerodynamic drag magnitude on the balloon using:
@@ -25,8 +25,9 @@
 # - velocity_mps: vertical velocity, m/s, sign varies
 # - helium_mass_kg: helium mass in balloon, kg, non-negative
 # - altitude_m: geometric altitude, m, non-negative
-# - atm: atmosphere dict (SI) from modules.atmosphere.atmosphere_m, must include:
-#       - rho_kgm3 (kg/m^3)
+# - atm: AtmosphereState from modules.atmosphere_f.atmosphere_m(..., output="state")
+#   (a legacy atmosphere dict is also accepted), must include:
+#       - rho_kgm3 (kg/m^3), T_K (K), p_Pa (Pa)
 #
 # Output variables:
 # - drag_force_N: drag force magnitude, N, non-negative
@@ -36,16 +37,25 @@
 from __future__ import annotations
 
 try:
+    from modules.atmosphere_f import AtmosphereState, as_atmosphere_state
     from modules.balloon_cross_sectional_area_f import balloon_cross_sectional_area_f
 except ModuleNotFoundError:
+    from atmosphere_f import AtmosphereState, as_atmosphere_state
     from balloon_cross_sectional_area_f import balloon_cross_sectional_area_f
 
 DRAG_COEFF_SPHERE = 0.47  # [-] representative sphere drag coefficient
 
 
-def drag_force_f(velocity_mps: float, helium_mass_kg: float, altitude_m: float, *, atm: dict) -> float:
+def drag_force_f(
+    velocity_mps: float,
+    helium_mass_kg: float,
+    altitude_m: float,
+    *,
+    atm: AtmosphereState | dict,
+) -> float:
     """Return drag magnitude in newtons."""
-    air_density_kgm3 = float(atm["rho_kgm3"])  # [kg/m^3]
+    atm = as_atmosphere_state(atm, required=("rho_kgm3", "T_K", "p_Pa"))
+    air_density_kgm3 = atm.rho_kgm3  # [kg/m^3]
     area_m2 = balloon_cross_sectional_area_f(altitude_m, helium_mass_kg, atm=atm)  # [m^2]
 
     drag_force_N = 0.5 * DRAG_COEFF_SPHERE * air_density_kgm3 * area_m2 * (velocity_mps ** 2)  # [N]
@@ -25,9 +25,9 @@ def helium_mass_f(altitude: float, net_buoyancy_force: float) -> float:
     OTHER_MASS = BALLOON_MASS + NECK_MASS + ROPE_MASS
 
     # Get atmospheric properties at altitude
-    atm = atmosphere_m(altitude, geometric=True, output="dict")
+    atm = atmosphere_m(altitude, geometric=True, output="state")
 
-    air_density = atm["rho_kgm3"]  # kg/m^3
+    air_density = atm.rho_kgm3  # kg/m^3
 
     # Standard gravity used in USSA76 (constant)
     gravity_acceleration = 9.80665  # m/s^2
@@ -35,7 +35,7 @@ def helium_mass_f(altitude: float, net_buoyancy_force: float) -> float:
     # Helium density approximation using ideal gas law:
     # ρ = p / (R_specific * T)
     R_HE = 2077.0  # J/(kg·K), specific gas constant for helium
-    helium_density = atm["p_Pa"] / (R_HE * atm["T_K"])  # kg/m^3
+    helium_density = atm.p_Pa / (R_HE * atm.T_K)  # kg/m^3
 
     # Other weight
     other_weight = OTHER_MASS * gravity_acceleration
@@ -0,0 +1,312 @@
+########################################################################
+# Purdue Orbital, Flight Dynamics
+#
+# Project Name: Ascent/Descent Modeling
+#
+# Function Name: integrate_vertical_motion_f
+# File Name: integrate_vertical_motion_f.py
+#
+# Contributors: Purdue Orbital Flight Dynamics Team
+# Date Created: 10/18/2026
+# Last Updated: 10/18/2026
+#
+# Function Description:
+#   Integrates 1-D vertical motion
+#       dx/dt = v,   dv/dt = a(t, x, v)
+#   with the embedded Dormand-Prince 5(4) Runge-Kutta pair and adaptive step
+#   size control, stopping exactly where the position crosses a target
+#   altitude (burst altitude on ascent, ground level on descent).
+#
+# Notes:
+#   - The crossing is bracketed by an accepted step, estimated on the cubic
+#     Hermite interpolant of that step, re-integrated with one RK step of the
+#     estimated length and finished with a Newton correction, so the final
+#     state lies on the target altitude to round-off.
+#   - The stage values are carried as Python floats; for a two-component
+#     state this is far cheaper than small NumPy arrays.
+#
+# References:
+#   Dormand, J. R., & Prince, P. J. (1980). A family of embedded Runge-Kutta
+#   formulae. Journal of Computational and Applied Mathematics, 6(1), 19-26.
+#   Hairer, E., Norsett, S. P., & Wanner, G. (1993). Solving Ordinary
+#   Differential Equations I (2nd ed.), Section II.4 (step size control).
+#
+# Input variables:
+# - acceleration_f: callable a(t, x, v), m/s^2
+# - time_s: initial time, s
+# - position_m: initial position, m
+# - velocity_mps: initial velocity, m/s
+# - stop_position_m: target altitude that ends the integration, m
+# - direction: +1 to stop when rising through stop_position_m, -1 when falling
+# - rtol: relative error tolerance per step, -
+# - atol_position_m: absolute position error tolerance per step, m
+# - atol_velocity_mps: absolute velocity error tolerance per step, m/s
+# - first_step_s: initial trial step, s, positive
+# - max_step_s: largest allowed step, s, positive
+# - max_steps: accepted-step limit, positive
+# - abort_f: optional callable (t, x, v, a) -> reason string or "" checked at
+#   every accepted state; a non-empty reason stops the integration
+# - record_history: keep the accepted-step time history, bool
+# - on_step_f: optional callable (t, x, v, a) called with the initial and
+#   every accepted state (including the final one), whether or not the
+#   history is recorded; lets callers accumulate statistics in O(1) memory
+#
+# Output variables (returned dict):
+# - time_s, position_m, velocity_mps, acceleration_mps2: accepted-step
+#   histories (empty lists when record_history is False)
+# - final_time_s, final_position_m, final_velocity_mps: final state
+# - reached_stop: True if stop_position_m was crossed, bool
+# - hit_step_limit: True if max_steps was reached first, bool
+# - abort_reason: abort_f reason, NON_FINITE_REASON (non-finite initial
+#   state, or a step whose error stays non-finite), REJECTION_REASON
+#   (MAX_REJECTIONS rejected attempts in a row), MIN_STEP_REASON (step
+#   below MIN_STEP_RATIO of the elapsed time), or "" if not aborted
+# - steps: accepted steps, -
+# - rejected_steps: rejected steps, -
+# - evaluations: acceleration_f calls, -
+#
+########################################################################
+
+from __future__ import annotations
+
+import math
+
+DEFAULT_RTOL = 1e-6               # [-]
+DEFAULT_ATOL_POSITION_M = 1e-3    # [m]
+DEFAULT_ATOL_VELOCITY_MPS = 1e-6  # [m/s]
+DEFAULT_MAX_STEPS = 1_000_000     # [-]
+
+# Dormand-Prince 5(4) coefficients
+C2, C3, C4, C5 = 1.0 / 5.0, 3.0 / 10.0, 4.0 / 5.0, 8.0 / 9.0
+A21 = 1.0 / 5.0
+A31, A32 = 3.0 / 40.0, 9.0 / 40.0
+A41, A42, A43 = 44.0 / 45.0, -56.0 / 15.0, 32.0 / 9.0
+A51, A52, A53, A54 = 19372.0 / 6561.0, -25360.0 / 2187.0, 64448.0 / 6561.0, -212.0 / 729.0
+A61, A62, A63, A64, A65 = 9017.0 / 3168.0, -355.0 / 33.0, 46732.0 / 5247.0, 49.0 / 176.0, -5103.0 / 18656.0
+B1, B3, B4, B5, B6 = 35.0 / 384.0, 500.0 / 1113.0, 125.0 / 192.0, -2187.0 / 6784.0, 11.0 / 84.0
+E1, E3, E4, E5, E6, E7 = (
+    71.0 / 57600.0, -71.0 / 16695.0, 71.0 / 1920.0, -17253.0 / 339200.0, 22.0 / 525.0, -1.0 / 40.0,
+)
+
+SAFETY_FACTOR = 0.9   # [-] step size safety factor
+MIN_STEP_SCALE = 0.2  # [-] largest step shrink per attempt
+MAX_STEP_SCALE = 5.0  # [-] largest step growth per attempt
+MAX_REJECTIONS = 50   # [-] consecutive rejected attempts before giving up
+MIN_STEP_RATIO = 1e-12  # [-] smallest step, relative to max(|t|, 1 s)
+
+NON_FINITE_REASON = "non-finite state or acceleration"
+REJECTION_REASON = "step size control failed: too many consecutive rejected steps"
+MIN_STEP_REASON = "step size control failed: step below the minimum"
+
+
+def _dormand_prince_step(acceleration_f, t, x, v, a, h):
+    """Take one DP5(4) step of length h from (t, x, v) with a = a(t, x, v).
+
+    Returns (x_new, v_new, a_new, error_x, error_v); a_new is the FSAL stage.
+    """
+    x2 = x + h * (A21 * v)
+    v2 = v + h * (A21 * a)
+    a2 = acceleration_f(t + C2 * h, x2, v2)
+
+    x3 = x + h * (A31 * v + A32 * v2)
+    v3 = v + h * (A31 * a + A32 * a2)
+    a3 = acceleration_f(t + C3 * h, x3, v3)
+
+    x4 = x + h * (A41 * v + A42 * v2 + A43 * v3)
+    v4 = v + h * (A41 * a + A42 * a2 + A43 * a3)
+    a4 = acceleration_f(t + C4 * h, x4, v4)
+
+    x5 = x + h * (A51 * v + A52 * v2 + A53 * v3 + A54 * v4)
+    v5 = v + h * (A51 * a + A52 * a2 + A53 * a3 + A54 * a4)
+    a5 = acceleration_f(t + C5 * h, x5, v5)
+
+    x6 = x + h * (A61 * v + A62 * v2 + A63 * v3 + A64 * v4 + A65 * v5)
+    v6 = v + h * (A61 * a + A62 * a2 + A63 * a3 + A64 * a4 + A65 * a5)
+    a6 = acceleration_f(t + h, x6, v6)
+
+    x_new = x + h * (B1 * v + B3 * v3 + B4 * v4 + B5 * v5 + B6 * v6)
+    v_new = v + h * (B1 * a + B3 * a3 + B4 * a4 + B5 * a5 + B6 * a6)
+    a_new = acceleration_f(t + h, x_new, v_new)
+
+    error_x = h * (E1 * v + E3 * v3 + E4 * v4 + E5 * v5 + E6 * v6 + E7 * v_new)
+    error_v = h * (E1 * a + E3 * a3 + E4 * a4 + E5 * a5 + E6 * a6 + E7 * a_new)
+    return x_new, v_new, a_new, error_x, error_v
+
+
+def _hermite_crossing_fraction(x0, v0, x1, v1, h, target):
+    """Return theta in [0, 1] where the cubic Hermite interpolant of a step hits target."""
+    low, high = 0.0, 1.0
+    theta = (target - x0) / (x1 - x0) if x1 != x0 else 1.0
+
+    for _ in range(50):
+        theta = min(max(theta, low), high)
+        t2 = theta * theta
+        t3 = t2 * theta
+        h00 = 2.0 * t3 - 3.0 * t2 + 1.0
+        h10 = t3 - 2.0 * t2 + theta
+        h01 = -2.0 * t3 + 3.0 * t2
+        h11 = t3 - t2
+        residual = h00 * x0 + h10 * h * v0 + h01 * x1 + h11 * h * v1 - target
+
+        if (residual < 0.0) == (x1 > x0):
+            low = theta
+        else:
+            high = theta
+
+        slope = (
+            (6.0 * t2 - 6.0 * theta) * x0
+            + (3.0 * t2 - 4.0 * theta + 1.0) * h * v0
+            + (-6.0 * t2 + 6.0 * theta) * x1
+            + (3.0 * t2 - 2.0 * theta) * h * v1
+        )
+        if slope != 0.0:
+            candidate = theta - residual / slope
+            if low < candidate < high:
+                theta = candidate
+            else:
+                theta = 0.5 * (low + high)
+        else:
+            theta = 0.5 * (low + high)
+
+        if high - low < 1e-14:
+            break
+
+    return theta
+
+
+def integrate_vertical_motion_f(
+    acceleration_f,
+    time_s: float,
+    position_m: float,
+    velocity_mps: float,
+    *,
+    stop_position_m: float,
+    direction: int = 1,
+    rtol: float = DEFAULT_RTOL,
+    atol_position_m: float = DEFAULT_ATOL_POSITION_M,
+    atol_velocity_mps: float = DEFAULT_ATOL_VELOCITY_MPS,
+    first_step_s: float = 0.1,
+    max_step_s: float = math.inf,
+    max_steps: int = DEFAULT_MAX_STEPS,
+    abort_f=None,
+    record_history: bool = True,
+    on_step_f=None,
+) -> dict:
+    """Integrate vertical motion adaptively until stop_position_m is crossed."""
+    evaluations = 0
+
+    def counted_acceleration(t, x, v):
+        nonlocal evaluations
+        evaluations += 1
+        return acceleration_f(t, x, v)
+
+    t = time_s
+    x = position_m
+    v = velocity_mps
+    a = counted_acceleration(t, x, v)
+
+    time_history: list[float] = []
+    position_history: list[float] = []
+    velocity_history: list[float] = []
+    acceleration_history: list[float] = []
+
+    def record(t_, x_, v_, a_):
+        if on_step_f is not None:
+            on_step_f(t_, x_, v_, a_)
+        if record_history:
+            time_history.append(t_)
+            position_history.append(x_)
+            velocity_history.append(v_)
+            acceleration_history.append(a_)
+
+    record(t, x, v, a)
+
+    result = {
+        "reached_stop": False,
+        "hit_step_limit": False,
+        "abort_reason": "",
+    }
+
+    if not all(math.isfinite(value) for value in (t, x, v, a)):
+        result["abort_reason"] = NON_FINITE_REASON
+    else:
+        abort_reason = abort_f(t, x, v, a) if abort_f is not None else ""
+        if (x - stop_position_m) * direction >= 0.0:
+            result["reached_stop"] = True
+        elif abort_reason:
+            result["abort_reason"] = abort_reason
+
+    h = min(first_step_s, max_step_s)
+    steps = 0
+    rejected_steps = 0
+    rejections_in_row = 0
+
+    while not result["reached_stop"] and not result["abort_reason"]:
+        if steps >= max_steps:
+            result["hit_step_limit"] = True
+            break
+
+        x_new, v_new, a_new, error_x, error_v = _dormand_prince_step(counted_acceleration, t, x, v, a, h)
+
+        scale_x = atol_position_m + rtol * max(abs(x), abs(x_new))
+        scale_v = atol_velocity_mps + rtol * max(abs(v), abs(v_new))
+        error = math.sqrt(0.5 * ((error_x / scale_x) ** 2 + (error_v / scale_v) ** 2))
+
+        if error > 1.0 or not math.isfinite(error):
+            rejected_steps += 1
+            rejections_in_row += 1
+            shrink = SAFETY_FACTOR * error ** -0.2 if math.isfinite(error) else MIN_STEP_SCALE
+            h *= max(MIN_STEP_SCALE, shrink)
+            # A non-finite derivative is never cured by shrinking the step;
+            # stop instead of rejecting forever (rejections do not count
+            # toward max_steps)
+            if rejections_in_row >= MAX_REJECTIONS:
+                result["abort_reason"] = NON_FINITE_REASON if not math.isfinite(error) else REJECTION_REASON
+            elif h < MIN_STEP_RATIO * max(abs(t), 1.0):
+                result["abort_reason"] = NON_FINITE_REASON if not math.isfinite(error) else MIN_STEP_REASON
+            continue
+
+        rejections_in_row = 0
+        steps += 1
+
+        if (x_new - stop_position_m) * direction >= 0.0:
+            # Locate the crossing on the step interpolant, land on it with one
+            # RK step of that length, then remove the residual with Newton.
+            theta = _hermite_crossing_fraction(x, v, x_new, v_new, h, stop_position_m)
+            h_event = theta * h
+            if h_event > 0.0:
+                x_new, v_new, a_new, _, _ = _dormand_prince_step(counted_acceleration, t, x, v, a, h_event)
+            else:
+                x_new, v_new, a_new = x, v, a
+            t_new = t + h_event
+            if v_new != 0.0:
+                dt = (stop_position_m - x_new) / v_new
+                t_new += dt
+                v_new += a_new * dt
+            x_new = stop_position_m
+            result["reached_stop"] = True
+        else:
+            t_new = t + h
+
+        t, x, v, a = t_new, x_new, v_new, a_new
+        record(t, x, v, a)
+
+        if abort_f is not None and not result["reached_stop"]:
+            result["abort_reason"] = abort_f(t, x, v, a) or ""
+
+        grow = SAFETY_FACTOR * error ** -0.2 if error > 0.0 else MAX_STEP_SCALE
+        h = min(h * min(MAX_STEP_SCALE, grow), max_step_s)
+
+    result.update({
+        "time_s": time_history,
+        "position_m": position_history,
+        "velocity_mps": velocity_history,
+        "acceleration_mps2": acceleration_history,
+        "final_time_s": t,
+        "final_position_m": x,
+        "final_velocity_mps": v,
+        "steps": steps,
+        "rejected_steps": rejected_steps,
+        "evaluations": evaluations,
+    })
+    return result
@@ -0,0 +1,62 @@
+########################################################################
+# Purdue Orbital, Flight Dynamics
+#
+# Project Name: Ascent/Descent Modeling
+#
+# Function Name: json_safe_f, summary_json_f
+# File Name: json_safe_f.py
+#
+# Contributors: Purdue Orbital Flight Dynamics Team
+# Date Created: 10/18/2026
+# Last Updated: 10/18/2026
+#
+# Function Description:
+#   Converts solver summaries into strict JSON: NumPy arrays become lists,
+#   NumPy scalars become Python numbers, and nan/inf become null (strict
+#   JSON has no non-finite numbers).
+#
+# Notes:
+#   - Used by the web service (ascent_web_integration.py) and the batch
+#     runner (batch_runner.py), which serialize inside worker processes.
+#
+# References:
+#   None
+#
+# Input variables:
+# - value: summary dict (or any nesting of dicts, lists, tuples, arrays
+#   and scalars)
+#
+# Output variables:
+# - json_safe_f: the same structure with JSON-compatible values
+# - summary_json_f: compact JSON text, str
+#
+########################################################################
+
+from __future__ import annotations
+
+import json
+import math
+
+import numpy as np
+
+
+def json_safe_f(value):
+    """Convert arrays, NumPy scalars and non-finite floats into JSON values."""
+    if isinstance(value, dict):
+        return {key: json_safe_f(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [json_safe_f(item) for item in value]
+    if isinstance(value, np.ndarray):
+        if value.dtype.kind == "f" and not np.isfinite(value).all():
+            return [item if math.isfinite(item) else None for item in value.tolist()]
+        return value.tolist()
+    if isinstance(value, np.generic):
+        value = value.item()
+    if isinstance(value, float) and not math.isfinite(value):
+        return None
+    return value
+
+
+def summary_json_f(value) -> str:
+    """Serialize a summary as strict JSON text."""
+    return json.dumps(json_safe_f(value), allow_nan=False)
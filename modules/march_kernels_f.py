@@ -0,0 +1,264 @@
+########################################################################
+# Purdue Orbital, Flight Dynamics
+#
+# Project Name: Ascent/Descent Modeling
+#
+# Function Name: ascent_march_kernel_f, descent_march_kernel_f
+# File Name: march_kernels_f.py
+#
+# Contributors: Purdue Orbital Flight Dynamics Team
+# Date Created: 10/18/2026
+# Last Updated: 10/18/2026
+#
+# Function Description:
+#   Self-contained fixed-step march loops for the ascent (to burst) and
+#   the descent (to the ground), compiled with Numba when it is installed.
+#   Numba is imported, and every kernel compiled (or loaded from Numba's
+#   cache), on the first kernel call, so importing the package stays cheap.
+#   Each kernel inlines the USSA76 layer model (temperature, pressure and
+#   density only), gravity, the ideal-gas helium volume and the drag terms,
+#   so the loop runs without Python-level calls.
+#
+# Notes:
+#   - Optional dependency: without Numba, JIT_AVAILABLE is False and the
+#     callers (ascent_simulation._march_ascent_f,
+#     descent_simulation._march_descent_f) keep their Python loops. Set
+#     USE_JIT = False to force the Python loops with Numba installed.
+#   - Coverage: the Euler ascent march of simulate_ascent_rate_f (and so
+#     the helium solvers and sweeps), simulate_ascent_summary_f and the
+#     scalar tail of simulate_ascent_rate_batch_f, and the descent march of
+#     simulate_descent_f and the tail of simulate_descent_batch_f. Not
+#     covered: simulate_ascent_motion_f and simulate_ascent_motion_stream_f
+#     (their history recording stays in Python), simulate_descent_trajectory_f
+#     (it records a history), the vectorized lockstep batch steps and
+#     every rk45 path.
+#   - The kernels evaluate the exact atmosphere model; runs that
+#     interpolate an AtmosphereTable always use the Python loops.
+#   - Measured speedup with numba 0.68 is about 20x for a 30 km ascent
+#     march and about 30x for a descent, once compiled; the first call in
+#     a process pays the import and compilation (or cache load).
+#   - Same formulas, in the same order, as Atmosphere(...),
+#     ascent_forces_f, gravity_force_f and drag_force_descent_f. Compiled
+#     code may round transcendental functions (exp, pow, cbrt) differently
+#     in the last bit, so results agree with the Python loops to
+#     JIT_RTOL relative; a step count can differ by one when a step lands
+#     within round-off of the stop altitude.
+#   - Run without Numba (plain Python) the kernels reproduce the Python
+#     loops bit for bit.
+#
+# References:
+#   U.S. Standard Atmosphere, 1976 (NOAA-S/T 76-1562)
+#
+# Input variables (ascent_march_kernel_f):
+# - altitude_m, velocity_mps: starting state, m, m/s
+# - burst_altitude_m: stop altitude, m
+# - helium_mass_kg: helium mass, kg
+# - total_mass_kg: payload + helium mass, kg
+# - drag_coefficient: balloon drag coefficient, -
+# - time_step_s: Euler step, s
+#
+# Output variables (ascent_march_kernel_f, tuple):
+# - velocity_sum, step_count, gage_force, failed, velocity, altitude: as
+#   ascent_simulation._march_ascent_f
+# - mean_rate, sum_squares, max_velocity, altitude_at_max_velocity,
+#   max_acceleration, min_net_force: running statistics, as
+#   _march_ascent_f(accumulate=True); always computed (a few flops per
+#   step next to the inline atmosphere)
+#
+# Input variables (descent_march_kernel_f):
+# - position_m, velocity_mps: starting state, m, m/s
+# - ground_level_m: stop altitude, m
+# - drag_area_m2: drag reference area, m^2
+# - system_mass_kg: descending mass, kg
+# - drag_coefficient: descent drag coefficient, -
+# - time_step_s: Euler step, s
+# - max_steps: step limit
+#
+# Output variables (descent_march_kernel_f, tuple):
+# - speed_sum, speed_count, steps, position, velocity: as
+#   descent_simulation._march_descent_f
+#
+########################################################################
+
+from __future__ import annotations
+
+import functools
+import importlib.util
+import math
+
+from modules.ascent_forces_f import CORRECTION_MASS_KG, SPHERE_VOLUME_TO_RADIUS
+from modules.atmosphere_f import GMR, HB, LB, PB, PZERO, REARTH_KM, RHOZERO, TB, TZERO
+from modules.balloon_density_f import GAS_CONSTANT, HELIUM_MOLAR_MASS
+from modules.gravity_acceleration_f import EARTH_RADIUS_M, STANDARD_GRAVITY_MPS2
+
+JIT_AVAILABLE = importlib.util.find_spec("numba") is not None  # optional dependency
+USE_JIT = JIT_AVAILABLE   # callers use the kernels only while this is True
+JIT_RTOL = 1e-9           # [-] documented agreement with the Python loops
+
+_LAYER_COUNT = len(LB)
+_PYTHON_KERNELS: dict = {}  # name -> plain function, in definition order
+
+
+def _jit(function):
+    """Register a kernel; return a stand-in that compiles every kernel on its first call."""
+    _PYTHON_KERNELS[function.__name__] = function
+
+    @functools.wraps(function)
+    def compile_on_first_call(*args):
+        _compile_kernels_f()
+        return globals()[function.__name__](*args)
+
+    return compile_on_first_call
+
+
+def _compile_kernels_f() -> None:
+    """Replace the stand-ins with numba.njit kernels (the plain functions without Numba)."""
+    if JIT_AVAILABLE:
+        import numba
+        compile_f = numba.njit(cache=True)
+    else:
+        def compile_f(function):
+            return function
+
+    # _ussa76_f is registered first, so the kernels that call it see the
+    # compiled version when Numba compiles them
+    for name, function in _PYTHON_KERNELS.items():
+        globals()[name] = compile_f(function)
+
+
+@_jit
+def _ussa76_f(altitude_m: float) -> tuple:
+    """Return (T_K, p_Pa, rho_kgm3) at a geometric altitude, as Atmosphere(...)."""
+    h_geom_km = altitude_m / 1000.0
+    h_geopot_km = (REARTH_KM * h_geom_km) / (REARTH_KM + h_geom_km)
+    if h_geopot_km < HB[0]:
+        h_geopot_km = HB[0]
+    if h_geopot_km > HB[_LAYER_COUNT]:
+        h_geopot_km = HB[_LAYER_COUNT]
+
+    # Same layer convention as Atmosphere(...): HB[i] < h <= HB[i + 1]
+    i = 0
+    while i < _LAYER_COUNT - 1 and h_geopot_km > HB[i + 1]:
+        i += 1
+
+    T0 = TB[i]
+    L = LB[i]
+    dh = h_geopot_km - HB[i]
+    T = T0 + L * dh  # K
+
+    if abs(L) < 1e-12:
+        p_ratio = PB[i] * math.exp(-GMR * dh / T0)
+    else:
+        p_ratio = PB[i] * (T0 / T) ** (GMR / L)
+
+    rho_ratio = p_ratio / (T / TZERO)
+    return T, p_ratio * PZERO, rho_ratio * RHOZERO
+
+
+@_jit
+def ascent_march_kernel_f(
+    altitude_m: float,
+    velocity_mps: float,
+    burst_altitude_m: float,
+    helium_mass_kg: float,
+    total_mass_kg: float,
+    drag_coefficient: float,
+    time_step_s: float,
+) -> tuple:
+    """Explicit-Euler ascent march to burst; mirrors _march_ascent_f(accumulate=True)."""
+    velocity_sum = 0.0
+    gage_force_N = math.nan
+    step_index = 0
+
+    mean_rate = 0.0
+    sum_squares = 0.0
+    max_velocity = 0.0
+    altitude_at_max_velocity = altitude_m
+    max_acceleration = -math.inf
+    min_net_force = math.inf
+
+    while altitude_m < burst_altitude_m:
+        temperature_K, pressure_Pa, air_density_kgm3 = _ussa76_f(altitude_m)
+
+        gravity_mps2 = STANDARD_GRAVITY_MPS2 * (EARTH_RADIUS_M / (EARTH_RADIUS_M + altitude_m)) ** 2  # [m/s^2]
+        helium_density_kgm3 = (pressure_Pa * HELIUM_MOLAR_MASS) / (GAS_CONSTANT * temperature_K)  # [kg/m^3]
+        volume_m3 = helium_mass_kg / helium_density_kgm3  # [m^3]
+        radius_m = (SPHERE_VOLUME_TO_RADIUS * volume_m3) ** (1.0 / 3.0)  # [m]
+        area_m2 = math.pi * radius_m * radius_m  # [m^2]
+
+        buoyant_force_N = air_density_kgm3 * volume_m3 * gravity_mps2  # [N]
+        drag_force_N = 0.5 * drag_coefficient * air_density_kgm3 * area_m2 * (velocity_mps * velocity_mps)  # [N]
+        net_force_N = buoyant_force_N - drag_force_N - gravity_mps2 * total_mass_kg  # [N]
+
+        if step_index == 0:
+            gage_force_N = buoyant_force_N - (CORRECTION_MASS_KG + helium_mass_kg) * gravity_mps2  # [N]
+
+        if net_force_N < min_net_force:
+            min_net_force = net_force_N
+
+        if net_force_N <= 0.0:
+            return (
+                velocity_sum, step_index, gage_force_N, True, velocity_mps, altitude_m,
+                mean_rate, sum_squares, max_velocity, altitude_at_max_velocity, max_acceleration, min_net_force,
+            )
+
+        acceleration_mps2 = net_force_N / total_mass_kg  # [m/s^2]
+        velocity_mps += acceleration_mps2 * time_step_s  # [m/s]
+        altitude_m += velocity_mps * time_step_s         # [m]
+
+        velocity_sum += velocity_mps
+        step_index += 1
+
+        delta = velocity_mps - mean_rate
+        mean_rate += delta / step_index
+        sum_squares += delta * (velocity_mps - mean_rate)
+        if velocity_mps > max_velocity:
+            max_velocity = velocity_mps
+            altitude_at_max_velocity = altitude_m
+        if acceleration_mps2 > max_acceleration:
+            max_acceleration = acceleration_mps2
+
+    return (
+        velocity_sum, step_index, gage_force_N, False, velocity_mps, altitude_m,
+        mean_rate, sum_squares, max_velocity, altitude_at_max_velocity, max_acceleration, min_net_force,
+    )
+
+
+@_jit
+def descent_march_kernel_f(
+    position_m: float,
+    velocity_mps: float,
+    ground_level_m: float,
+    drag_area_m2: float,
+    system_mass_kg: float,
+    drag_coefficient: float,
+    time_step_s: float,
+    max_steps: int,
+) -> tuple:
+    """Forward-Euler descent march to the ground; mirrors _march_descent_f."""
+    speed_sum = 0.0
+    speed_count = 0
+    steps = 0
+
+    while position_m > ground_level_m and steps < max_steps:
+        air_density_kgm3 = _ussa76_f(position_m)[2]
+
+        gravity_mps2 = STANDARD_GRAVITY_MPS2 * (EARTH_RADIUS_M / (EARTH_RADIUS_M + position_m)) ** 2  # [m/s^2]
+        gravity_force_N = -(gravity_mps2 * system_mass_kg)  # [N]
+
+        drag_force_N = 0.5 * drag_coefficient * air_density_kgm3 * drag_area_m2 * velocity_mps ** 2  # [N]
+        if velocity_mps > 0.0:
+            drag_force_N = -drag_force_N
+        elif velocity_mps == 0.0:
+            drag_force_N = 0.0
+
+        acceleration_mps2 = (gravity_force_N + drag_force_N) / system_mass_kg  # [m/s^2]
+        velocity_mps = velocity_mps + acceleration_mps2 * time_step_s     # [m/s]
+        position_m = position_m + velocity_mps * time_step_s              # [m]
+        steps += 1
+
+        if velocity_mps < 0.0:
+            speed_sum -= velocity_mps
+            speed_count += 1
+
+    return speed_sum, speed_count, steps, position_m, velocity_mps
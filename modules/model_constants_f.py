@@ -0,0 +1,57 @@
+########################################################################
+# Purdue Orbital, Flight Dynamics
+#
+# Project Name: Ascent/Descent Modeling
+#
+# Function Name: model_constants_f
+# File Name: model_constants_f.py
+#
+# Contributors: Purdue Orbital Flight Dynamics Team
+# Date Created: 10/18/2026
+# Last Updated: 10/18/2026
+#
+# Function Description:
+#   Collects the physical model constants a simulation result depends on
+#   (drag coefficient, correction mass, gas constants, gravity model and
+#   atmosphere source) into one dict, so every artifact that records or
+#   hashes the model uses the same definition.
+#
+# Notes:
+#   - Recorded in trajectory archives (trajectory_store_f) and solution
+#     surfaces (ascent_surface.py), and hashed with the solver constants by
+#     ascent_cache.model_hash_f.
+#   - Values are read from the force modules that define them, so a change
+#     there is picked up without editing this file.
+#
+# References:
+#   None
+#
+# Input variables:
+# - atmosphere_table: AtmosphereTable the results were run with, or None
+#   for the exact model
+#
+# Output variables:
+# - constants: dict of JSON-serializable constants
+#
+########################################################################
+
+from __future__ import annotations
+
+from modules.ascent_forces_f import CORRECTION_MASS_KG
+from modules.atmosphere_f import AtmosphereTable
+from modules.balloon_density_f import GAS_CONSTANT, HELIUM_MOLAR_MASS
+from modules.drag_force_f import DRAG_COEFF_SPHERE
+from modules.gravity_acceleration_f import EARTH_RADIUS_M, STANDARD_GRAVITY_MPS2
+
+
+def model_constants_f(atmosphere_table: AtmosphereTable | None = None) -> dict:
+    """Return the physical model constants a result depends on."""
+    return {
+        "drag_coefficient": DRAG_COEFF_SPHERE,
+        "correction_mass": CORRECTION_MASS_KG,
+        "gas_constant": GAS_CONSTANT,
+        "helium_molar_mass": HELIUM_MOLAR_MASS,
+        "earth_radius": EARTH_RADIUS_M,
+        "standard_gravity": STANDARD_GRAVITY_MPS2,
+        "atmosphere": "ussa1976" if atmosphere_table is None else f"table:{atmosphere_table.resolution_m!r}",
+    }
@@ -0,0 +1,130 @@
+########################################################################
+# Purdue Orbital, Flight Dynamics
+#
+# Project Name: Ascent/Descent Modeling
+#
+# Function Name: collect_perf_f, perf_phase_f
+# File Name: perf_counters_f.py
+#
+# Contributors: Purdue Orbital Flight Dynamics Team
+# Date Created: 10/18/2026
+# Last Updated: 10/18/2026
+#
+# Function Description:
+#   Opt-in performance instrumentation for the solver and the simulation
+#   loops. Inside "with collect_perf_f() as perf:" the instrumented code
+#   counts simulations, integration steps and atmosphere evaluations into
+#   perf, and perf_phase_f(name) blocks accumulate wall time per phase with
+#   the monotonic time.perf_counter clock.
+#
+# Notes:
+#   - ACTIVE is the collecting PerfCounters, or None when instrumentation
+#     is off. Instrumented code checks "ACTIVE is not None" before
+#     counting, and perf_phase_f returns a shared no-op context, so the
+#     cost when off is one attribute test per call.
+#   - Collections nest: when an inner collection ends, its counts and
+#     phase times are added to the enclosing one.
+#   - Compiled march kernels (modules.march_kernels_f) evaluate the
+#     atmosphere inline; their evaluations are counted from the step count.
+#   - Not thread-safe: one collection per process at a time.
+#
+# References:
+#   None
+#
+# Output variables (PerfCounters.as_dict):
+# - counts: simulations, integration_steps, atmosphere_calls,
+#   atmosphere_points, table_calls, table_points
+# - phases: {name: {"seconds", "calls"}}
+# - wall_time: seconds from the start to the end of the collection, s
+#
+########################################################################
+
+from __future__ import annotations
+
+import contextlib
+import time
+
+COUNT_FIELDS = (
+    "simulations",
+    "integration_steps",
+    "atmosphere_calls",
+    "atmosphere_points",
+    "table_calls",
+    "table_points",
+)
+
+ACTIVE: PerfCounters | None = None
+
+_NO_PHASE = contextlib.nullcontext()
+
+
+class PerfCounters:
+    """Counts and phase timers filled by the instrumented code."""
+
+    def __init__(self) -> None:
+        self.counts = dict.fromkeys(COUNT_FIELDS, 0)
+        self.phases: dict[str, list] = {}
+        self.wall_time = 0.0
+
+    def count(self, field: str, amount: int = 1) -> None:
+        """Add amount to one of COUNT_FIELDS."""
+        self.counts[field] += amount
+
+    def count_simulation(self, steps: int) -> None:
+        """Record one simulation of the given number of integration steps."""
+        self.counts["simulations"] += 1
+        self.counts["integration_steps"] += int(steps)
+
+    @contextlib.contextmanager
+    def phase(self, name: str):
+        """Accumulate the wall time of the enclosed block under name."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            entry = self.phases.setdefault(name, [0.0, 0])
+            entry[0] += elapsed
+            entry[1] += 1
+
+    def merge(self, other: PerfCounters) -> None:
+        """Add another collection's counts and phase times to this one."""
+        for field, amount in other.counts.items():
+            self.counts[field] += amount
+        for name, (seconds, calls) in other.phases.items():
+            entry = self.phases.setdefault(name, [0.0, 0])
+            entry[0] += seconds
+            entry[1] += calls
+
+    def as_dict(self) -> dict:
+        """Return the counts, phase times and wall time as plain data."""
+        return {
+            "counts": dict(self.counts),
+            "phases": {name: {"seconds": seconds, "calls": calls} for name, (seconds, calls) in self.phases.items()},
+            "wall_time": self.wall_time,
+        }
+
+
+@contextlib.contextmanager
+def collect_perf_f():
+    """Collect counts and phase times for the enclosed block; yields PerfCounters."""
+    global ACTIVE
+    parent = ACTIVE
+    counters = PerfCounters()
+    ACTIVE = counters
+    start = time.perf_counter()
+    try:
+        yield counters
+    finally:
+        counters.wall_time = time.perf_counter() - start
+        ACTIVE = parent
+        if parent is not None:
+            parent.merge(counters)
+
+
+def perf_phase_f(name: str):
+    """Return a context timing phase name, or a no-op when not collecting."""
+    counters = ACTIVE
+    if counters is None:
+        return _NO_PHASE
+    return counters.phase(name)
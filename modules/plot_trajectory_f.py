@@ -0,0 +1,138 @@
+########################################################################
+# Purdue Orbital, Flight Dynamics
+#
+# Project Name: Ascent/Descent Modeling
+#
+# Function Name: plot_trajectory_f
+# File Name: plot_trajectory_f.py
+#
+# Contributors: Purdue Orbital Flight Dynamics Team
+# Date Created: 10/18/2026
+# Last Updated: 10/18/2026
+#
+# Function Description:
+#   Renders the ascent time histories (position, velocity and acceleration
+#   against time, velocity and acceleration against position) to image
+#   files without a display.
+#
+# Notes:
+#   - matplotlib is imported only when a plot is drawn, so importing the
+#     simulation modules never pays for it. Figures are built with
+#     matplotlib.figure.Figure and saved through the Agg canvas; pyplot,
+#     its global figure registry and plt.show() are not used, so nothing
+#     blocks and no display is needed.
+#   - Every series is decimated to at most max_points samples before
+#     rendering with a min/max envelope (decimate_series_f): each bucket of
+#     consecutive samples keeps its smallest and largest value in order, so
+#     peaks and dips survive and the drawn line matches the full trace at
+#     screen resolution.
+#
+# References:
+#   None
+#
+# Input variables:
+# - results: dict with time_s, position_m, velocity_mps and
+#   acceleration_mps2 histories (simulate_ascent_motion_f output)
+# - helium_mass_kg: helium mass for the titles, kg
+# - log_scale_plots: log x-axis for time plots, log y-axis for position
+#   plots, bool
+# - output_dir: directory for the image files (created if missing)
+# - prefix: file name prefix
+# - image_format: matplotlib file format ("png", "svg", "pdf", ...)
+# - max_points: largest number of samples drawn per series
+# - dpi: raster resolution
+#
+# Output variables:
+# - paths: written file paths, list of str
+#
+########################################################################
+
+from __future__ import annotations
+
+import os
+
+import numpy as np
+
+PLOT_MAX_POINTS = 4000      # [-] samples drawn per series after decimation
+PLOT_DPI = 120              # [-] raster resolution
+PLOT_IMAGE_FORMAT = "png"
+
+# (file suffix, x key, y key, x label, y label, title, log axis)
+PLOT_SPECS = (
+    ("position_time", "time_s", "position_m", "Time [s]", "Position [m]", "Position vs Time", "x"),
+    ("velocity_time", "time_s", "velocity_mps", "Time [s]", "Velocity [m/s]", "Velocity vs Time", "x"),
+    ("acceleration_time", "time_s", "acceleration_mps2", "Time [s]", "Acceleration [m/s^2]",
+     "Acceleration vs Time", "x"),
+    ("velocity_position", "position_m", "velocity_mps", "Position [m]", "Velocity [m/s]",
+     "Velocity vs Position", "y"),
+    ("acceleration_position", "position_m", "acceleration_mps2", "Position [m]", "Acceleration [m/s^2]",
+     "Acceleration vs Position", "y"),
+)
+
+
+def decimate_series_f(x, y, max_points: int = PLOT_MAX_POINTS) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Reduce (x, y) to at most max_points samples with a min/max envelope.
+
+    The samples are split into max_points // 2 buckets of consecutive
+    points; each bucket contributes its minimum and maximum of y (in their
+    original order). The first and last samples are always kept.
+    """
+    x = np.asarray(x)
+    y = np.asarray(y)
+    count = y.size
+    if count <= max_points or max_points < 4:
+        return x, y
+
+    bucket_count = (max_points - 2) // 2
+    edges = np.linspace(1, count - 1, bucket_count + 1).astype(np.int64)
+    starts = edges[:-1]
+    lengths = np.diff(edges)
+    starts = starts[lengths > 0]
+    lengths = lengths[lengths > 0]
+
+    arg_min = np.array([start + np.argmin(y[start:start + length]) for start, length in zip(starts, lengths)])
+    arg_max = np.array([start + np.argmax(y[start:start + length]) for start, length in zip(starts, lengths)])
+
+    keep = np.unique(np.concatenate(([0], arg_min, arg_max, [count - 1])))
+    return x[keep], y[keep]
+
+
+def plot_trajectory_f(
+    results: dict,
+    helium_mass_kg: float,
+    log_scale_plots: bool = False,
+    *,
+    output_dir: str = ".",
+    prefix: str = "ascent",
+    image_format: str = PLOT_IMAGE_FORMAT,
+    max_points: int = PLOT_MAX_POINTS,
+    dpi: int = PLOT_DPI,
+) -> list[str]:
+    """Save the five time-history plots as image files; return their paths."""
+    from matplotlib.figure import Figure  # deferred: matplotlib is slow to import
+
+    os.makedirs(output_dir, exist_ok=True)
+    paths = []
+
+    for suffix, x_key, y_key, x_label, y_label, title, log_axis in PLOT_SPECS:
+        x, y = decimate_series_f(results[x_key], results[y_key], max_points)
+
+        figure = Figure()
+        axes = figure.add_subplot()
+        axes.plot(x, y)
+        axes.set_xlabel(x_label)
+        axes.set_ylabel(y_label)
+        axes.set_title(f"{title} (He Mass = {helium_mass_kg:.4f} kg)")
+        axes.grid(True)
+        if log_scale_plots:
+            if log_axis == "x":
+                axes.set_xscale("log")
+            else:
+                axes.set_yscale("log")
+
+        path = os.path.join(output_dir, f"{prefix}_{suffix}.{image_format}")
+        figure.savefig(path, dpi=dpi)
+        paths.append(path)
+
+    return paths
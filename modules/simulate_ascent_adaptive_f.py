@@ -0,0 +1,147 @@
+########################################################################
+# Purdue Orbital, Flight Dynamics
+#
+# Project Name: Ascent/Descent Modeling
+#
+# Function Name: simulate_ascent_adaptive_f
+# File Name: simulate_ascent_adaptive_f.py
+#
+# Contributors: Purdue Orbital Flight Dynamics Team
+# Date Created: 10/18/2026
+# Last Updated: 10/18/2026
+#
+# Function Description:
+#   Simulates 1-D vertical ascent for a single helium mass case with the
+#   adaptive Dormand-Prince integrator (integrate_vertical_motion_f),
+#   stopping exactly at the maximum (burst) altitude.
+#
+# Notes:
+#   - Same force model as simulate_ascent_motion_f (ascent_forces_f with one
+#     atmosphere sample per stage evaluation).
+#   - The mean ascent rate is the time-averaged velocity,
+#     (max_altitude_m - start_altitude_m) / time_to_burst, with the burst
+#     crossing located exactly, so there is no one-step overshoot.
+#   - Step size is limited by stability near terminal velocity rather than
+#     accuracy, so tightening rtol adds few steps.
+#
+# References:
+#   None
+#
+# Input variables:
+# - helium_mass_kg: helium mass, kg, non-negative
+# - start_altitude_m: starting altitude, m, non-negative
+# - max_altitude_m: max (burst) altitude, m, > start_altitude_m
+# - constant_mass_kg: non-helium mass, kg, non-negative
+# - rtol: relative error tolerance per step, -
+# - first_step_s: initial trial step, s, positive
+# - max_steps: accepted-step limit, positive
+# - hard_stop_on_nonpositive_net_force: stop if net force <= 0, bool
+# - record_history: keep the accepted-step time history, bool
+# - on_step_f: optional callable (t, x, v, a) given every accepted state,
+#   passed to integrate_vertical_motion_f
+# - atmosphere_table: optional AtmosphereTable interpolated instead of the
+#   exact atmosphere model, or None
+#
+# Output variables (returned dict):
+# - time_s, position_m, velocity_mps, acceleration_mps2: accepted-step
+#   histories, ndarrays (empty when record_history is False)
+# - mean_ascent_rate_mps: time-averaged ascent rate, m/s
+# - time_to_burst_s: time at which max_altitude_m is reached, s
+# - burst_velocity_mps: velocity at max_altitude_m, m/s
+# - gage_force_N: initial gage force (buoyant - correction), N
+# - steps: accepted integration steps, -
+# - had_error: error flag, bool
+# - error_reason: error description, str
+#
+########################################################################
+
+from __future__ import annotations
+
+import numpy as np
+
+from modules.ascent_forces_f import ascent_forces_f
+from modules.atmosphere_f import AtmosphereTable, atmosphere_m
+from modules.integrate_vertical_motion_f import DEFAULT_RTOL, integrate_vertical_motion_f
+
+MAX_ADAPTIVE_STEPS = 10_000_000  # [-] safety stop, matches simulate_ascent_motion_f
+
+
+def simulate_ascent_adaptive_f(
+    helium_mass_kg: float,
+    start_altitude_m: float,
+    max_altitude_m: float,
+    constant_mass_kg: float = 8.8,
+    *,
+    rtol: float = DEFAULT_RTOL,
+    first_step_s: float = 0.1,
+    max_steps: int = MAX_ADAPTIVE_STEPS,
+    hard_stop_on_nonpositive_net_force: bool = True,
+    record_history: bool = True,
+    on_step_f=None,
+    atmosphere_table: AtmosphereTable | None = None,
+) -> dict:
+    """Simulate ascent dynamics adaptively for a single helium mass case."""
+    total_mass_kg = constant_mass_kg + helium_mass_kg  # [kg]
+
+    atmosphere_lookup = atmosphere_m if atmosphere_table is None else atmosphere_table.atmosphere_m
+
+    def acceleration_f(time_s: float, position_m: float, velocity_mps: float) -> float:
+        atm = atmosphere_lookup(position_m, geometric=True, output="state")
+        net_force_N = ascent_forces_f(position_m, velocity_mps, helium_mass_kg, total_mass_kg, atm=atm)[4]
+        return net_force_N / total_mass_kg  # [m/s^2]
+
+    def abort_f(time_s: float, position_m: float, velocity_mps: float, acceleration_mps2: float) -> str:
+        return "net_force_N <= 0" if acceleration_mps2 <= 0.0 else ""
+
+    atm = atmosphere_lookup(start_altitude_m, geometric=True, output="state")
+    buoyant_force_N, _, _, correction_force_N, _ = ascent_forces_f(
+        start_altitude_m, 0.0, helium_mass_kg, total_mass_kg, atm=atm,
+    )  # [N]
+    gage_force_N = buoyant_force_N - correction_force_N  # [N]
+
+    flight = integrate_vertical_motion_f(
+        acceleration_f,
+        0.0,
+        start_altitude_m,
+        0.0,
+        stop_position_m=max_altitude_m,
+        direction=1,
+        rtol=rtol,
+        first_step_s=first_step_s,
+        max_steps=max_steps,
+        abort_f=abort_f if hard_stop_on_nonpositive_net_force else None,
+        record_history=record_history,
+        on_step_f=on_step_f,
+    )
+
+    had_error = False
+    error_reason = ""
+    if flight["abort_reason"]:
+        had_error = True
+        error_reason = flight["abort_reason"]
+    elif flight["hit_step_limit"]:
+        had_error = True
+        error_reason = "Safety stop: too many integration steps"
+
+    elapsed_s = flight["final_time_s"]
+    if elapsed_s > 0.0:
+        mean_ascent_rate_mps = (flight["final_position_m"] - start_altitude_m) / elapsed_s  # [m/s]
+    else:
+        mean_ascent_rate_mps = 0.0
+        if not had_error:
+            had_error = True
+            error_reason = "No samples recorded"
+
+    return {
+        "time_s": np.asarray(flight["time_s"]),
+        "position_m": np.asarray(flight["position_m"]),
+        "velocity_mps": np.asarray(flight["velocity_mps"]),
+        "acceleration_mps2": np.asarray(flight["acceleration_mps2"]),
+        "mean_ascent_rate_mps": mean_ascent_rate_mps,
+        "time_to_burst_s": elapsed_s if flight["reached_stop"] else float("nan"),
+        "burst_velocity_mps": flight["final_velocity_mps"],
+        "gage_force_N": gage_force_N,
+        "steps": flight["steps"],
+        "had_error": had_error,
+        "error_reason": error_reason,
+    }
@@ -8,7 +8,7 @@
 #
 # Contributors: Cayden Varno (original logic), Purdue Orbital Flight Dynamics Team (refactor)
 # Date Created: 11/20/2025
-# Last Updated: 02/09/2026
+# Last Updated: 10/18/2026
 #
 # Function Description:
 #   Simulates 1-D vertical ascent for a single helium mass case, integrating
@@ -16,9 +16,25 @@
 #   altitude using buoyant, drag, and gravity forces.
 #
 # Notes:
-#   - Calls modules.atmosphere.atmosphere_m(...) once per timestep and passes
-#     the resulting atm dict into buoyant_force_f and drag_force_f.
-#   - Integration uses explicit Euler.
+#   - Calls modules.atmosphere.atmosphere_m(...) (or AtmosphereTable.atmosphere_m
+#     when a table is supplied) once per timestep and passes the resulting
+#     AtmosphereState into ascent_forces_f, the fused form of buoyant_force_f,
+#     drag_force_f, gravity_force_f and force_correction_f.
+#   - Integration uses explicit Euler by default; integrator="rk45" delegates
+#     to simulate_ascent_adaptive_f (adaptive Dormand-Prince that stops
+#     exactly at max_altitude_m; time_step_s is then only the first trial step).
+#   - The Euler march and its recording rule live in _march_euler_f, which
+#     this function drains and simulate_ascent_motion_stream_f repackages.
+#     Histories are written into preallocated NumPy buffers sized from an
+#     estimate of the sample count, regrown in place to a projected length
+#     when the estimate is exceeded and trimmed in place at the end (no list -> array or
+#     concatenate copy). record_every / record_altitudes_m decimate what
+#     is stored; the mean ascent rate and gage force are still computed
+#     from every step. When decimating, the final step is always recorded.
+#   - make_plots renders through modules.plot_trajectory_f, imported on
+#     first use so matplotlib is never loaded for solver-only runs. The
+#     plots are decimated and written to plot_dir as ascent_*.png files
+#     (headless Agg rendering; no window is opened).
 #
 # References:
 #   None
@@ -29,17 +45,26 @@
 # - max_altitude_m: max altitude, m, > start_altitude_m
 # - time_step_s: integration time step, s, positive
 # - constant_mass_kg: non-helium mass, kg, non-negative
-# - make_plots: plot time histories, bool
+# - make_plots: save time-history plots as PNG files, bool
 # - log_scale_plots: toggle log x-axis for plots, bool
 # - hard_stop_on_nonpositive_net_force: stop if net force <= 0, bool
+# - atmosphere_table: optional AtmosphereTable interpolated instead of the
+#   exact atmosphere model, or None
+# - integrator: "euler" or "rk45", str
+# - rtol: rk45 relative error tolerance per step, -
+# - record_every: store every Nth step (0 stores none periodically), int
+# - record_altitudes_m: optional altitude breakpoints; the first step at or
+#   above each breakpoint is stored, m
+# - plot_dir: directory for the make_plots image files, str
 #
 # Output variables (returned dict):
 # - time_s: time history, s
 # - position_m: altitude history, m
 # - velocity_mps: velocity history, m/s
 # - acceleration_mps2: acceleration history, m/s^2
-# - mean_ascent_rate_mps: mean of velocity history, m/s
+# - mean_ascent_rate_mps: mean velocity over every step, m/s
 # - gage_force_N: initial gage force (buoyant - correction), N
+# - steps: integration steps taken, -
 # - had_error: error flag, bool
 # - error_reason: error description, str
 #
@@ -48,13 +73,18 @@
 from __future__ import annotations
 
 import numpy as np
-import matplotlib.pyplot as plt
 
-from modules.atmosphere_f import atmosphere_m
-from modules.buoyant_force_f import buoyant_force_f
-from modules.drag_force_f import drag_force_f
-from modules.gravity_force_f import gravity_force_f
-from modules.force_correction_f import force_correction_f
+from modules.ascent_forces_f import ascent_forces_f
+from modules.atmosphere_f import AtmosphereTable, atmosphere_m
+from modules.integrate_vertical_motion_f import DEFAULT_RTOL
+from modules.simulate_ascent_adaptive_f import simulate_ascent_adaptive_f
+
+INTEGRATORS = ("euler", "rk45")  # explicit Euler (fixed step) or adaptive Dormand-Prince
+MAX_EULER_STEPS = 10_000_000     # [-] safety stop
+CAPACITY_RATE_MPS = 4.0          # [m/s] ascent rate assumed when sizing history buffers
+MAX_INITIAL_CAPACITY = 1 << 20   # [-] largest preallocated history length
+GROWTH_MARGIN = 1.05             # [-] headroom on the projected length when a history buffer is regrown
+HISTORY_KEYS = ("time_s", "position_m", "velocity_mps", "acceleration_mps2")
 
 
 def _empty_error_result(error_reason: str) -> dict:
@@ -66,67 +96,140 @@ def _empty_error_result(error_reason: str) -> dict:
         "acceleration_mps2": np.array([]),
         "mean_ascent_rate_mps": 0.0,
         "gage_force_N": np.nan,
+        "steps": 0,
         "had_error": True,
         "error_reason": error_reason,
     }
 
 
-def simulate_ascent_motion_f(
-    helium_mass_kg: float,
+def _initial_capacity(
     start_altitude_m: float,
     max_altitude_m: float,
-    time_step_s: float = 0.1,
-    constant_mass_kg: float = 8.8,
-    make_plots: bool = True,
-    log_scale_plots: bool = False,
-    hard_stop_on_nonpositive_net_force: bool = True,
+    time_step_s: float,
+    record_every: int,
+    breakpoint_count: int,
+) -> int:
+    """Estimate how many samples will be recorded, for the first buffer allocation."""
+    capacity = breakpoint_count + 2
+    if record_every > 0:
+        expected_steps = (max_altitude_m - start_altitude_m) / (CAPACITY_RATE_MPS * time_step_s)
+        capacity += int(min(expected_steps, MAX_EULER_STEPS) // record_every)
+    return min(capacity, MAX_INITIAL_CAPACITY)
+
+
+def _select_samples(
+    results: dict,
+    record_every: int,
+    breakpoints_m: np.ndarray,
 ) -> dict:
-    """Simulate ascent dynamics for a single helium mass case."""
+    """Decimate recorded histories in place (rk45 path) with the Euler recording rule."""
+    count = len(results["position_m"])
+    if count == 0:
+        return results
+
+    keep = np.zeros(count, dtype=bool)
+    if record_every > 0:
+        keep[record_every - 1::record_every] = True
+    if breakpoints_m.size:
+        first_index = np.searchsorted(results["position_m"], breakpoints_m, side="left")
+        keep[np.unique(first_index[first_index < count])] = True
+    keep[-1] = True
+
+    for key in HISTORY_KEYS:
+        results[key] = results[key][keep]
+    return results
+
 
+def _validate_inputs(
+    helium_mass_kg: float,
+    start_altitude_m: float,
+    max_altitude_m: float,
+    time_step_s: float,
+    constant_mass_kg: float,
+) -> str | None:
+    """Return the error reason for invalid case inputs, else None."""
     if start_altitude_m < 0.0:
-        return _empty_error_result("start_altitude_m < 0")
+        return "start_altitude_m < 0"
     if max_altitude_m <= start_altitude_m:
-        return _empty_error_result("max_altitude_m <= start_altitude_m")
+        return "max_altitude_m <= start_altitude_m"
     if helium_mass_kg < 0.0:
-        return _empty_error_result("helium_mass_kg < 0")
+        return "helium_mass_kg < 0"
     if time_step_s <= 0.0:
-        return _empty_error_result("time_step_s <= 0")
+        return "time_step_s <= 0"
     if constant_mass_kg < 0.0:
-        return _empty_error_result("constant_mass_kg < 0")
+        return "constant_mass_kg < 0"
+    return None
+
 
+def _march_euler_f(
+    helium_mass_kg: float,
+    start_altitude_m: float,
+    max_altitude_m: float,
+    time_step_s: float,
+    constant_mass_kg: float,
+    record_every: int,
+    breakpoint_list: list,
+    hard_stop_on_nonpositive_net_force: bool,
+    atmosphere_table: AtmosphereTable | None,
+    chunk_size: int,
+    grow: bool = False,
+):
+    """
+    Explicit-Euler march with the recording rule, yielding recorded samples.
+
+    The single implementation behind simulate_ascent_motion_f (which drains
+    it) and simulate_ascent_motion_stream_f (which repackages each chunk).
+    Yields (time_s, position_m, velocity_mps, acceleration_mps2) column
+    arrays of at most chunk_size samples; every yielded chunk is a new set
+    of arrays. With grow=True the buffers are instead regrown in place when
+    full (to the length projected from the altitude climbed, at most
+    doubling) and a single chunk holding every sample is yielded at the end.
+    breakpoint_list must be sorted and unique. When decimating, the final
+    step is always recorded.
+
+    Returns (generator value):
+    - mean_ascent_rate_mps, gage_force_N, steps, had_error, error_reason
+    """
+    decimated = record_every != 1 or len(breakpoint_list) > 0
     total_mass_kg = constant_mass_kg + helium_mass_kg  # [kg]
 
     position_m = start_altitude_m  # [m]
     velocity_mps = 0.0             # [m/s]
+    acceleration_mps2 = 0.0        # [m/s^2]
     time_s = 0.0                   # [s]
 
-    time_history_s: list[float] = []
-    position_history_m: list[float] = []
-    velocity_history_mps: list[float] = []
-    acceleration_history_mps2: list[float] = []
+    time_chunk_s = np.empty(chunk_size)
+    position_chunk_m = np.empty(chunk_size)
+    velocity_chunk_mps = np.empty(chunk_size)
+    acceleration_chunk_mps2 = np.empty(chunk_size)
+    chunk_count = 0
+    last_recorded_step = 0
 
+    breakpoint_count = len(breakpoint_list)
+    breakpoint_index = 0
+    next_breakpoint_m = breakpoint_list[0] if breakpoint_count else np.inf
+
+    velocity_sum_mps = 0.0
     gage_force_N = float("nan")
     had_error = False
     error_reason = ""
 
     step_index = 1
 
+    atmosphere_lookup = atmosphere_m if atmosphere_table is None else atmosphere_table.atmosphere_m
+
     while position_m < max_altitude_m:
-        atm = atmosphere_m(position_m, geometric=True)
+        atm = atmosphere_lookup(position_m, geometric=True, output="state")
 
         try:
-            buoyant_force_N = buoyant_force_f(position_m, helium_mass_kg, atm=atm)  # [N]
-            drag_force_N = drag_force_f(velocity_mps, helium_mass_kg, position_m, atm=atm)  # [N]
+            buoyant_force_N, _, _, correction_force_N, net_force_N = ascent_forces_f(
+                position_m, velocity_mps, helium_mass_kg, total_mass_kg, atm=atm,
+            )  # [N]
         except Exception:
             had_error = True
-            error_reason = "Exception in buoyant_force_f(...) or drag_force_f(...)"
+            error_reason = "Exception in ascent_forces_f(...)"
             break
 
-        gravity_force_N = gravity_force_f(position_m, total_mass_kg)  # [N]
-        correction_force_N = force_correction_f(helium_mass_kg, position_m)  # [N]
-
-        net_force_N = buoyant_force_N - drag_force_N - gravity_force_N  # [N]
-
         if step_index == 1:
             gage_force_N = buoyant_force_N - correction_force_N  # [N]
 
@@ -139,88 +242,164 @@ def simulate_ascent_motion_f(
         velocity_mps = velocity_mps + acceleration_mps2 * time_step_s  # [m/s]
         position_m = position_m + velocity_mps * time_step_s  # [m]
 
-        time_history_s.append(time_s)
-        position_history_m.append(position_m)
-        velocity_history_mps.append(velocity_mps)
-        acceleration_history_mps2.append(acceleration_mps2)
+        velocity_sum_mps += velocity_mps
+
+        record = record_every > 0 and step_index % record_every == 0
+        if position_m >= next_breakpoint_m:
+            record = True
+            while breakpoint_index < breakpoint_count and position_m >= breakpoint_list[breakpoint_index]:
+                breakpoint_index += 1
+            next_breakpoint_m = breakpoint_list[breakpoint_index] if breakpoint_index < breakpoint_count else np.inf
+
+        if record:
+            time_chunk_s[chunk_count] = time_s
+            position_chunk_m[chunk_count] = position_m
+            velocity_chunk_mps[chunk_count] = velocity_mps
+            acceleration_chunk_mps2[chunk_count] = acceleration_mps2
+            chunk_count += 1
+            last_recorded_step = step_index
+            if chunk_count == chunk_size and grow:
+                # Regrow to the sample count projected from the altitude
+                # covered so far; the in-place resize lets the allocator
+                # extend the buffer without holding two copies at once.
+                climbed_m = max(position_m - start_altitude_m, 1e-9)
+                projected = int(chunk_size * (max_altitude_m - start_altitude_m) / climbed_m * GROWTH_MARGIN)
+                chunk_size = min(max(projected, chunk_size + chunk_size // 4), 2 * chunk_size)
+                for buffer in (time_chunk_s, position_chunk_m, velocity_chunk_mps, acceleration_chunk_mps2):
+                    buffer.resize(chunk_size, refcheck=False)
+            elif chunk_count == chunk_size:
+                yield time_chunk_s, position_chunk_m, velocity_chunk_mps, acceleration_chunk_mps2
+                time_chunk_s = np.empty(chunk_size)
+                position_chunk_m = np.empty(chunk_size)
+                velocity_chunk_mps = np.empty(chunk_size)
+                acceleration_chunk_mps2 = np.empty(chunk_size)
+                chunk_count = 0
 
         time_s += time_step_s
         step_index += 1
 
-        if step_index > 10_000_000:
+        if step_index > MAX_EULER_STEPS:
             had_error = True
             error_reason = "Safety stop: too many integration steps"
             break
 
-    if len(velocity_history_mps) == 0:
+    step_count = step_index - 1
+
+    # Full chunks are yielded as soon as they fill, so there is room here.
+    if decimated and step_count > last_recorded_step:
+        time_chunk_s[chunk_count] = time_s - time_step_s
+        position_chunk_m[chunk_count] = position_m
+        velocity_chunk_mps[chunk_count] = velocity_mps
+        acceleration_chunk_mps2[chunk_count] = acceleration_mps2
+        chunk_count += 1
+
+    if chunk_count > 0:
+        # Trim in place; the chunk arrays are private, so no reference check is needed.
+        for buffer in (time_chunk_s, position_chunk_m, velocity_chunk_mps, acceleration_chunk_mps2):
+            buffer.resize(chunk_count, refcheck=False)
+        yield time_chunk_s, position_chunk_m, velocity_chunk_mps, acceleration_chunk_mps2
+
+    if step_count == 0:
         mean_ascent_rate_mps = 0.0
         if not had_error:
             had_error = True
             error_reason = "No samples recorded"
     else:
-        mean_ascent_rate_mps = float(np.mean(velocity_history_mps))
+        mean_ascent_rate_mps = velocity_sum_mps / step_count
+
+    return mean_ascent_rate_mps, gage_force_N, step_count, had_error, error_reason
+
+
+def _plot_results_f(results: dict, helium_mass_kg: float, log_scale_plots: bool, plot_dir: str) -> list[str]:
+    """Save the time-history plots; the plotting module (and matplotlib) loads on first use."""
+    from modules.plot_trajectory_f import plot_trajectory_f
+
+    return plot_trajectory_f(results, helium_mass_kg, log_scale_plots, output_dir=plot_dir)
+
+
+def simulate_ascent_motion_f(
+    helium_mass_kg: float,
+    start_altitude_m: float,
+    max_altitude_m: float,
+    time_step_s: float = 0.1,
+    constant_mass_kg: float = 8.8,
+    make_plots: bool = True,
+    log_scale_plots: bool = False,
+    hard_stop_on_nonpositive_net_force: bool = True,
+    atmosphere_table: AtmosphereTable | None = None,
+    integrator: str = "euler",
+    rtol: float = DEFAULT_RTOL,
+    record_every: int = 1,
+    record_altitudes_m=None,
+    plot_dir: str = ".",
+) -> dict:
+    """Simulate ascent dynamics for a single helium mass case."""
+
+    error_reason = _validate_inputs(helium_mass_kg, start_altitude_m, max_altitude_m, time_step_s, constant_mass_kg)
+    if error_reason is None and integrator not in INTEGRATORS:
+        error_reason = f"integrator not in {INTEGRATORS}"
+    if error_reason is None and record_every < 0:
+        error_reason = "record_every < 0"
+    if error_reason is not None:
+        return _empty_error_result(error_reason)
+
+    if record_altitudes_m is None:
+        breakpoints_m = np.empty(0)
+    else:
+        breakpoints_m = np.unique(np.asarray(record_altitudes_m, dtype=float).ravel())
+    decimated = record_every != 1 or breakpoints_m.size > 0
+
+    if integrator == "rk45":
+        results = simulate_ascent_adaptive_f(
+            helium_mass_kg,
+            start_altitude_m,
+            max_altitude_m,
+            constant_mass_kg,
+            rtol=rtol,
+            first_step_s=time_step_s,
+            hard_stop_on_nonpositive_net_force=hard_stop_on_nonpositive_net_force,
+            atmosphere_table=atmosphere_table,
+        )
+        if decimated:
+            results = _select_samples(results, record_every, breakpoints_m)
+        if make_plots and len(results["time_s"]) > 0:
+            _plot_results_f(results, helium_mass_kg, log_scale_plots, plot_dir)
+        return results
+
+    capacity = _initial_capacity(
+        start_altitude_m, max_altitude_m, time_step_s, record_every, breakpoints_m.size,
+    )
+    march = _march_euler_f(
+        helium_mass_kg,
+        start_altitude_m,
+        max_altitude_m,
+        time_step_s,
+        constant_mass_kg,
+        record_every,
+        breakpoints_m.tolist(),
+        hard_stop_on_nonpositive_net_force,
+        atmosphere_table,
+        capacity,
+        grow=True,
+    )
+    histories = tuple(np.empty(0) for _ in HISTORY_KEYS)
+    while True:
+        try:
+            histories = next(march)
+        except StopIteration as stop:
+            mean_ascent_rate_mps, gage_force_N, step_count, had_error, error_reason = stop.value
+            break
 
-    results = {
-        "time_s": np.asarray(time_history_s),
-        "position_m": np.asarray(position_history_m),
-        "velocity_mps": np.asarray(velocity_history_mps),
-        "acceleration_mps2": np.asarray(acceleration_history_mps2),
+    results = dict(zip(HISTORY_KEYS, histories))
+    results.update({
         "mean_ascent_rate_mps": mean_ascent_rate_mps,
         "gage_force_N": float(gage_force_N) if np.isfinite(gage_force_N) else gage_force_N,
+        "steps": step_count,
         "had_error": had_error,
         "error_reason": error_reason,
-    }
+    })
 
     if make_plots and len(results["time_s"]) > 0:
-        plt.figure()
-        plt.plot(results["time_s"], results["position_m"])
-        plt.xlabel("Time [s]")
-        plt.ylabel("Position [m]")
-        plt.title(f"Position vs Time (He Mass = {helium_mass_kg:.4f} kg)")
-        plt.grid(True)
-        if log_scale_plots:
-            plt.xscale("log")
-
-        plt.figure()
-        plt.plot(results["time_s"], results["velocity_mps"])
-        plt.xlabel("Time [s]")
-        plt.ylabel("Velocity [m/s]")
-        plt.title(f"Velocity vs Time (He Mass = {helium_mass_kg:.4f} kg)")
-        plt.grid(True)
-        if log_scale_plots:
-            plt.xscale("log")
-
-        plt.figure()
-        plt.plot(results["time_s"], results["acceleration_mps2"])
-        plt.xlabel("Time [s]")
-        plt.ylabel("Acceleration [m/s^2]")
-        plt.title(f"Acceleration vs Time (He Mass = {helium_mass_kg:.4f} kg)")
-        plt.grid(True)
-        if log_scale_plots:
-            plt.xscale("log")
-
-        # Velocity vs Position
-        plt.figure()
-        plt.plot(results["position_m"], results["velocity_mps"])
-        plt.xlabel("Position [m]")
-        plt.ylabel("Velocity [m/s]")
-        plt.title(f"Velocity vs Position (He Mass = {helium_mass_kg:.4f} kg)")
-        plt.grid(True)
-
-        if log_scale_plots:
-            plt.yscale("log")
-
-        # Acceleration vs Position
-        plt.figure()
-        plt.plot(results["position_m"], results["acceleration_mps2"])
-        plt.xlabel("Position [m]")
-        plt.ylabel("Acceleration [m/s^2]")
-        plt.title(f"Acceleration vs Position (He Mass = {helium_mass_kg:.4f} kg)")
-        plt.grid(True)
-
-        if log_scale_plots:
-            plt.yscale("log")
-
-        plt.show()
+        _plot_results_f(results, helium_mass_kg, log_scale_plots, plot_dir)
 
     return results
@@ -0,0 +1,158 @@
+########################################################################
+# Purdue Orbital, Flight Dynamics
+#
+# Project Name: Ascent/Descent Modeling
+#
+# Function Name: simulate_ascent_motion_stream_f
+# File Name: simulate_ascent_motion_stream_f.py
+#
+# Contributors: Purdue Orbital Flight Dynamics Team
+# Date Created: 10/18/2026
+# Last Updated: 10/18/2026
+#
+# Function Description:
+#   Generator form of simulate_ascent_motion_f (explicit Euler). Yields the
+#   trajectory while integrating, as NumPy record blocks of TRAJECTORY_DTYPE
+#   holding at most chunk_size samples each, and returns the run summary
+#   when the generator finishes (StopIteration.value, or the value of a
+#   "yield from" expression).
+#
+# Notes:
+#   - Memory use is one chunk regardless of flight length; every yielded
+#     block is a new array, so consumers may keep or hand it off freely.
+#   - Runs the same march as the Euler path of simulate_ascent_motion_f
+#     (simulate_ascent_motion_f._march_euler_f: force model, step update,
+#     recording rule with the final step kept when decimating, and error
+#     handling), so concatenating the blocks reproduces its histories.
+#   - Samples recorded before an error are still yielded.
+#
+# References:
+#   None
+#
+# Input variables:
+# - helium_mass_kg: helium mass, kg, non-negative
+# - start_altitude_m: starting altitude, m, non-negative
+# - max_altitude_m: max altitude, m, > start_altitude_m
+# - time_step_s: integration time step, s, positive
+# - constant_mass_kg: non-helium mass, kg, non-negative
+# - chunk_size: samples per yielded block, positive
+# - record_every: store every Nth step (0 stores none periodically), int
+# - record_altitudes_m: optional altitude breakpoints; the first step at or
+#   above each breakpoint is stored, m
+# - hard_stop_on_nonpositive_net_force: stop if net force <= 0, bool
+# - atmosphere_table: optional AtmosphereTable interpolated instead of the
+#   exact atmosphere model, or None
+#
+# Yielded values:
+# - block: structured ndarray of TRAJECTORY_DTYPE with fields time_s (s),
+#   position_m (m), velocity_mps (m/s) and acceleration_mps2 (m/s^2)
+#
+# Output variables (generator return value, dict):
+# - mean_ascent_rate_mps: mean velocity over every step, m/s
+# - gage_force_N: initial gage force (buoyant - correction), N
+# - steps: integration steps taken, -
+# - samples: samples yielded, -
+# - had_error: error flag, bool
+# - error_reason: error description, str
+#
+########################################################################
+
+from __future__ import annotations
+
+from collections.abc import Generator
+
+import numpy as np
+
+from modules.atmosphere_f import AtmosphereTable
+from modules.simulate_ascent_motion_f import HISTORY_KEYS, _march_euler_f, _validate_inputs
+
+TRAJECTORY_DTYPE = np.dtype([(key, np.float64) for key in HISTORY_KEYS])
+DEFAULT_CHUNK_SIZE = 4096  # [-] samples per yielded block
+
+
+def _summary(
+    mean_ascent_rate_mps: float,
+    gage_force_N: float,
+    steps: int,
+    samples: int,
+    had_error: bool,
+    error_reason: str,
+) -> dict:
+    """Return the generator's summary dict."""
+    return {
+        "mean_ascent_rate_mps": mean_ascent_rate_mps,
+        "gage_force_N": float(gage_force_N) if np.isfinite(gage_force_N) else gage_force_N,
+        "steps": steps,
+        "samples": samples,
+        "had_error": had_error,
+        "error_reason": error_reason,
+    }
+
+
+def collect_trajectory_f(stream: Generator) -> tuple[np.ndarray, dict]:
+    """Drain a trajectory stream into one TRAJECTORY_DTYPE array plus its summary."""
+    blocks = []
+    while True:
+        try:
+            blocks.append(next(stream))
+        except StopIteration as stop:
+            summary = stop.value
+            break
+    trajectory = np.concatenate(blocks) if blocks else np.empty(0, dtype=TRAJECTORY_DTYPE)
+    return trajectory, summary
+
+
+def simulate_ascent_motion_stream_f(
+    helium_mass_kg: float,
+    start_altitude_m: float,
+    max_altitude_m: float,
+    time_step_s: float = 0.1,
+    constant_mass_kg: float = 8.8,
+    *,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    record_every: int = 1,
+    record_altitudes_m=None,
+    hard_stop_on_nonpositive_net_force: bool = True,
+    atmosphere_table: AtmosphereTable | None = None,
+) -> Generator[np.ndarray, None, dict]:
+    """Simulate ascent for a single helium mass case, yielding trajectory blocks."""
+
+    error_reason = _validate_inputs(helium_mass_kg, start_altitude_m, max_altitude_m, time_step_s, constant_mass_kg)
+    if error_reason is None and chunk_size <= 0:
+        error_reason = "chunk_size <= 0"
+    if error_reason is None and record_every < 0:
+        error_reason = "record_every < 0"
+    if error_reason is not None:
+        return _summary(0.0, np.nan, 0, 0, True, error_reason)
+
+    if record_altitudes_m is None:
+        breakpoint_list = []
+    else:
+        breakpoint_list = np.unique(np.asarray(record_altitudes_m, dtype=float).ravel()).tolist()
+
+    march = _march_euler_f(
+        helium_mass_kg,
+        start_altitude_m,
+        max_altitude_m,
+        time_step_s,
+        constant_mass_kg,
+        record_every,
+        breakpoint_list,
+        hard_stop_on_nonpositive_net_force,
+        atmosphere_table,
+        chunk_size,
+    )
+    samples = 0
+    while True:
+        try:
+            columns = next(march)
+        except StopIteration as stop:
+            mean_ascent_rate_mps, gage_force_N, step_count, had_error, error_reason = stop.value
+            break
+        block = np.empty(len(columns[0]), dtype=TRAJECTORY_DTYPE)
+        for key, column in zip(HISTORY_KEYS, columns):
+            block[key] = column
+        samples += len(block)
+        yield block
+
+    return _summary(mean_ascent_rate_mps, gage_force_N, step_count, samples, had_error, error_reason)
@@ -1,5 +1,17 @@
 from modules.helium_mass_f import helium_mass_f
 
+# Payload component masses, in kg (helium mass not included)
+LAUNCH_STRUCTURE_MASS = 2.2
+FLIGHT_OPERATIONS_MASS = 2.2
+AVIONICS_MASS = 2.2
+MISCELLANEOUS_MASS = 2.2
+PAYLOAD_COMPONENT_MASSES = (
+    LAUNCH_STRUCTURE_MASS,
+    FLIGHT_OPERATIONS_MASS,
+    AVIONICS_MASS,
+    MISCELLANEOUS_MASS,
+)
+
 def system_mass_f(initial_altitude, initial_buoyancy_force):
 
 #************************************************************************
@@ -29,12 +41,6 @@ def system_mass_f(initial_altitude, initial_buoyancy_force):
 # 
 #************************************************************************
 
-    # Constants
-    LAUNCH_STRUCTURE_MASS = 2.2; # in kg
-    FLIGHT_OPERATIONS_MASS = 2.2; # in kg, does not include helium mass
-    AVIONICS_MASS = 2.2; # in kg
-    MISCELLANEOUS_MASS = 2.2; # in kg
-
     # --- Calculations
     helium_mass = helium_mass_f(initial_altitude, initial_buoyancy_force)  # kg
 
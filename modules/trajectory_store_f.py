@@ -0,0 +1,261 @@
+########################################################################
+# Purdue Orbital, Flight Dynamics
+#
+# Project Name: Ascent/Descent Modeling
+#
+# Function Name: write_trajectories_f, open_trajectories_f
+# File Name: trajectory_store_f.py
+#
+# Contributors: Purdue Orbital Flight Dynamics Team
+# Date Created: 10/18/2026
+# Last Updated: 10/18/2026
+#
+# Function Description:
+#   Columnar binary archive for one or many trajectories (time_s,
+#   position_m, velocity_mps, acceleration_mps2) with a JSON metadata
+#   header, and a reader that memory-maps the file so columns and single
+#   trajectories are sliced zero-copy, without loading the file.
+#
+# Notes:
+#   - File layout (little-endian):
+#       MAGIC (8 bytes) | header length (uint64) | JSON header |
+#       trajectory offsets (int64, count + 1) | one float64 array per
+#       column holding every trajectory back to back
+#     Each array starts on an ALIGNMENT-byte boundary; the header records
+#     every array's offset, so a reader never parses the data.
+#   - Trajectory i is samples offsets[i]:offsets[i + 1] of every column.
+#   - Header: format version, column names and units, sample and
+#     trajectory counts, file metadata (model constants from
+#     modules.model_constants_f plus anything the caller passes) and one metadata
+#     dict per trajectory (caller inputs plus the scalar entries of a
+#     simulate_ascent_motion_f result, e.g. mean_ascent_rate_mps, steps).
+#   - Files are written to a temporary name and renamed, so a reader never
+#     sees a partial archive; the temporary file is removed if the write
+#     fails.
+#   - Arrays returned by the reader are read-only views of the mapping;
+#     np.array(view) makes an in-memory copy.
+#
+# References:
+#   None
+#
+# Input variables (write_trajectories_f):
+# - path: archive file path
+# - trajectories: sequence of simulate_ascent_motion_f result dicts or
+#   TRAJECTORY_DTYPE record arrays
+# - trajectory_metadata: optional sequence of dicts (e.g. the inputs), one
+#   per trajectory
+# - metadata: optional dict stored once for the file
+# - atmosphere_table: AtmosphereTable the trajectories were run with, or
+#   None for the exact model (recorded in the model constants)
+#
+# Output variables:
+# - write_trajectories_f: number of samples written, int
+# - open_trajectories_f: TrajectoryArchive
+#
+########################################################################
+
+from __future__ import annotations
+
+import json
+import os
+import struct
+
+import numpy as np
+
+from modules.atmosphere_f import AtmosphereTable
+from modules.json_safe_f import json_safe_f
+from modules.model_constants_f import model_constants_f
+from modules.simulate_ascent_motion_f import HISTORY_KEYS
+
+MAGIC = b"POTRAJ\x00\x01"
+FORMAT_VERSION = 1
+ALIGNMENT = 64                  # [bytes] start of every stored array
+COLUMN_DTYPE = np.dtype("<f8")
+OFFSET_DTYPE = np.dtype("<i8")
+COLUMN_UNITS = {
+    "time_s": "s",
+    "position_m": "m",
+    "velocity_mps": "m/s",
+    "acceleration_mps2": "m/s^2",
+}
+_PREFIX = struct.Struct("<8sQ")  # magic, header length
+
+
+def _aligned(position: int) -> int:
+    """Round a byte position up to the next ALIGNMENT boundary."""
+    return -(-position // ALIGNMENT) * ALIGNMENT
+
+
+def _columns_f(trajectory) -> tuple[list[np.ndarray], dict]:
+    """Split a result dict or record array into HISTORY_KEYS columns and scalar entries."""
+    if isinstance(trajectory, np.ndarray):
+        columns = [trajectory[key] for key in HISTORY_KEYS]
+        scalars = {}
+    else:
+        columns = [np.asarray(trajectory[key]) for key in HISTORY_KEYS]
+        scalars = {key: value for key, value in trajectory.items() if key not in HISTORY_KEYS}
+
+    lengths = {column.shape for column in columns}
+    if len(lengths) != 1 or len(columns[0].shape) != 1:
+        raise ValueError("trajectory columns must be 1-D arrays of equal length")
+    return columns, scalars
+
+
+def write_trajectories_f(
+    path: str | os.PathLike,
+    trajectories,
+    trajectory_metadata=None,
+    metadata: dict | None = None,
+    atmosphere_table: AtmosphereTable | None = None,
+) -> int:
+    """
+    Write trajectories to a columnar archive; return the number of samples.
+
+    Columns are written one at a time, trajectory by trajectory, so no
+    concatenated copy of the data is built in memory.
+    """
+    trajectories = list(trajectories)
+    if trajectory_metadata is None:
+        trajectory_metadata = [{}] * len(trajectories)
+    trajectory_metadata = list(trajectory_metadata)
+    if len(trajectory_metadata) != len(trajectories):
+        raise ValueError("trajectory_metadata must have one entry per trajectory")
+
+    split = [_columns_f(trajectory) for trajectory in trajectories]
+    offsets = np.zeros(len(trajectories) + 1, dtype=OFFSET_DTYPE)
+    np.cumsum([len(columns[0]) for columns, _ in split], out=offsets[1:])
+    samples = int(offsets[-1])
+
+    entries = [dict(scalars, **extra) for (_, scalars), extra in zip(split, trajectory_metadata)]
+    header = {
+        "version": FORMAT_VERSION,
+        "samples": samples,
+        "trajectories": len(trajectories),
+        "offsets": {"dtype": OFFSET_DTYPE.str, "offset": 0},
+        "columns": [
+            {"name": key, "unit": COLUMN_UNITS[key], "dtype": COLUMN_DTYPE.str, "offset": 0}
+            for key in HISTORY_KEYS
+        ],
+        "metadata": {"model": model_constants_f(atmosphere_table), **(metadata or {})},
+        "trajectory_metadata": entries,
+    }
+
+    # The header records the array offsets, which depend on its own length:
+    # grow the data start until the header fits in front of it
+    data_start = ALIGNMENT
+    while True:
+        header["offsets"]["offset"] = data_start
+        position = _aligned(data_start + offsets.nbytes)
+        for column in header["columns"]:
+            column["offset"] = position
+            position = _aligned(position + samples * COLUMN_DTYPE.itemsize)
+        header_bytes = json.dumps(json_safe_f(header), allow_nan=False).encode()
+        needed = _aligned(_PREFIX.size + len(header_bytes))
+        if needed <= data_start:
+            break
+        data_start = needed
+    header_bytes += b" " * (data_start - _PREFIX.size - len(header_bytes))
+
+    temporary_path = f"{os.fspath(path)}.tmp"
+    try:
+        with open(temporary_path, "wb") as stream:
+            stream.write(_PREFIX.pack(MAGIC, len(header_bytes)))
+            stream.write(header_bytes)
+            stream.write(offsets.tobytes())
+            for index, column in enumerate(header["columns"]):
+                stream.write(b"\0" * (column["offset"] - stream.tell()))
+                for columns, _ in split:
+                    stream.write(memoryview(np.ascontiguousarray(columns[index], dtype=COLUMN_DTYPE)))
+        os.replace(temporary_path, path)
+    except BaseException:
+        # never leave a partial temporary file behind
+        try:
+            os.remove(temporary_path)
+        except FileNotFoundError:
+            pass
+        raise
+    return samples
+
+
+def write_trajectory_f(
+    path: str | os.PathLike,
+    results,
+    inputs: dict | None = None,
+    atmosphere_table: AtmosphereTable | None = None,
+) -> int:
+    """Write one simulate_ascent_motion_f result (and its inputs) as an archive."""
+    return write_trajectories_f(path, [results], [inputs or {}], atmosphere_table=atmosphere_table)
+
+
+class TrajectoryArchive:
+    """
+    Read-only, memory-mapped view of a trajectory archive.
+
+    archive[i] returns trajectory i as {column: array}, archive.column(name)
+    the whole column across every trajectory; both are zero-copy views.
+    """
+
+    def __init__(self, path: str | os.PathLike) -> None:
+        with open(path, "rb") as stream:
+            prefix = stream.read(_PREFIX.size)
+            if len(prefix) != _PREFIX.size:
+                raise ValueError(f"{path}: not a trajectory archive")
+            magic, header_length = _PREFIX.unpack(prefix)
+            if magic != MAGIC:
+                raise ValueError(f"{path}: not a trajectory archive")
+            header = json.loads(stream.read(header_length))
+        if header.get("version") != FORMAT_VERSION:
+            raise ValueError(f"{path}: unsupported archive version {header.get('version')}")
+
+        self.path = os.fspath(path)
+        self.header = header
+        self.metadata: dict = header["metadata"]
+        self.samples: int = header["samples"]
+        self.column_names = tuple(column["name"] for column in header["columns"])
+        self.units = {column["name"]: column["unit"] for column in header["columns"]}
+
+        self._map = np.memmap(path, dtype=np.uint8, mode="r")
+        count = header["trajectories"] + 1
+        self.offsets = self._view(header["offsets"], count)
+        self._columns = {column["name"]: self._view(column, self.samples) for column in header["columns"]}
+
+    def _view(self, entry: dict, count: int) -> np.ndarray:
+        """Return count items of entry's dtype at entry's offset, as a view of the map."""
+        dtype = np.dtype(entry["dtype"])
+        start = entry["offset"]
+        return self._map[start:start + count * dtype.itemsize].view(dtype)
+
+    def __enter__(self) -> TrajectoryArchive:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Drop the archive's references to the mapping (views already handed out stay valid)."""
+        self._map = None
+        self._columns = {}
+        self.offsets = None
+
+    def __len__(self) -> int:
+        return self.header["trajectories"]
+
+    def column(self, name: str) -> np.ndarray:
+        """Return one column for every trajectory, back to back."""
+        return self._columns[name]
+
+    def __getitem__(self, index: int) -> dict[str, np.ndarray]:
+        if not -len(self) <= index < len(self):
+            raise IndexError("trajectory index out of range")
+        index %= len(self)
+        start, stop = int(self.offsets[index]), int(self.offsets[index + 1])
+        return {name: column[start:stop] for name, column in self._columns.items()}
+
+    def trajectory_metadata(self, index: int) -> dict:
+        """Return the metadata stored with trajectory index."""
+        return self.header["trajectory_metadata"][index]
+
+
+def open_trajectories_f(path: str | os.PathLike) -> TrajectoryArchive:
+    """Memory-map a trajectory archive for reading."""
+    return TrajectoryArchive(path)
@@ -8,7 +8,7 @@
 #
 # Contributors: Purdue Orbital Flight Dynamics Team
 # Date Created: Unknown
-# Last Updated: 02/09/2026
+# Last Updated: 10/18/2026
 #
 # Function Description:
 #   Computes the helium balloon volume using the helium density at altitude:
@@ -20,7 +20,8 @@
 # Input variables:
 # - altitude_m: geometric altitude, m, non-negative
 # - helium_mass_kg: helium mass, kg, non-negative
-# - atm: atmosphere dict (SI) from modules.atmosphere.atmosphere_m, must include:
+# - atm: AtmosphereState from modules.atmosphere_f.atmosphere_m(..., output="state")
+#   (a legacy atmosphere dict is also accepted), must include:
 #       - T_K (K), p_Pa (Pa)
 #
 # Output variables:
@@ -30,10 +31,11 @@
 
 from __future__ import annotations
 
+from modules.atmosphere_f import AtmosphereState
 from modules.balloon_density_f import balloon_density_f
 
 
-def volume_balloon_f(altitude_m: float, helium_mass_kg: float, *, atm: dict) -> float:
+def volume_balloon_f(altitude_m: float, helium_mass_kg: float, *, atm: AtmosphereState | dict) -> float:
     """Return balloon volume (m^3) for a given helium mass and atmosphere."""
     helium_density_kgm3 = balloon_density_f(altitude_m, atm=atm)  # [kg/m^3]
     volume_m3 = helium_mass_kg / helium_density_kgm3              # [m^3]
@@ -0,0 +1,104 @@
+########################################################################
+# Purdue Orbital, Flight Dynamics
+#
+# Project Name: Ascent/Descent Modeling
+#
+# File Name: test_march_kernels_f.py
+#
+# Contributors: Purdue Orbital Flight Dynamics Team
+# Date Created: 10/18/2026
+# Last Updated: 10/18/2026
+#
+# Description:
+#   Checks that the compiled march kernels (march_kernels_f, USE_JIT True)
+#   agree with the Python loops (USE_JIT False) to JIT_RTOL on several
+#   ascent and descent cases, and that importing the package does not
+#   import Numba. Run from the repository root: python -m pytest -q
+#
+########################################################################
+
+from __future__ import annotations
+
+import math
+import subprocess
+import sys
+
+import pytest
+
+import ascent_simulation
+import descent_simulation
+from modules import march_kernels_f
+
+pytestmark = pytest.mark.skipif(not march_kernels_f.JIT_AVAILABLE, reason="Numba is not installed")
+
+# (start_altitude, burst_altitude, helium_mass, constant_mass)
+ASCENT_CASES = [
+    (0.0, 30_000.0, 3.0, 8.8),
+    (1_500.0, 25_000.0, 2.2, 8.8),
+    (0.0, 35_000.0, 4.5, 12.0),
+    (500.0, 20_000.0, 1.5, 4.0),
+    (0.0, 30_000.0, 0.5, 8.8),      # no net lift: fails on the first step
+]
+# (start_altitude, ground_level, initial_velocity, drag_area, system_mass)
+DESCENT_CASES = [
+    (30_000.0, 0.0, 0.0, 1.0, 8.8),
+    (25_000.0, 1_500.0, 6.0, 2.5, 5.0),
+    (35_000.0, 0.0, -3.0, 0.5, 12.0),
+]
+
+
+def _assert_close(compiled, python) -> None:
+    """Compare two flat result sequences (or dicts) to JIT_RTOL."""
+    if isinstance(compiled, dict):
+        assert compiled.keys() == python.keys()
+        compiled, python = list(compiled.values()), list(python.values())
+    for jit_value, python_value in zip(compiled, python, strict=True):
+        if isinstance(python_value, bool):
+            assert jit_value == python_value
+        elif isinstance(python_value, int):
+            # a step can differ by one when it lands within round-off of
+            # the stop altitude
+            assert abs(jit_value - python_value) <= 1
+        elif math.isnan(python_value):
+            assert math.isnan(jit_value)
+        else:
+            assert jit_value == pytest.approx(python_value, rel=march_kernels_f.JIT_RTOL, abs=1e-12)
+
+
+def _both_f(monkeypatch, function, *args, **kwargs):
+    """Return function(*args, **kwargs) with the kernels on, then off."""
+    monkeypatch.setattr(march_kernels_f, "USE_JIT", True)
+    compiled = function(*args, **kwargs)
+    monkeypatch.setattr(march_kernels_f, "USE_JIT", False)
+    python = function(*args, **kwargs)
+    return compiled, python
+
+
+@pytest.mark.parametrize("start, burst, helium, payload", ASCENT_CASES)
+def test_ascent_rate_matches_python_loop(monkeypatch, start, burst, helium, payload):
+    compiled, python = _both_f(
+        monkeypatch, ascent_simulation.simulate_ascent_rate_f, start, burst, helium, constant_mass=payload,
+    )
+    _assert_close(compiled, python)
+
+
+@pytest.mark.parametrize("start, burst, helium, payload", ASCENT_CASES)
+def test_ascent_summary_matches_python_loop(monkeypatch, start, burst, helium, payload):
+    compiled, python = _both_f(
+        monkeypatch, ascent_simulation.simulate_ascent_summary_f, start, burst, helium, constant_mass=payload,
+    )
+    _assert_close(compiled, python)
+
+
+@pytest.mark.parametrize("start, ground, velocity, area, mass", DESCENT_CASES)
+def test_descent_matches_python_loop(monkeypatch, start, ground, velocity, area, mass):
+    compiled, python = _both_f(
+        monkeypatch, descent_simulation.simulate_descent_f, start, ground, velocity, area, mass,
+    )
+    _assert_close(compiled, python)
+
+
+def test_import_does_not_load_numba():
+    code = "import sys, ascent_simulation, descent_simulation; print('numba' in sys.modules)"
+    output = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout
+    assert output.strip() == "False"